@@ -0,0 +1,367 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from collections import deque
+import numpy as np
+from levels import load_level
+from platforms import triangle_wave
+from reachability import ReachabilityGraph, jump_arc
+from snapshot import capture, restore
+from world import World, LEVEL_FILES, MOVE_SPEED, KEY_LEFT, KEY_RIGHT, KEY_UP
+
+# Ticks a simulation may run before it counts as timed out (five minutes of play)
+DEFAULT_MAX_TICKS = 5 * 60 * 60
+# Simulations handed to a worker at a time; larger chunks cut messaging, smaller ones balance load
+DEFAULT_CHUNKSIZE = 8
+# How far from a platform's right edge the edge bot jumps
+EDGE_LOOKAHEAD = 20
+# Take-off points the climber tries across the platform it stands on
+TAKEOFF_POINTS = 7
+# Ticks the climber holds its direction after taking off; None holds it until landing
+STEER_TICKS = (None, 10, 25, 45)
+# Ticks the climber rises straight up before it starts steering, to clear whatever is in the way
+STEER_DELAYS = (0, 16)
+# Ticks a try may spend walking to its take-off point, then in the air, before it counts as failed
+WALK_TICKS = 300
+AIR_TICKS = 240
+# Jumps the climber gives up on from one platform before it waits for the level to move on
+PLAN_ATTEMPTS = 4
+# Ticks the climber waits where it stands when no jump on any route can be made yet
+RETRY_TICKS = 40
+# Waits in a row after which the climber stops trying the jumps it could not make, and stands still
+RETRY_LIMIT = 30
+
+# Platform records of the level being simulated, mapped once per worker process
+_level_records = None
+
+class BatchWorld(World):
+    def load_platforms(self, filename):
+        """Use the worker's memory-mapped level instead of opening the file for every simulation."""
+        return _level_records
+
+class EdgeBot:
+    def __init__(self, rng):
+        """Run right and jump near the end of each platform, with the odd random hop."""
+        self.rng = rng
+
+    def keys(self, world):
+        """Return the input bitmask for the next tick."""
+        keys = KEY_RIGHT
+        if world.is_on_platform and world.current_platform is not None:
+            right = int(world.platforms.position[world.current_platform, 0] + world.platforms.size[world.current_platform, 0])
+            if right - world.char_x < EDGE_LOOKAHEAD or self.rng.random() < 0.01:
+                keys |= KEY_UP
+        return keys
+
+class RandomBot:
+    def __init__(self, rng):
+        """Mash random keys, holding each combination for a random number of ticks."""
+        self.rng = rng
+        self.current = 0
+        self.hold = 0
+
+    def keys(self, world):
+        """Return the input bitmask for the next tick."""
+        if self.hold == 0:
+            self.current = self.rng.choice((KEY_RIGHT, KEY_RIGHT | KEY_UP, KEY_UP, KEY_LEFT, 0))
+            self.hold = self.rng.randrange(5, 60)
+        self.hold -= 1
+        return self.current
+
+class ClimberBot:
+    def __init__(self, rng):
+        """
+        Follow the reachability analyzer's route to the goal, working out each jump by trying it.
+
+        Standing on a platform, the bot tries take-off points and steering lengths on the world
+        itself, restoring a snapshot after each, then plays back the first try that lands on the
+        next platform of the route. Play is deterministic, so the played-back keys do exactly what
+        the try did. A jump no try makes, say because an obstacle is in the way, is left out and
+        the route searched again.
+        """
+        self.graph = None      # Reachability graph of the level, built on the first tick
+        self.moving = None     # Which level records move, built with the graph
+        self.plan = deque()    # Keys still to play for the jump under way
+        self.blocked = set()   # (from, to) record pairs of jumps no try made
+        self.retries = 0       # Waits since the last jump that could be made
+
+    def keys(self, world):
+        """Return the input bitmask for the next tick."""
+        if self.plan:
+            return self.plan.popleft()
+        if self.graph is None:
+            records = world.level_records
+            self.graph = ReachabilityGraph(records)
+            self.moving = (records['move'] != 0) & (records['move_distance'] > 0)
+        if not world.is_on_platform or world.current_platform is None:
+            return 0  # Falling from the spawn point, or standing between the ticks that touch the platform
+        self.plan.extend(self.plan_jump(world, int(world.platforms.record[world.current_platform])))
+        if self.plan:
+            self.retries = 0
+        else:
+            # Nothing can be made yet: wait for moving platforms to come round, then try their jumps again.
+            # Jumps between static platforms fail the same way every time, so those stay left out.
+            self.retries += 1
+            if self.retries <= RETRY_LIMIT:
+                self.blocked = {(source, target) for source, target in self.blocked
+                                if not (self.moving[source] or self.moving[target])}
+            self.plan.extend(self.wait(world) or self.escape(world))
+        # Waiting fails while a character that landed rising finishes its rise; look again next tick
+        return self.plan.popleft() if self.plan else 0
+
+    def escape(self, world):
+        """Return the keys of a jump to any platform in reach, route or not, or [] if none lands."""
+        for target in self.graph.neighbours(int(world.platforms.record[world.current_platform])).tolist():
+            keys = self.try_jumps(world, target)
+            if keys is not None:
+                return keys
+        return []
+
+    def wait(self, world):
+        """Return keys that keep the character on its platform and alive for RETRY_TICKS, or [] if none do."""
+        start = capture(world)
+        slot = world.current_platform
+        here = world.char_x - world.platforms.position[slot, 0]
+        try:
+            # Where it stands first; a moving platform may carry it into an obstacle, so then anywhere else on it
+            for offset in [here] + np.linspace(2, world.platforms.size[slot, 0] - 2, TAKEOFF_POINTS).tolist():
+                restore(world, start)
+                keys = self.walk(world, offset, RETRY_TICKS)
+                if keys is not None:
+                    return keys
+            return []
+        finally:
+            restore(world, start)
+
+    def plan_jump(self, world, here):
+        """Return the keys that take the character from record `here` to the next platform of a route, or []."""
+        for _ in range(PLAN_ATTEMPTS):
+            route = self.graph.route([here], self.blocked)
+            if route is None:
+                return []
+            target = route[1] if len(route) > 1 else self.graph.goal
+            keys = self.try_jumps(world, target) if self.in_reach(world, here, target) else None
+            if keys is not None:
+                return keys
+            self.blocked.add((here, target))
+        return []
+
+    def in_reach(self, world, here, target):
+        """
+        Check whether moving platforms put record `target` within a jump of record `here` any time soon.
+
+        The check is generous; it only saves trying every jump while a moving target is far away.
+        """
+        entry = world.platform_slots.get(target)
+        if target == self.graph.goal or entry is None or not (self.moving[here] or self.moving[target]):
+            return True
+        platforms, slots = world.platforms, np.array([world.current_platform, entry[0]])
+        arc = jump_arc()
+        # The character lands anywhere above the target's underside
+        rise = platforms.position[slots[0], 1] - platforms.position[slots[1], 1] - platforms.size[slots[1], 1]
+        first, last = arc.window(np.array([float(rise)]))
+        if first[0] > last[0]:
+            return False  # Too high to reach
+        # Take-off may come after walking the platform's length, landing up to the last tick the arc is high enough
+        ticks = world.tick + np.arange(int(platforms.size[slots[0], 0]) // MOVE_SPEED + int(last[0]) + 1)
+        x = platforms.base_x[slots] + triangle_wave(ticks[:, None], *platforms.wave_parameters(slots))[0]
+        w = platforms.size[slots, 0]
+        gap = np.maximum(x[:, 1] - (x[:, 0] + w[0]), x[:, 0] - (x[:, 1] + w[1]))
+        return bool(gap.min() <= int(last[0]) * MOVE_SPEED + 2 * world.char_radius)
+
+    def try_jumps(self, world, target):
+        """Try jumps to record `target` from the current platform, leaving the world as it was; return the first that lands."""
+        start = capture(world)
+        slot = world.current_platform
+        px, pw = int(world.platforms.position[slot, 0]), int(world.platforms.size[slot, 0])
+        record = world.level_records[target]
+        centre = int(record['x']) + int(record['w']) / 2
+        # Take-off points as distances along the platform, the end nearest the target first
+        points = sorted(np.linspace(2, pw - 2, TAKEOFF_POINTS).tolist(), key=lambda offset: abs(px + offset - centre))
+        try:
+            for point in points:
+                restore(world, start)
+                walk = self.walk(world, point, 0)
+                if walk is None:
+                    continue
+                takeoff = capture(world)
+                toward = KEY_RIGHT if centre > world.char_x else KEY_LEFT
+                for delay in STEER_DELAYS:
+                    for steer in STEER_TICKS:
+                        restore(world, takeoff)
+                        air = self.fly(world, target, toward, delay, steer)
+                        if air is not None:
+                            return walk + air
+            return None
+        finally:
+            restore(world, start)
+
+    def walk(self, world, offset, wait):
+        """
+        Walk to `offset` pixels along the current platform and stay there until `wait` ticks have passed.
+
+        Returns:
+        list: The keys used, or None if the character fell or died.
+        """
+        keys = []
+        slot, floor = world.current_platform, world.char_y
+        for _ in range(WALK_TICKS + wait):
+            if world.game_lost or abs(world.char_y - floor) > 1:
+                return None
+            # Standing still on a moving platform drifts, so the spot is kept relative to the platform
+            x = world.platforms.position[slot, 0] + offset
+            there = abs(world.char_x - x) <= 1
+            # A character that lands while still rising cannot jump again until the rise runs out
+            if there and len(keys) >= wait and world.is_on_platform and not world.is_jumping:
+                return keys
+            key = 0 if there else KEY_RIGHT if x > world.char_x else KEY_LEFT
+            keys.append(key)
+            world.step(key)
+        return None
+
+    def fly(self, world, target, toward, delay, steer):
+        """Jump, holding `toward` for `steer` ticks after `delay`; return the keys used if it lands on record `target` or wins."""
+        record = world.level_records[target]
+        bottom = int(record['y']) + int(record['h'])
+        keys = []
+        for tick in range(AIR_TICKS):
+            # Standing characters only touch their platform every other tick, so hold the jump for two
+            key = toward if delay <= tick and (steer is None or tick < delay + steer) else 0
+            if tick < 2:
+                key |= KEY_UP
+            keys.append(key)
+            world.step(key)
+            if world.game_won:
+                return keys
+            if world.game_lost or (not world.is_jumping and world.char_y - world.char_radius > bottom):
+                return None  # Dead, or falling past the target
+            if tick >= 2 and world.is_on_platform and world.current_platform is not None:
+                landed = int(world.platforms.record[world.current_platform])
+                return keys if landed == target and target != self.graph.goal else None
+        return None
+
+# Bot policies selectable by name
+POLICIES = {'climber': ClimberBot, 'edge': EdgeBot, 'random': RandomBot}
+
+def init_worker(level_file):
+    """Map the compiled level once per worker; all workers share its pages through the OS cache."""
+    global _level_records
+    _level_records = load_level(level_file)
+    sys.stdout = open(os.devnull, 'w')  # Silence per-coin score messages
+
+def simulate(task):
+    """
+    Play one seeded game with a bot until it wins, loses or runs out of ticks.
+
+    Parameters:
+    task (tuple): (level, level_file, seed, policy name, max ticks).
+
+    Returns:
+    dict: The seed, outcome, coins collected and ticks played.
+    """
+    level, level_file, seed, policy, max_ticks = task
+    world = BatchWorld(level, seed, level_file)
+    bot = POLICIES[policy](random.Random(f"bot:{seed}"))
+    ticks = 0
+    while ticks < max_ticks and not (world.game_won or world.game_lost):
+        world.step(bot.keys(world))
+        ticks += 1
+    return {'seed': seed, 'won': world.game_won, 'lost': world.game_lost, 'coins': world.score, 'ticks': ticks}
+
+class BatchStats:
+    def __init__(self):
+        """Aggregate simulation results as they arrive."""
+        self.runs = 0
+        self.wins = 0
+        self.losses = 0
+        self.coins = 0
+        self.win_ticks = []
+
+    def add(self, result):
+        """Fold one simulation result into the totals."""
+        self.runs += 1
+        self.coins += result['coins']
+        if result['won']:
+            self.wins += 1
+            self.win_ticks.append(result['ticks'])
+        elif result['lost']:
+            self.losses += 1
+
+    def summary(self):
+        """Return the aggregate as a dict of rates and averages."""
+        runs = max(self.runs, 1)
+        return {
+            'runs': self.runs,
+            'win_rate': self.wins / runs,
+            'loss_rate': self.losses / runs,
+            'timeout_rate': (self.runs - self.wins - self.losses) / runs,
+            'mean_coins': self.coins / runs,
+            'median_ticks_to_win': statistics.median(self.win_ticks) if self.win_ticks else None,
+        }
+
+def run_batch(level, seeds, policy='climber', max_ticks=DEFAULT_MAX_TICKS, processes=None, level_file=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Run seeded simulations across a process pool, yielding each result as soon as it completes.
+
+    Parameters:
+    level (str): The difficulty level name.
+    seeds (iterable): One world seed per simulation.
+    policy (str): A key of POLICIES.
+    max_ticks (int): Tick limit per simulation.
+    processes (int): Worker count; defaults to the number of CPUs.
+    level_file (str): Optional platform file to use instead of the level's own.
+    chunksize (int): Simulations sent to a worker per message.
+
+    Yields:
+    dict: Results in completion order, as returned by simulate.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}; choose from {', '.join(POLICIES)}")
+    level_file = level_file or LEVEL_FILES.get(level, LEVEL_FILES['hard'])
+    load_level(level_file)  # Compile here so workers only ever map the finished file
+    tasks = ((level, level_file, seed, policy, max_ticks) for seed in seeds)
+    with multiprocessing.Pool(processes, initializer=init_worker, initargs=(level_file,)) as pool:
+        yield from pool.imap_unordered(simulate, tasks, chunksize)
+
+def main(argv=None):
+    """Run a batch from the command line, printing running totals."""
+    parser = argparse.ArgumentParser(description="Play many seeded games with a bot and report win rate, coins and ticks.")
+    parser.add_argument('level', choices=sorted(LEVEL_FILES), help="difficulty level")
+    parser.add_argument('--runs', type=int, default=100, help="number of simulations (default: 100)")
+    parser.add_argument('--first-seed', type=int, default=0, help="seed of the first simulation; the rest follow on")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='climber',
+                        help="bot policy (default: climber); the climber tries each jump before making it, which costs "
+                             "roughly 1 s of CPU per run on easy and 10 s on hard")
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS, help="tick limit per simulation")
+    parser.add_argument('--processes', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--level-file', help="platform file to use instead of the level's own")
+    args = parser.parse_args(argv)
+
+    stats = BatchStats()
+    start = time.perf_counter()
+    report_every = max(1, args.runs // 20)
+    seeds = range(args.first_seed, args.first_seed + args.runs)
+    for result in run_batch(args.level, seeds, args.policy, args.max_ticks, args.processes, args.level_file):
+        stats.add(result)
+        if stats.runs % report_every == 0 or stats.runs == args.runs:
+            summary = stats.summary()
+            print(f"{stats.runs}/{args.runs} runs  win rate {summary['win_rate']:.1%}  "
+                  f"mean coins {summary['mean_coins']:.2f}  "
+                  f"{stats.runs / (time.perf_counter() - start):.1f} runs/s", flush=True)
+
+    summary = stats.summary()
+    print(f"Wins {summary['win_rate']:.1%}, losses {summary['loss_rate']:.1%}, timeouts {summary['timeout_rate']:.1%}")
+    print(f"Mean coins collected: {summary['mean_coins']:.2f}")
+    if summary['median_ticks_to_win'] is not None:
+        print(f"Median ticks to win: {summary['median_ticks_to_win']:.0f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,396 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from eng import build_text_geometry, get_text_geometry, render_text, render_text_with_random_colors
+from game import Game, Menu
+from gfx import RecordingBackend, set_backend
+from levels import compiled_path, load_level
+from placement import scatter
+from scores import ScoreStore, TOP_N
+from snapshot import capture, restore
+from world import World, WIDTH, HEIGHT, KEY_LEFT, KEY_RIGHT, KEY_UP
+
+# Synthetic level sizes, in platforms
+LEVEL_SIZES = {'tiny': 10, 'small': 1000, 'medium': 10000, 'large': 100000}
+# Roughly how many platforms each screen-wide stretch of a synthetic level holds
+PLATFORMS_PER_SCREEN = 40
+# Seed for synthetic levels and object placement; fixed so every run measures the same work
+BENCH_SEED = 1234
+# Simulation ticks per physics run
+PHYSICS_TICKS = 2000
+# Collision checks per collision run
+COLLISION_CHECKS = 2000
+# Frames drawn per render run
+RENDER_FRAMES = 50
+# Snapshots captured or restored per snapshot run: five seconds of rewind at 60 ticks a second
+SNAPSHOT_RUNS = 300
+# Default allowed slowdown or allocation growth against the baseline before a run fails
+REGRESSION_THRESHOLD = 0.25
+BASELINE_FILE = 'bench_baseline.json'
+# Strings rasterized by the text benchmarks, taken from the menus and HUD
+BENCH_TEXTS = ["Pixel Platformer", "Start Game", "Difficulty: Easy", "High Scores", "Exit",
+               "Score: 120", "Game Paused", "Press 'P' to Resume", "Press 'M' to Go to Menu",
+               "You Win!!", "Game Over", "FPS: 60", "P99: 16.67 MS"]
+
+class BenchWorld(World):
+    def game_over(self):
+        """Drop the character back in from the top instead of ending the run, so every tick does full physics."""
+        self.char_y = self.level_bounds[1] + self.char_radius
+        self.fall_speed = 0
+        self.is_jumping = False
+
+    def you_win(self):
+        """Keep playing past the goal."""
+
+def write_synthetic_level(filename, count, seed=BENCH_SEED):
+    """
+    Write a level CSV of `count` platforms spread over as many screens as needed.
+
+    The first platform sits under the spawn point and every fifth platform moves.
+
+    Parameters:
+    filename (str): The path of the CSV file to write.
+    count (int): The number of platforms.
+    seed (int): Seed for platform positions, sizes and colors.
+    """
+    rng = random.Random(seed)
+    spacing = WIDTH / PLATFORMS_PER_SCREEN
+    with open(filename, 'w') as file:
+        file.write("0,530,200,20,0.5,0.5,0.5,0,1,10\n")
+        for i in range(1, count):
+            x = int(i * spacing + rng.uniform(-spacing, spacing))
+            y = rng.randrange(150, HEIGHT - 150)
+            w = rng.randrange(100, 200)
+            color = (rng.random(), rng.random(), rng.random())
+            move = 1 if i % 5 == 0 else 0
+            direction = rng.choice((1, -1))
+            file.write(f"{x},{y},{w},20,{color[0]:.2f},{color[1]:.2f},{color[2]:.2f},{move},{direction},{rng.randrange(10, 100)}\n")
+
+def scripted_inputs(ticks):
+    """Return a fixed input sequence: run right while jumping, with short stretches of backing up."""
+    inputs = []
+    for tick in range(ticks):
+        phase = tick % 240
+        if phase < 180:
+            inputs.append(KEY_RIGHT | (KEY_UP if phase % 40 == 0 else 0))
+        elif phase < 200:
+            inputs.append(KEY_LEFT)
+        else:
+            inputs.append(KEY_RIGHT | KEY_UP)
+    return inputs
+
+class Benchmark:
+    def __init__(self, name, run, setup=None, repeat=5, number=1, counters=None, teardown=None):
+        """
+        A named operation to time.
+
+        Parameters:
+        name (str): The name used in reports and baselines.
+        run (callable): Called with the setup result; the only part that is timed.
+        setup (callable): Optional untimed preparation, called before every run.
+        repeat (int): The number of timed samples.
+        number (int): Runs per sample, for operations too quick to time one at a time.
+        counters (callable): Optional; called with the setup result after the last run, returns extra
+                             deterministic metrics (such as vertex counts) to report and compare.
+        teardown (callable): Optional; called with the setup result once it is done with, untimed.
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.repeat = repeat
+        self.number = number
+        self.counters = counters
+        self.teardown = teardown
+
+    def prepare(self):
+        """Return fresh input for one run."""
+        return self.setup() if self.setup else None
+
+    def release(self, state):
+        """Let go of the input of a finished run."""
+        if self.teardown:
+            self.teardown(state)
+
+    def measure(self):
+        """
+        Time the benchmark, then trace its allocations in one extra run.
+
+        Returns:
+        dict: best and median time per run in ms, peak and retained traced memory in KiB, and any counters.
+        """
+        times = []
+        # The game prints score changes; keep them out of the report and the timings
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(self.repeat):
+                state = self.prepare()
+                gc.collect()
+                start = time.perf_counter()
+                for _ in range(self.number):
+                    self.run(state)
+                times.append((time.perf_counter() - start) / self.number)
+                self.release(state)
+
+            state = self.prepare()
+            gc.collect()
+            tracemalloc.start()
+            before, _ = tracemalloc.get_traced_memory()
+            self.run(state)
+            after, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        result = {
+            'best_ms': min(times) * 1000,
+            'median_ms': statistics.median(times) * 1000,
+            'peak_kib': (peak - before) / 1024,
+            'retained_kib': (after - before) / 1024,
+        }
+        if self.counters:
+            result['counters'] = self.counters(state)
+        self.release(state)
+        return result
+
+def level_benchmarks(size, count, directory):
+    """Return the benchmarks that run against one synthetic level."""
+    filename = os.path.join(directory, f"bench_{size}.txt")
+    write_synthetic_level(filename, count)
+    load_level(filename)  # Compile once so the warm load measures the memory-mapped path
+
+    def cold_load(_):
+        os.remove(compiled_path(filename))
+        load_level(filename)
+
+    def world():
+        return BenchWorld('easy', seed=BENCH_SEED, level_file=filename)
+
+    inputs = scripted_inputs(PHYSICS_TICKS)
+
+    def physics(state):
+        for keys in inputs:
+            state.step(keys)
+
+    def collision_setup():
+        state = world()
+        # Drop the character onto platforms near the spawn so checks hit real candidates
+        rng = random.Random(BENCH_SEED)
+        slots = state.platforms.live()
+        picks = [int(slots[rng.randrange(len(slots))]) for _ in range(COLLISION_CHECKS)]
+        return state, picks
+
+    def collision(state):
+        state, picks = state
+        position = state.platforms.position
+        radius = state.char_radius
+        for slot in picks:
+            state.char_x = int(position[slot, 0]) + 10
+            state.char_y = int(position[slot, 1]) - radius + 1
+            state.fall_speed = 1
+            state.check_collision_and_update_position()
+
+    def objects(state):
+        for _ in range(10):
+            state.generate_obstacles_and_coins()
+
+    def snapshot_setup():
+        state = world()
+        for keys in inputs[:300]:
+            state.step(keys)
+        return state, capture(state)
+
+    def snapshot_capture(state):
+        state, _ = state
+        for _ in range(SNAPSHOT_RUNS):
+            capture(state)
+
+    def snapshot_restore(state):
+        state, snapshot = state
+        for _ in range(SNAPSHOT_RUNS):
+            restore(state, snapshot)
+
+    def render_setup():
+        backend = RecordingBackend()
+        set_backend(backend)
+        game = Game('easy', seed=BENCH_SEED, level_file=filename)
+        for keys in inputs[:300]:
+            game.step(keys)
+        return game, backend
+
+    def render(state):
+        game, backend = state
+        for _ in range(RENDER_FRAMES):
+            backend.begin_frame()
+            game.render(0.5)
+            backend.end_frame()
+
+    return [
+        Benchmark(f"load_level.cold[{size}]", cold_load, repeat=3, number=max(1, 1000 // count)),
+        Benchmark(f"load_level.warm[{size}]", lambda _: load_level(filename), number=100),
+        Benchmark(f"world_init[{size}]", lambda _: world(), repeat=3),
+        Benchmark(f"apply_physics[{size}]", physics, world, repeat=3),
+        Benchmark(f"check_collision[{size}]", collision, collision_setup, repeat=3),
+        Benchmark(f"generate_objects[{size}]", objects, world, repeat=3),
+        Benchmark(f"snapshot.capture[{size}]", snapshot_capture, snapshot_setup, repeat=3),
+        Benchmark(f"snapshot.restore[{size}]", snapshot_restore, snapshot_setup, repeat=3),
+        Benchmark(f"render.game[{size}]", render, render_setup, repeat=3, counters=game_counters),
+    ]
+
+def core_benchmarks(directory):
+    """Return the benchmarks that do not depend on a level, keeping any files they write in `directory`."""
+    def scatter_points(_):
+        scatter(random.Random(BENCH_SEED), 20000, 30, (0, 0, 40 * WIDTH, HEIGHT))
+
+    def text_build(_):
+        for height in (20, 30, 40):
+            for density in (1, 2, 3):
+                for text in BENCH_TEXTS:
+                    build_text_geometry(text, height, density)
+
+    def text_render(_):
+        for height in (20, 30):
+            for text in BENCH_TEXTS:
+                render_text(0, 0, height, text)
+
+    def text_random_colors(_):
+        for text in BENCH_TEXTS:
+            render_text_with_random_colors(0, 0, 80, text, density=3)
+
+    def menu_setup():
+        backend = RecordingBackend()
+        set_backend(backend)
+        # The menu shows high scores; give it a store of its own with full, made-up tables
+        scores = ScoreStore(os.path.join(directory, 'high_scores.db'), legacy_files={})
+        if not scores.entries:
+            for level in ('easy', 'hard'):
+                for rank in range(TOP_N):
+                    scores.add(level, 1000 - 50 * rank, f"player{rank}", when=0)
+        return Menu(scores), backend
+
+    def menu_render(state):
+        menu, backend = state
+        for _ in range(RENDER_FRAMES):
+            backend.begin_frame()
+            menu.render()
+            backend.end_frame()
+
+    def text_cached(_):
+        for _ in range(100):
+            for text in BENCH_TEXTS:
+                get_text_geometry(text, 30)
+
+    return [
+        Benchmark("scatter[20000]", scatter_points, repeat=3),
+        Benchmark("text_geometry.build", text_build),
+        Benchmark("text_geometry.cached", text_cached, number=10),
+        Benchmark("render_text", text_render, lambda: set_backend(RecordingBackend()), number=10),
+        Benchmark("render_text.random_colors", text_random_colors, lambda: set_backend(RecordingBackend()), number=10),
+        Benchmark("render.menu", menu_render, menu_setup, repeat=3, counters=frame_counters,
+                  teardown=lambda state: state[0].scores.close()),
+    ]
+
+def frame_counters(state):
+    """Return the draw calls, vertices and state changes of the last frame recorded by a render benchmark."""
+    frame = state[1].frames[-1]
+    return {name: frame[name] for name in ('draw_calls', 'vertices', 'state_changes')}
+
+def game_counters(state):
+    """Return the frame counters of the game render benchmark, plus how many of each entity it drew and culled."""
+    counters = frame_counters(state)
+    for kind, (drawn, culled) in state[0].cull_stats.items():
+        counters[f"{kind}_drawn"] = drawn
+        counters[f"{kind}_culled"] = culled
+    return counters
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Parameters:
+    results (dict): Benchmark name -> measurement.
+    baseline (dict): Benchmark name -> measurement from an earlier run.
+    threshold (float): The allowed relative growth, e.g. 0.25 for 25%.
+
+    Returns:
+    list: A description of every regression found.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        # Best time is the least noisy measure of cost; peak memory catches new allocations
+        if result['best_ms'] > reference['best_ms'] * (1 + threshold):
+            regressions.append(f"{name}: {reference['best_ms']:.2f} ms -> {result['best_ms']:.2f} ms")
+        # Ignore tiny absolute amounts, which are mostly interpreter noise
+        if result['peak_kib'] > max(reference['peak_kib'] * (1 + threshold), reference['peak_kib'] + 64):
+            regressions.append(f"{name}: peak {reference['peak_kib']:.0f} KiB -> {result['peak_kib']:.0f} KiB")
+        # Counters are deterministic, so any growth past the threshold is a real change
+        for counter, value in result.get('counters', {}).items():
+            before = reference.get('counters', {}).get(counter)
+            if before is not None and value > before * (1 + threshold):
+                regressions.append(f"{name}: {counter} {before} -> {value}")
+    return regressions
+
+def main(argv=None):
+    """Run the benchmarks, print a report and return the process exit code."""
+    parser = argparse.ArgumentParser(description="Benchmark the simulation, level loading, text rasterization and the render path.")
+    parser.add_argument('--sizes', default=','.join(LEVEL_SIZES), help="comma-separated level sizes to run (default: all)")
+    parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results to the baseline file instead of comparing")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help="allowed relative regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in args.sizes.split(',') if size]
+    unknown = [size for size in sizes if size not in LEVEL_SIZES]
+    if unknown:
+        parser.error(f"unknown level size(s): {', '.join(unknown)}")
+
+    directory = tempfile.mkdtemp(prefix='pixel_bench_')
+    results = {}
+    try:
+        benchmarks = core_benchmarks(directory)
+        for size in sizes:
+            benchmarks += level_benchmarks(size, LEVEL_SIZES[size], directory)
+        print(f"{'benchmark':32} {'best ms':>10} {'median ms':>10} {'peak KiB':>10} {'kept KiB':>10}")
+        for benchmark in benchmarks:
+            if args.filter not in benchmark.name:
+                continue
+            result = benchmark.measure()
+            results[benchmark.name] = result
+            counters = ' '.join(f"{counter}={value}" for counter, value in result.get('counters', {}).items())
+            print(f"{benchmark.name:32} {result['best_ms']:10.2f} {result['median_ms']:10.2f} "
+                  f"{result['peak_kib']:10.0f} {result['retained_kib']:10.0f}  {counters}".rstrip())
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
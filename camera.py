@@ -0,0 +1,34 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+from gfx import get_backend
+
+class Camera:
+    def __init__(self, width, height):
+        """Initialize a camera showing a `width` x `height` view with its top-left corner at the origin."""
+        self.width = width
+        self.height = height
+        self.x = 0
+        self.y = 0
+
+    def follow(self, target_x, target_y, bounds):
+        """Center the view on a target, clamped so it never shows anything outside the level bounds."""
+        left, top, right, bottom = bounds
+        self.x = min(max(target_x - self.width / 2, left), max(left, right - self.width))
+        self.y = min(max(target_y - self.height / 2, top), max(top, bottom - self.height))
+
+    def view_rect(self):
+        """Return the visible world rectangle as (x, y, width, height)."""
+        return self.x, self.y, self.width, self.height
+
+    def apply(self):
+        """Project world coordinates through the camera."""
+        set_projection(self.x, self.y, self.width, self.height)
+
+    def apply_screen(self):
+        """Project screen coordinates, for HUD drawing."""
+        set_projection(0, 0, self.width, self.height)
+
+def set_projection(x, y, width, height):
+    """Load a top-left-origin orthographic projection of the given rectangle."""
+    get_backend().set_projection(x, y, width, height)
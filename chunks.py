@@ -0,0 +1,68 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import numpy as np
+
+# Levels are split into vertical strips this wide; the world keeps only the strips around the player
+CHUNK_WIDTH = 1920
+# Platforms this close to a chunk edge also count as part of the neighbouring chunk
+CHUNK_MARGIN = 32
+# Chunks kept loaded behind and ahead of the player's chunk
+CHUNKS_BEHIND = 1
+CHUNKS_AHEAD = 2
+
+class LevelChunks:
+    def __init__(self, records, min_width=0, min_height=0, chunk_width=CHUNK_WIDTH):
+        """
+        Index a level's platform records by the chunks they can touch.
+
+        Parameters:
+        records (numpy.ndarray): A levels.PLATFORM_RECORD array, typically memory-mapped.
+        min_width (int): Smallest level width; levels narrower than the screen still fill it.
+        min_height (int): Smallest level height.
+        chunk_width (int): Width of a chunk in pixels.
+        """
+        self.records = records
+        self.chunk_width = chunk_width
+        x = np.asarray(records['x'], dtype=np.int64)
+        y = np.asarray(records['y'], dtype=np.int64)
+        reach = np.where(records['move'] != 0, np.abs(np.asarray(records['move_distance'], dtype=np.int64)) + 1, 0)
+        left = x - reach
+        right = x + records['w'] + reach
+
+        # Level bounds as (left, top, right, bottom) of the platforms at rest, never smaller than the minimum size from the origin
+        if len(records):
+            self.bounds = (min(0, int(x.min())), min(0, int(y.min())),
+                           max(min_width, int((x + records['w']).max())), max(min_height, int((y + records['h']).max())))
+        else:
+            self.bounds = (0, 0, min_width, min_height)
+        self.first = self.bounds[0] // chunk_width
+        self.last = max(self.first, -(-self.bounds[2] // chunk_width) - 1)
+
+        # CSR-style index: chunk c owns record indices index[offsets[c - first]:offsets[c - first + 1]]
+        first_chunk = np.clip((left - CHUNK_MARGIN) // chunk_width, self.first, self.last)
+        last_chunk = np.clip((right + CHUNK_MARGIN) // chunk_width, self.first, self.last)
+        spans = last_chunk - first_chunk + 1
+        owners = np.repeat(np.arange(len(records)), spans)
+        chunk_of = np.repeat(first_chunk - self.first, spans) + (np.arange(len(owners)) - np.repeat(np.cumsum(spans) - spans, spans))
+        order = np.lexsort((owners, chunk_of))
+        self.index = owners[order]
+        self.offsets = np.searchsorted(chunk_of[order], np.arange(self.last - self.first + 2))
+
+    def chunk_at(self, x):
+        """Return the chunk containing x, clamped to the level."""
+        return min(max(int(x // self.chunk_width), self.first), self.last)
+
+    def window(self, x):
+        """Return the chunks that should be loaded while the player is at x."""
+        chunk = self.chunk_at(x)
+        return range(max(self.first, chunk - CHUNKS_BEHIND), min(self.last, chunk + CHUNKS_AHEAD) + 1)
+
+    def records_in(self, chunk):
+        """Return the indices of the records touching a chunk, in file order."""
+        start, end = self.offsets[chunk - self.first], self.offsets[chunk - self.first + 1]
+        return self.index[start:end]
+
+    def x_range(self, chunk):
+        """Return the left and right edges of a chunk."""
+        return chunk * self.chunk_width, (chunk + 1) * self.chunk_width
@@ -1,8 +1,13 @@
 # 1. Anika Tabassum (Roll: 61)
 # 2. Bholanath Das Niloy (Roll: 22)
 # Please Read the README.md/README.pdf file for more details 
-from OpenGL.GL import *
-import random
+from collections import OrderedDict
+import time
+import numpy as np
+from gfx import get_backend
+
+# Number of distinct (text, height, density) strings whose geometry is kept
+TEXT_CACHE_SIZE = 256
 
 # Define a bitmap font for rendering text
 font = {
@@ -400,6 +405,91 @@ def get_char_bitmap(char):
 
 rev = False
 
+_glyph_pixels = {}
+_text_cache = OrderedDict()
+_color_rng = np.random.default_rng()
+_color_cache = OrderedDict()
+
+def get_glyph_pixels(char):
+    """
+    Get the lit pixels of a character as an array of (col, row) pairs.
+
+    Parameters:
+    char (str): The character to look up.
+
+    Returns:
+    numpy.ndarray: An (n, 2) array of the lit pixel coordinates.
+    """
+    pixels = _glyph_pixels.get(char)
+    if pixels is None:
+        bitmap = get_char_bitmap(char)
+        pixels = np.array([(col, row) for row in range(7) for col in range(5) if bitmap[row] & (1 << (4 - col))], dtype=np.float32).reshape(-1, 2)
+        _glyph_pixels[char] = pixels
+    return pixels
+
+def build_text_geometry(text, height, density=1):
+    """
+    Rasterize text into point positions relative to the text origin.
+
+    Parameters:
+    text (str): The text to rasterize.
+    height (float): The height of the text.
+    density (int): The number of points per pixel along each axis.
+
+    Returns:
+    numpy.ndarray: An (n, 2) float32 array of point positions.
+    """
+    scale = height / 7  # Scale the text height
+    step = scale / density
+    sub = np.array([(dx, dy) for dy in range(density) for dx in range(density)], dtype=np.float32)
+    parts = []
+    for i, char in enumerate(text):
+        pixels = get_glyph_pixels(char)
+        if not len(pixels):
+            continue
+        # Every lit pixel becomes a density x density block of points
+        points = (pixels[:, None, :] * density + sub[None, :, :]).reshape(-1, 2) * step
+        points[:, 0] += i * 6 * scale  # Move to the character position
+        parts.append(points)
+    if not parts:
+        return np.zeros((0, 2), dtype=np.float32)
+    return np.concatenate(parts).astype(np.float32)
+
+def get_text_geometry(text, height, density=1):
+    """
+    Get cached text geometry, building it on a miss and evicting the least recently used entry when full.
+
+    Parameters:
+    text (str): The text to rasterize.
+    height (float): The height of the text.
+    density (int): The number of points per pixel along each axis.
+
+    Returns:
+    numpy.ndarray: An (n, 2) float32 array of point positions.
+    """
+    key = (text, height, density)
+    vertices = _text_cache.get(key)
+    if vertices is None:
+        vertices = build_text_geometry(text, height, density)
+        _text_cache[key] = vertices
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return vertices
+
+def draw_points(x, y, vertices, colors=None):
+    """
+    Draw prebuilt point geometry at an offset in a single call.
+
+    Parameters:
+    x (float): The x-coordinate of the origin.
+    y (float): The y-coordinate of the origin.
+    vertices (numpy.ndarray): An (n, 2) float32 array of point positions.
+    colors (numpy.ndarray): Optional (n, 3) uint8 array of per-point colors.
+    """
+    get_backend().draw_arrays('points', vertices, colors, offset=(x, y))
+
 def render_text(x, y, height, text):
     """
     Render text at a specified position with a specified height.
@@ -410,23 +500,10 @@ def render_text(x, y, height, text):
     height (float): The height of the text.
     text (str): The text to render.
     """
-    glColor3ub(255, 255, 255)
-    glPointSize(3)
-    glBegin(GL_POINTS)
-    
-    scale = height / 7  # Scale the text height
-    start_x = x
-    
-    for char in text:
-        bitmap = get_char_bitmap(char)
-        for row in range(7):
-            bits = bitmap[row]
-            for col in range(5):
-                if bits & (1 << (4 - col)):
-                    glVertex2f(x + col * scale, y + row * scale)
-        x += 6 * scale  # Move to the next character position
-
-    glEnd()
+    backend = get_backend()
+    backend.set_color(1.0, 1.0, 1.0)
+    backend.set_point_size(3)
+    draw_points(x, y, get_text_geometry(text, height))
     
 def render_text_with_density(x, y, height, text, density=2):
     """
@@ -439,36 +516,38 @@ def render_text_with_density(x, y, height, text, density=2):
     text (str): The text to render.
     density (int): The density of the text rendering.
     """
-    glColor3ub(255, 255, 255)  # Set the fixed color to white
-    glPointSize(2)
-    glBegin(GL_POINTS)
-    
-    scale = height / 7  # Scale the text height
-    start_x = x
-    
-    for char in text:
-        bitmap = get_char_bitmap(char)
-        for row in range(7):
-            bits = bitmap[row]
-            for col in range(5):
-                if bits & (1 << (4 - col)):
-                    for dy in range(density):
-                        for dx in range(density):
-                            glVertex2f(x + (col * density + dx) * (scale / density), y + (row * density + dy) * (scale / density))
-        x += 6 * scale  # Move to the next character position
-
-    glEnd()
+    backend = get_backend()
+    backend.set_color(1.0, 1.0, 1.0)  # Set the fixed color to white
+    backend.set_point_size(2)
+    draw_points(x, y, get_text_geometry(text, height, density))
 
-def get_random_color():
+def get_random_colors(key, count, color_hz=None):
     """
-    Generate a random color.
+    Generate random colors for a string in one shot, optionally holding them for 1 / color_hz seconds.
+
+    Parameters:
+    key (tuple): The (text, height, density) key of the string being colored.
+    count (int): The number of colors needed.
+    color_hz (float): Maximum color changes per second, or None to change every call.
 
     Returns:
-    tuple: A tuple containing three integers representing an RGB color.
+    numpy.ndarray: An (count, 3) uint8 array of RGB colors.
     """
-    return (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+    if color_hz is None:
+        return _color_rng.integers(0, 256, (count, 3), dtype=np.uint8)
+    now = time.perf_counter()
+    cached = _color_cache.get(key)
+    if cached is not None and now - cached[0] < 1.0 / color_hz:
+        _color_cache.move_to_end(key)
+        return cached[1]
+    colors = _color_rng.integers(0, 256, (count, 3), dtype=np.uint8)
+    _color_cache[key] = (now, colors)
+    _color_cache.move_to_end(key)
+    if len(_color_cache) > TEXT_CACHE_SIZE:
+        _color_cache.popitem(last=False)
+    return colors
 
-def render_text_with_random_colors(x, y, height, text, density=3):
+def render_text_with_random_colors(x, y, height, text, density=3, color_hz=None):
     """
     Render text with random colors for each pixel.
 
@@ -478,24 +557,9 @@ def render_text_with_random_colors(x, y, height, text, density=3):
     height (float): The height of the text.
     text (str): The text to render.
     density (int): The density of the text rendering.
+    color_hz (float): Maximum color changes per second, or None to change every frame.
     """
-    glPointSize(2)
-    glBegin(GL_POINTS)
-    
-    scale = height / 7  # Scale the text height
-    start_x = x
-    
-    for char in text:
-        bitmap = get_char_bitmap(char)
-        for row in range(7):
-            bits = bitmap[row]
-            for col in range(5):
-                if bits & (1 << (4 - col)):
-                    for dy in range(density):
-                        for dx in range(density):
-                            r, g, b = get_random_color()
-                            glColor3ub(r, g, b)
-                            glVertex2f(x + (col * density + dx) * (scale / density), y + (row * density + dy) * (scale / density))
-        x += 6 * scale  # Move to the next character position
-
-    glEnd()
\ No newline at end of file
+    get_backend().set_point_size(2)
+    vertices = get_text_geometry(text, height, density)
+    colors = get_random_colors((text, height, density), len(vertices), color_hz)
+    draw_points(x, y, vertices, colors)
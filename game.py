@@ -1,18 +1,46 @@
 # 1. Anika Tabassum (Roll: 61)
 # 2. Bholanath Das Niloy (Roll: 22)
 # Please Read the README.md/README.pdf file for more details 
+import argparse
+import os
 import glfw
-from OpenGL.GL import *
-from math import cos, sin
-import random
+import numpy as np
+from camera import Camera, set_projection
+from gfx import get_backend
+from generator import ENDLESS_LEVEL, ProceduralWorld
+from inputs import InputQueue, LatencyStats
+from pacing import PACING_MODES, FramePacer
+from profiler import FrameProfiler
 from eng import render_text, render_text_with_random_colors, render_text_with_density
-
-# Constants for window dimensions and high scores
-WIDTH, HEIGHT = 1920, 1080
-TITLE_BAR_HEIGHT = 50
-HIGH_SCORES_FILE = 'high_scores.txt'
+from renderer import BatchRenderer
+from replay import InputRecorder, Playback, Recording, open_world, state_digest
+from scores import ScoreStore
+from snapshot import SnapshotRing
+from world import World, WIDTH, HEIGHT, TITLE_BAR_HEIGHT, KEY_LEFT, KEY_RIGHT, KEY_UP, KEY_RESTART, PHYSICS_DT
+
+# Constants for high scores; the store keeps its journal next to the file
+HIGH_SCORES_FILE = 'high_scores.db'
 MAX_HIGH_SCORES = 5
 
+# Most physics ticks run in one frame before the loop gives up catching up
+MAX_PHYSICS_STEPS = 5
+
+# Screens that only change on input; they are redrawn on demand instead of every frame
+STATIC_SCREENS = ('menu', 'paused')
+# How often the menu title changes color, and how long static screens wait for events otherwise
+TITLE_COLOR_HZ = 8
+IDLE_WAIT_TIMEOUT = 0.5
+
+# Extra world-space border around the view that is still drawn, so nothing pops in at the edges
+CULL_MARGIN = 64
+
+# Where F4 writes the profiler's per-frame timings, and how often the overlay text refreshes
+PROFILE_CSV_FILE = 'frame_times.csv'
+OVERLAY_REFRESH = 0.25
+
+# Map GLFW keys onto the simulation's input bits
+GLFW_KEY_MAP = {glfw.KEY_LEFT: KEY_LEFT, glfw.KEY_RIGHT: KEY_RIGHT, glfw.KEY_UP: KEY_UP}
+
 class Button:
     def __init__(self, x, y, width, height, label):
         """Initialize a button with position, size, and label."""
@@ -29,179 +57,42 @@ class Button:
     
     def draw(self):
         """Render the button based on its state."""
+        backend = get_backend()
         if self.state == 'normal':
-            glColor3f(0.5, 0.5, 0.5)  # Gray color for normal state
+            backend.set_color(0.5, 0.5, 0.5)  # Gray color for normal state
         elif self.state == 'hovered':
-            glColor3f(0.7, 0.7, 0.7)  # Light gray for hovered state
+            backend.set_color(0.7, 0.7, 0.7)  # Light gray for hovered state
         elif self.state == 'clicked':
-            glColor3f(0.3, 0.3, 0.3)  # Dark gray for clicked state
+            backend.set_color(0.3, 0.3, 0.3)  # Dark gray for clicked state
         
         # Draw the button as a rectangle
-        glBegin(GL_QUADS)
-        glVertex2f(self.x, self.y)
-        glVertex2f(self.x + self.width, self.y)
-        glVertex2f(self.x + self.width, self.y + self.height)
-        glVertex2f(self.x, self.y + self.height)
-        glEnd()
+        backend.draw_arrays('quads', np.array([(self.x, self.y), (self.x + self.width, self.y),
+                                               (self.x + self.width, self.y + self.height), (self.x, self.y + self.height)], dtype=np.float32))
 
         # Render the button label
-        glColor3f(1.0, 1.0, 1.0)  # White color for text
         render_text(self.x + 10, self.y + 10, self.height - 20, self.label)
 
-class Game:
-    def __init__(self, level):
-        """Initialize the game with the specified difficulty level."""
-        self.level = level
-        self.char_radius = 15
-        self.char_x = 30
-        self.char_y = (HEIGHT - TITLE_BAR_HEIGHT) // 2 - self.char_radius
-        self.move_speed = 2
-        self.is_jumping = False
-        self.jump_velocity = 5
-        self.gravity = 0.1
-        self.fall_speed = 0
-        self.max_fall_speed = 10
-        self.is_on_platform = False
-        self.current_platform = None
-        self.platform_velocity = 0
-        self.key_state = {glfw.KEY_LEFT: False, glfw.KEY_RIGHT: False, glfw.KEY_UP: False}
-        self.score = 0
-        self.game_won = False
-        self.game_lost = False
-
-        # Load platforms based on difficulty level
-        if self.level == 'easy':
-            self.platforms = self.load_platforms('platforms_level1.txt')
-        else:
-            self.platforms = self.load_platforms('platforms_level2.txt')
-        
-        self.obstacles = []
-        self.coins = []
-        self.generate_obstacles_and_coins()
-
-    def load_platforms(self, filename):
-        """Load platform data from a file."""
-        platforms = []
-        with open(filename, 'r') as file:
-            for line in file:
-                parts = line.strip().split(',')
-                x, y, w, h = map(int, parts[:4])
-                color = tuple(map(float, parts[4:7]))
-                move = bool(int(parts[7])) if len(parts) > 7 else False 
-                direction = int(parts[8]) if len(parts) > 8 else 1 
-                move_distance = int(parts[9]) if len(parts) > 9 else 10 
-                platforms.append({'position': [x, y], 'size': (w, h), 'color': color, 'direction': direction, 'move_offset': 0, 'move': move, 'move_distance': move_distance, 'velocity': 0})
-        return platforms
-
-    def update_platform_positions(self):
-        """Update the positions of moving platforms."""
-        for platform in self.platforms:
-            if platform['move']: 
-                px, py = platform['position']
-                direction = platform['direction']
-                move_offset = platform['move_offset']
-                move_distance = platform['move_distance']
-
-                if direction == 1:  # Move right
-                    px += 1
-                    move_offset += 1
-                    platform['velocity'] = 1
-                    if move_offset >= move_distance:
-                        platform['direction'] = -1
-                else:  # Move left
-                    px -= 1
-                    move_offset -= 1
-                    platform['velocity'] = -1
-                    if move_offset <= -move_distance:
-                        platform['direction'] = 1
-
-                platform['position'] = [px, py]
-                platform['move_offset'] = move_offset
-            else:
-                platform['velocity'] = 0
-
-    def is_overlapping(self, x, y, size, objects):
-        """Check if a point is overlapping with any object."""
-        for obj in objects:
-            ox, oy = obj['position']
-            osize = obj['size']
-            if (ox - x) ** 2 + (ox - y) ** 2 < 30 ** 2:
-                return True
-        return False
-
-    def is_overlapping_platforms(self, x, y, size):
-        """Check if a point is overlapping with any platform."""
-        for platform in self.platforms:
-            px, py = platform['position']
-            pw, ph = platform['size']
-            if (px - size <= x <= px + pw + size) and (py - size <= y <= py + ph + size):
-                return True
-        return False
-
-    def generate_obstacles_and_coins(self):
-        """Generate obstacles and coins for the game."""
-        self.obstacles = self.generate_objects(5, 20, (1.0, 0.0, 0.0), [])
-        self.coins = self.generate_objects(10, 10, (1.0, 1.0, 0.0), self.obstacles)
-
-    def generate_objects(self, count, size, color, other_objects):
-        """Generate objects (obstacles or coins) avoiding overlap."""
-        objects = []
-        for _ in range(count):
-            while True:
-                x = random.randint(100, WIDTH - size)
-                y = random.randint(0, HEIGHT - size - 100)
-                if 0 <= x <= 35 and -HEIGHT // 2 <= y <= -HEIGHT:
-                    continue
-                if not self.is_overlapping(x, y, size, objects) and not self.is_overlapping(x, y, size, other_objects) and not self.is_overlapping_platforms(x, y, size):
-                    objects.append({'position': (x, y), 'size': size, 'color': color})
-                    break
-        return objects
-
-    def reset_game(self):
-        """Reset the game to its initial state."""
-        self.char_x = 30
-        self.char_y = (HEIGHT - TITLE_BAR_HEIGHT) // 2 - self.char_radius
-        self.is_jumping = False
-        self.jump_velocity = 5
-        self.fall_speed = 0
-        self.is_on_platform = False
-        self.current_platform = None
-        self.platform_velocity = 0
-        self.score = 0
-        self.game_won = False
-        self.game_lost = False
-        self.generate_obstacles_and_coins()
-
-    def game_over(self):
-        """Handle game over condition."""
-        if self.game_won or self.game_lost:
-            return
-        print("Game Over")
-        self.game_lost = True
-
-    def you_win(self):
-        """Handle winning the game."""
-        if self.game_won or self.game_lost:
-            return
-        print("You Win!!")
-        self.game_won = True
-        app.menu.save_high_score(self.score, self.level)
+class Game(World):
+    def __init__(self, level, seed=None, level_file=None):
+        """Initialize the game, its batched renderer and camera."""
+        super().__init__(level, seed, level_file)
+        self.renderer = BatchRenderer()
+        self.camera = Camera(WIDTH, HEIGHT)
+        self.cull_stats = {}  # Entity kind -> (drawn, culled) for the last frame
+        self.inputs = InputQueue()  # Timestamped key events, applied at the next tick
+        self.rewinding = False      # Backspace is held: ticks step back through recent snapshots
 
     def key_input(self, window, key, scancode, action, mods):
         """Handle keyboard input."""
         if action == glfw.PRESS:
-            if key in self.key_state:
-                self.key_state[key] = True
-            if key == glfw.KEY_UP and self.is_on_platform and not self.is_jumping:
-                self.is_jumping = True
-                self.jump_velocity = 5
-                self.is_on_platform = False
-                self.platform_velocity = self.current_platform['velocity'] if self.current_platform else 0
-                self.current_platform = None
+            if key in GLFW_KEY_MAP:
+                self.inputs.press(GLFW_KEY_MAP[key])
             if key == glfw.KEY_ESCAPE:
                 glfw.set_window_should_close(window, True)
             if key == glfw.KEY_R:
-                self.reset_game()
+                self.request_restart()
+            if key == glfw.KEY_BACKSPACE:
+                self.rewinding = True
             if key == glfw.KEY_M:
                 app.current_screen = 'menu' 
             if key == glfw.KEY_P:
@@ -211,157 +102,54 @@ class Game:
                     app.current_screen = 'game'
 
         if action == glfw.RELEASE:
-            if key in self.key_state:
-                self.key_state[key] = False
-
-    def check_collision_and_update_position(self):
-        """Check for collisions and update character's position."""
-        if self.game_lost or self.game_won:
-            return
-
-        self.is_on_platform = False
-
-        goal_x, goal_y = self.platforms[-1]['position']
-        goal_w, goal_h = self.platforms[-1]['size']
-
-        circle_bottom = self.char_y + self.char_radius
-        circle_top = self.char_y - self.char_radius
-        circle_left = self.char_x - self.char_radius
-        circle_right = self.char_x + self.char_radius
-
-        if goal_x <= circle_right <= goal_x + goal_w and (goal_y <= circle_bottom <= goal_y + goal_h or goal_y <= circle_top <= goal_y + goal_h):
-            self.you_win()
-
-        for platform in self.platforms:
-            px, py = platform['position']
-            pw, ph = platform['size']
-
-            platform_top = py
-            platform_bottom = py + ph
-            platform_left = px
-            platform_right = px + pw
-
-            if platform_left < self.char_x < platform_right:
-                if platform_top < circle_top < platform_bottom:
-                    self.char_y = platform_bottom + self.char_radius
-                    self.fall_speed = 0
-                    self.jump_velocity = 0
-                    break
-
-                if platform_top < circle_bottom < platform_bottom:
-                    self.char_y = platform_top - self.char_radius
-                    self.is_on_platform = True
-                    self.current_platform = platform
-                    self.fall_speed = 0
-                    self.jump_velocity = 0
-                    break
-
-            if platform_top < self.char_y < platform_bottom:
-                if platform_left < circle_left < platform_right:
-                    self.char_x = platform_right + self.char_radius
-                    break
-                if platform_left < circle_right < platform_right:
-                    self.char_x = platform_left - self.char_radius
-                    break
-
-        for obstacle in self.obstacles:
-            ox, oy = obstacle['position']
-            size = obstacle['size']
-
-            if (ox - self.char_x) ** 2 + (oy - self.char_y) ** 2 <= (size + self.char_radius) ** 2:
-                self.game_over()
-                return
-
-        for coin in self.coins[:]:
-            cx, cy = coin['position']
-            size = coin['size']
-
-            if (cx - self.char_x) ** 2 + (cy - self.char_y) ** 2 <= (size + self.char_radius) ** 2:
-                self.coins.remove(coin)
-                self.score += 1
-                print(f"Score: {self.score}")
-
-    def apply_physics(self):
-        """Apply game physics including movement, jumping, and gravity."""
-        if self.key_state[glfw.KEY_LEFT]:
-            self.char_x -= self.move_speed
-        if self.key_state[glfw.KEY_RIGHT]:
-            self.char_x += self.move_speed
-
-        if self.key_state[glfw.KEY_UP] and self.is_on_platform and not self.is_jumping:
-            self.is_jumping = True
-            self.jump_velocity = 5
-            self.is_on_platform = False
-            self.platform_velocity = self.current_platform['velocity'] if self.current_platform else 0
-            self.current_platform = None
-
-        if self.is_jumping:
-            self.char_y -= self.jump_velocity
-            self.jump_velocity -= self.gravity
-            if self.jump_velocity <= 0:
-                self.is_jumping = False
-                self.fall_speed = 0
-        else:
-            if not self.is_on_platform:
-                self.fall_speed += self.gravity
-                if self.fall_speed > self.max_fall_speed:
-                    self.fall_speed = self.max_fall_speed
-                self.char_y += self.fall_speed
-
-        if self.is_on_platform and self.current_platform and self.current_platform['velocity'] != 0:
-            self.char_x += 2 * self.current_platform['velocity']
-
-        self.check_collision_and_update_position()
-        self.update_platform_positions()
+            if key in GLFW_KEY_MAP:
+                self.inputs.release(GLFW_KEY_MAP[key])
+            if key == glfw.KEY_BACKSPACE:
+                self.rewinding = False
+
+    def request_restart(self):
+        """Restart the level at the start of the next tick."""
+        self.inputs.tap(KEY_RESTART)
+
+    def take_input(self):
+        """Return the KEY_* bitmask for the next tick: the keys held now plus any pressed since the last tick."""
+        return self.inputs.take()
+
+    def render(self, alpha=1.0):
+        """Render the game screen, blending `alpha` of the way from the previous tick to the current one."""
+        get_backend().clear(0.1, 0.1, 0.1)
+        char_x = self.prev_char_x + (self.char_x - self.prev_char_x) * alpha
+        char_y = self.prev_char_y + (self.char_y - self.prev_char_y) * alpha
+        self.camera.follow(char_x, char_y, self.level_bounds)
+        self.camera.apply()
+
+        view_x, view_y, view_w, view_h = self.camera.view_rect()
+        visible_platforms, visible_obstacles, visible_coins = self.visible_entities(
+            view_x - CULL_MARGIN, view_y - CULL_MARGIN, view_w + 2 * CULL_MARGIN, view_h + 2 * CULL_MARGIN)
+        self.cull_stats = {
+            'platforms': (len(visible_platforms), len(self.platforms) - len(visible_platforms)),
+            'obstacles': (len(visible_obstacles), len(self.obstacles) - len(visible_obstacles)),
+            'coins': (len(visible_coins), len(self.coins) - len(visible_coins)),
+        }
 
-        if self.char_y - self.char_radius > HEIGHT:
-            self.game_over()
-        
-    def draw_circle(self, cx, cy, radius, color, segments=32):
-        """Draw a circle using OpenGL."""
-        theta = 2 * 3.14159 / segments
-        glColor3f(*color)
-        glBegin(GL_POLYGON)
-        for i in range(segments):
-            x = radius * cos(i * theta)
-            y = radius * sin(i * theta)
-            glVertex2f(x + cx, y + cy)
-        glEnd()
-
-    def draw_platform(self, x, y, width, height, color):
-        """Draw a platform using OpenGL."""
-        glBegin(GL_QUADS)
-        glColor3f(*color)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
+        platforms = self.platforms
+        # Platforms move 'velocity' pixels per tick, so step back by the part of the tick not yet shown
+        positions = platforms.position[visible_platforms].astype(np.float32)
+        positions[:, 0] -= platforms.velocity[visible_platforms] * (1 - alpha)
+        self.renderer.add_rects(positions, platforms.size[visible_platforms], platforms.color[visible_platforms])
 
-    def render(self):
-        """Render the game screen."""
-        glClear(GL_COLOR_BUFFER_BIT)
-        glClearColor(0.1, 0.1, 0.1, 1)
-        self.draw_circle(self.char_x, self.char_y, self.char_radius, (0, 1, 0))
-        for platform in self.platforms:
-            x, y = platform['position']
-            width, height = platform['size']
-            color = platform['color']
-            self.draw_platform(x, y, width, height, color)
-        for obstacle in self.obstacles:
-            x, y = obstacle['position']
-            size = obstacle['size']
-            color = obstacle['color']
-            self.draw_circle(x, y, size, color)
-        for coin in self.coins:
-            x, y = coin['position']
-            size = coin['size']
-            color = coin['color']
-            self.draw_circle(x, y, size, color)
+        self.renderer.add_circles([(char_x, char_y)], [self.char_radius], [(0, 1, 0)])
+        for pool, visible in ((self.obstacles, visible_obstacles), (self.coins, visible_coins)):
+            self.renderer.add_circles(pool.position[visible], np.full(len(visible), pool.size), np.tile(pool.color, (len(visible), 1)))
+        self.renderer.flush()
+        self.camera.apply_screen()
 
         render_text(10, 20, 20, f"Score: {self.score}")
         render_text(10, HEIGHT - 60, 20, "Press 'M' to go back to Menu")
         render_text(10, HEIGHT - 90, 20, "Press 'P' to Pause/Resume")
+        render_text(10, HEIGHT - 120, 20, "Hold Backspace to Rewind")
+        if self.rewinding:
+            render_text(10, 50, 20, "Rewinding")
 
         if self.game_won:
             render_text_with_random_colors(WIDTH // 2 - 100, HEIGHT // 2, 80, "You Win!", density=3)
@@ -371,67 +159,67 @@ class Game:
         if self.game_won or self.game_lost:
             render_text_with_density(WIDTH // 2 - 150, HEIGHT // 2 + 100, 40, "Press R to Restart", density=2)
 
+    def overlay_lines(self):
+        """Return the lines of text the performance overlay shows for this game: what the last frame drew and culled."""
+        return [f"{kind.title()}: {drawn} drawn {culled} culled" for kind, (drawn, culled) in self.cull_stats.items()]
+
+    def summary_lines(self):
+        """Return the lines reported when this game is closed."""
+        return []
+
+class EndlessGame(ProceduralWorld, Game):
+    """A game on the endless generated course, streamed in from a background worker."""
+
+    def overlay_lines(self):
+        """Add chunk streaming stalls to the game's overlay lines."""
+        return super().overlay_lines() + self.chunks.overlay_lines()
+
+    def summary_lines(self):
+        """Report chunk generation times and any stalls waiting for it."""
+        return super().summary_lines() + [self.chunks.summary()]
+
 class Menu:
-    def __init__(self):
-        """Initialize the game menu and load high scores."""
-        self.high_scores_easy = self.load_high_scores('high_scores_easy.txt')
-        self.high_scores_hard = self.load_high_scores('high_scores_hard.txt')
+    def __init__(self, scores, player=''):
+        """Initialize the game menu, showing high scores from `scores` and saving wins under `player`."""
+        self.scores = scores
+        self.player = player
         self.selected_level = None
+        self.dirty = True  # Set when something shown on the menu changes
         button_width, button_height = 270, 50
         self.buttons = {
+            'endless': Button(WIDTH // 2 - button_width // 2 - 40, HEIGHT // 2 - 150, button_width, button_height, "Endless"),
             'easy': Button(WIDTH // 2 - button_width // 2 + 280, HEIGHT // 2 - 150, button_width, button_height, "Easy Level"),
             'hard': Button(WIDTH // 2 - button_width // 2 + 600, HEIGHT // 2 - 150, button_width, button_height, "Hard Level"),
         }
 
-    def load_high_scores(self, filename):
-        """Load high scores from a file."""
-        try:
-            with open(filename, 'r') as file:
-                scores = [int(line.strip()) for line in file.readlines()]
-            scores.sort(reverse=True)
-            return scores[:MAX_HIGH_SCORES]
-        except FileNotFoundError:
-            return []
-
     def save_high_score(self, score, level):
-        """Save a high score for the specified level."""
-        if level == 'easy':
-            self.high_scores_easy.append(score)
-            self.high_scores_easy.sort(reverse=True)
-            self.high_scores_easy = self.high_scores_easy[:MAX_HIGH_SCORES]
-            self.save_scores_to_file(self.high_scores_easy, 'high_scores_easy.txt')
-        else:
-            self.high_scores_hard.append(score)
-            self.high_scores_hard.sort(reverse=True)
-            self.high_scores_hard = self.high_scores_hard[:MAX_HIGH_SCORES]
-            self.save_scores_to_file(self.high_scores_hard, 'high_scores_hard.txt')
+        """Save a high score for the specified level; the store writes it out in the background."""
+        self.dirty = True
+        self.scores.add(level, score, self.player)
 
-    def save_scores_to_file(self, scores, filename):
-        """Save high scores to a file."""
-        with open(filename, 'w') as file:
-            for score in scores:
-                file.write(f"{score}\n")
+    def score_line(self, rank, entry):
+        """Format one row of a high score table."""
+        return f"{rank}. {entry.score}" + (f"  {entry.player}" if entry.player else "")
 
     def render(self):
         """Render the menu screen."""
-        glClear(GL_COLOR_BUFFER_BIT)
-        glClearColor(0.1, 0.1, 0.1, 1)
+        get_backend().clear(0.1, 0.1, 0.1)
         START = WIDTH // 2 + 200
         END = HEIGHT // 2 - 200
 
-        render_text_with_random_colors(START - 50, END - 100, 40, "Pixel Platformer")
+        render_text_with_random_colors(START - 50, END - 100, 40, "Pixel Platformer", color_hz=TITLE_COLOR_HZ)
         render_text(START - 50, END, 30, "Choose Your Difficulty!")
 
         for button in self.buttons.values():
             button.draw()
 
         render_text(START - 50, END + 150, 30, "High Scores (Easy):")
-        for i, score in enumerate(self.high_scores_easy):
-            render_text(START - 50, END + 200 + i * 40, 30, f"{i + 1}. {score}")
+        for i, entry in enumerate(self.scores.top('easy', MAX_HIGH_SCORES)):
+            render_text(START - 50, END + 200 + i * 40, 30, self.score_line(i + 1, entry))
         
         render_text(START - 50, END + 400, 30, "High Scores (Hard):")
-        for i, score in enumerate(self.high_scores_hard):
-            render_text(START - 50, END + 450 + i * 40, 30, f"{i + 1}. {score}")
+        for i, entry in enumerate(self.scores.top('hard', MAX_HIGH_SCORES)):
+            render_text(START - 50, END + 450 + i * 40, 30, self.score_line(i + 1, entry))
 
         instructions_start_x = 50
         instructions_start_y = 250
@@ -462,7 +250,7 @@ class Menu:
         """Handle keyboard input for the menu."""
         if action == glfw.PRESS and key == glfw.KEY_ENTER:
             app.current_screen = 'game'
-            app.game.reset_game()
+            app.game.request_restart()
         if action == glfw.PRESS and key == glfw.KEY_ESCAPE:
             glfw.set_window_should_close(window, True)
 
@@ -470,16 +258,36 @@ class Menu:
         """Handle mouse movement for the menu."""
         ypos = ypos
         for button in self.buttons.values():
-            if button.is_hovered(xpos, ypos):
-                button.state = 'hovered'
-            else:
-                button.state = 'normal'
+            state = 'hovered' if button.is_hovered(xpos, ypos) else 'normal'
+            if button.state != state:
+                button.state = state
+                self.dirty = True
 
 class App:
-    def __init__(self):
-        """Initialize the application and set up the game menu."""
-        self.menu = Menu()
+    def __init__(self, record_file=None, replay_file=None, player='', pacing='vsync', fps=None):
+        """Initialize the application and set up the game menu, optionally recording games or playing one back.
+
+        `pacing` is one of pacing.PACING_MODES; `fps` sets the rate of 'fixed' pacing.
+        """
+        self.menu = Menu(ScoreStore(HIGH_SCORES_FILE), player)
         self.current_screen = 'menu'
+        self.record_file = record_file
+        self.recorder = None
+        self.playback = None
+        self.rewind = SnapshotRing()  # Recent states of the live game
+        if replay_file is not None:
+            recording = Recording.load(replay_file)
+            self.game = open_world(recording, world_class=EndlessGame if recording.level == ENDLESS_LEVEL else Game)
+            self.playback = Playback(recording)
+            self.current_screen = 'game'
+        self.drawn_screen = None  # Static screen currently on display, if any
+        self.last_static_draw = 0.0
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
+        self.overlay_lines = []
+        self.overlay_updated = 0.0
+        self.pacer = FramePacer(pacing, fps)
+        self.latency = LatencyStats()
         self.window = self.init_window()
         self.init_opengl()
 
@@ -493,7 +301,7 @@ class App:
             glfw.terminate()
             raise Exception("glfw window can not be created!")
         glfw.make_context_current(window)
-        glfw.swap_interval(1)
+        glfw.swap_interval(self.pacer.swap_interval)
 
         screen_width = glfw.get_video_mode(glfw.get_primary_monitor()).size.width
         screen_height = glfw.get_video_mode(glfw.get_primary_monitor()).size.height
@@ -502,11 +310,18 @@ class App:
         glfw.set_key_callback(window, self.key_input_callback)
         glfw.set_mouse_button_callback(window, self.mouse_input_callback)
         glfw.set_cursor_pos_callback(window, self.mouse_move_callback)
+        glfw.set_window_refresh_callback(window, self.window_refresh_callback)
         return window
 
     def key_input_callback(self, window, key, scancode, action, mods):
         """Handle global key input events."""
-        if self.current_screen == 'menu':
+        if action == glfw.PRESS and key == glfw.KEY_F3:
+            self.show_profiler = not self.show_profiler
+            self.drawn_screen = None
+        elif action == glfw.PRESS and key == glfw.KEY_F4:
+            self.profiler.export_csv(PROFILE_CSV_FILE)
+            print(f"Frame times written to {PROFILE_CSV_FILE}")
+        elif self.current_screen == 'menu':
             self.menu.key_input(window, key, scancode, action, mods)
         elif self.current_screen == 'paused':
             if action == glfw.PRESS and key == glfw.KEY_P:
@@ -528,38 +343,182 @@ class App:
         if self.current_screen == 'menu':
             self.menu.mouse_move(window, xpos, ypos)
 
+    def window_refresh_callback(self, window):
+        """Redraw static screens when the window contents are damaged."""
+        self.drawn_screen = None
+
+    def static_screen_dirty(self, now):
+        """Check whether the menu or pause screen needs to be redrawn."""
+        if self.current_screen != self.drawn_screen:
+            return True
+        if self.current_screen == 'menu':
+            return self.menu.dirty or now - self.last_static_draw >= 1.0 / TITLE_COLOR_HZ
+        return False
+
     def init_opengl(self):
         """Initialize OpenGL settings."""
-        glViewport(0, 0, WIDTH, HEIGHT)
-        glOrtho(0, WIDTH, HEIGHT, 0, -1, 1)
+        get_backend().viewport(0, 0, WIDTH, HEIGHT)
+        set_projection(0, 0, WIDTH, HEIGHT)
 
     def start_game(self):
         """Start the game with the selected difficulty level."""
+        self.finish_recording()
+        self.playback = None
+        if getattr(self, 'game', None) is not None:
+            self.close_game()
         level = self.menu.selected_level
-        self.game = Game(level)
+        self.game = EndlessGame(level) if level == ENDLESS_LEVEL else Game(level)
+        self.game.on_win = self.menu.save_high_score
+        self.rewind.clear()
+        if self.record_file is not None:
+            self.recorder = InputRecorder(self.game)
+
+    def close_game(self):
+        """Close the current game, printing whatever it reports on the way out."""
+        for line in self.game.summary_lines():
+            print(line)
+        self.game.close()
+
+    def finish_recording(self):
+        """Save the game being recorded, if any."""
+        if self.recorder is not None:
+            self.recorder.finish().save(self.record_file)
+            print(f"Recorded {len(self.recorder.recording)} ticks to {self.record_file}")
+            self.recorder = None
+
+    def step_game(self):
+        """Advance the game one tick with live or played-back input, recording it if asked to; or rewind it one tick."""
+        if self.playback is None and self.game.rewinding:
+            self.rewind_game()
+            return
+        if self.playback is not None:
+            keys = self.playback.next_keys()
+            self.game.inputs.clear()  # Live keys are ignored while a recording plays
+        else:
+            keys = self.game.take_input()
+            if not (self.game.game_won or self.game.game_lost):
+                self.rewind.push(self.game)
+        if self.recorder is not None:
+            self.recorder.record(keys)
+        self.game.step(keys)
+        if self.playback is not None and self.playback.done():
+            matches = state_digest(self.game) == self.playback.recording.final_digest
+            print("Replay finished: " + ("final state matches the recording" if matches else "final state DIFFERS from the recording"))
+            self.playback = None
+
+    def rewind_game(self):
+        """Restore the live game to its state a tick earlier, dropping the undone tick from any recording."""
+        if self.game.game_won:
+            return  # A win stays won, so it is only saved once
+        if self.rewind.rewind(self.game) and self.recorder is not None:
+            self.recorder.truncate(self.game.tick)
 
     def main_loop(self):
         """Main loop to render the current screen and handle events."""
+        accumulator = 0.0
+        previous_time = glfw.get_time()
+        profiler = self.profiler
+        backend = get_backend()
         while not glfw.window_should_close(self.window):
-            glfw.poll_events()
-            if self.current_screen == 'menu':
-                self.menu.render()
-            elif self.current_screen == 'paused':
-                self.render_pause_screen()
+            profiler.begin_frame()
+            backend.begin_frame()
+            if self.current_screen not in STATIC_SCREENS:
+                with profiler.phase('pace'):
+                    # Wait before polling rather than after rendering, so each frame is built from the latest input
+                    self.pacer.wait()
+            with profiler.phase('events'):
+                self.wait_for_events()
+            current_time = glfw.get_time()
+            frame_time = current_time - previous_time
+            previous_time = current_time
+
+            if self.current_screen in STATIC_SCREENS:
+                accumulator = 0.0
+                self.pacer.idle()  # Static screens are drawn on demand, not at a steady rate
+                if not self.static_screen_dirty(current_time):
+                    continue  # The last presented frame is still correct
+                with profiler.phase('render'):
+                    if self.current_screen == 'menu':
+                        self.menu.render()
+                        self.menu.dirty = False
+                    else:
+                        self.render_pause_screen()
+                    self.render_profiler_overlay(current_time)
+                self.drawn_screen = self.current_screen
+                self.last_static_draw = current_time
             else:
-                self.game.apply_physics()
-                self.game.render()
-            glfw.swap_buffers(self.window)
+                self.drawn_screen = None
+                # Step the simulation at a fixed rate, independent of the refresh rate
+                accumulator += frame_time
+                steps = 0
+                with profiler.phase('physics'):
+                    while accumulator >= PHYSICS_DT and steps < MAX_PHYSICS_STEPS:
+                        self.step_game()
+                        accumulator -= PHYSICS_DT
+                        steps += 1
+                if steps == MAX_PHYSICS_STEPS:
+                    # Too far behind to catch up; drop the backlog instead of spiralling
+                    accumulator = min(accumulator, PHYSICS_DT)
+                with profiler.phase('render'):
+                    self.game.render(accumulator / PHYSICS_DT)
+                    self.render_profiler_overlay(current_time)
+            with profiler.phase('swap'):
+                glfw.swap_buffers(self.window)
+            if self.current_screen not in STATIC_SCREENS:
+                self.pacer.frame_presented()
+                self.latency.record(self.game.inputs.presented())
+            backend.end_frame()
+            profiler.end_frame()
+        self.finish_recording()
+        if getattr(self, 'game', None) is not None:
+            self.close_game()
+        self.menu.scores.close()
+        print(self.pacer.summary())
+        print(self.latency.summary())
         glfw.terminate()
 
+    def wait_for_events(self):
+        """Poll for events while playing; on static screens sleep until input or the next title animation."""
+        if self.current_screen in STATIC_SCREENS:
+            if self.current_screen == 'menu':
+                timeout = max(0.0, self.last_static_draw + 1.0 / TITLE_COLOR_HZ - glfw.get_time())
+            else:
+                timeout = IDLE_WAIT_TIMEOUT
+            glfw.wait_events_timeout(timeout)
+        else:
+            glfw.poll_events()
+
+    def render_profiler_overlay(self, now):
+        """Draw FPS, frame-time percentiles and the per-phase breakdown in the top-right corner."""
+        if not self.show_profiler:
+            return
+        if now - self.overlay_updated >= OVERLAY_REFRESH:
+            self.overlay_lines = (self.profiler.overlay_lines() + self.pacer.overlay_lines() + self.latency.overlay_lines()
+                                  + self.game.overlay_lines())
+            self.overlay_updated = now
+        for i, line in enumerate(self.overlay_lines):
+            render_text(WIDTH - 420, 20 + i * 30, 20, line)
+
     def render_pause_screen(self):
         """Render the pause screen."""
-        glClear(GL_COLOR_BUFFER_BIT)
-        glClearColor(0.1, 0.1, 0.1, 1)
+        get_backend().clear(0.1, 0.1, 0.1)
         render_text(WIDTH // 2 - 50, HEIGHT // 2 - 100, 40, "Game Paused")
         render_text(WIDTH // 2 - 50, HEIGHT // 2, 30, "Press 'P' to Resume")
         render_text(WIDTH // 2 - 50, HEIGHT // 2 + 50, 30, "Press 'M' to Go to Menu")
 
 if __name__ == "__main__":
-    app = App()
+    parser = argparse.ArgumentParser(description="Pixel Platformer")
+    parser.add_argument('--record', metavar='FILE', help="record the inputs of each game started to FILE")
+    parser.add_argument('--replay', metavar='FILE', help="play back a recorded game in real time")
+    parser.add_argument('--player', default=os.environ.get('USER', os.environ.get('USERNAME', '')),
+                        help="name high scores are saved under (default: your user name)")
+    parser.add_argument('--pacing', choices=PACING_MODES, help="frame pacing: wait for vsync (default), run uncapped, or hold --fps")
+    parser.add_argument('--fps', type=float, help="frame rate for fixed pacing (default: 30); implies --pacing fixed")
+    args = parser.parse_args()
+    if args.fps is not None and args.pacing not in (None, 'fixed'):
+        parser.error("--fps only applies to --pacing fixed")
+    if args.fps is not None and args.fps <= 0:
+        parser.error("--fps must be positive")
+    pacing = args.pacing or ('fixed' if args.fps is not None else 'vsync')
+    app = App(record_file=args.record, replay_file=args.replay, player=args.player, pacing=pacing, fps=args.fps)
     app.main_loop()
@@ -0,0 +1,379 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import queue
+import random
+import threading
+import time
+import numpy as np
+from chunks import CHUNK_WIDTH, CHUNK_MARGIN, CHUNKS_BEHIND, CHUNKS_AHEAD
+from levels import PLATFORM_RECORD, records_from_rows
+from placement import scatter
+from reachability import ReachabilityGraph
+from world import (World, HEIGHT, CHAR_RADIUS, OBJECT_SPACING, OBSTACLES_PER_CHUNK, COINS_PER_CHUNK,
+                   SPAWN_CLEARANCE, OBSTACLE_RADIUS, COIN_RADIUS)
+
+# Level name of the endless generated course, and what recordings of it store as the level file
+ENDLESS_LEVEL = 'endless'
+ENDLESS_LEVEL_FILE = '<generated>'
+# Finished chunks that may wait in the queue; the worker blocks once this many are unclaimed
+GENERATE_AHEAD = 4
+
+# The route: a chain of platforms, each reachable in one jump from the one before
+FIRST_PLATFORM = (0, 700, 300)   # x, y, width of the platform under the spawn point
+PLATFORM_WIDTHS = (80, 240)
+PLATFORM_HEIGHT = 20
+STEP_GAPS = (20, 160)            # Horizontal gap between consecutive route platforms
+STEP_RISES = (-160, 125)         # How much higher each route platform is than the last; negative steps drop
+COURSE_TOP = 250                 # Route platforms stay between these heights
+COURSE_BOTTOM = HEIGHT - 150
+MOVING_CHANCE = 0.2
+MOVE_DISTANCES = (20, 60)
+# Random steps tried before the route falls back to SAFE_STEP, a short flat gap
+STEP_ATTEMPTS = 8
+SAFE_STEP = (40, 150)            # gap, width
+# Steps are checked as if the next platform were this much further away, since the analyzer assumes a perfect take-off
+STEP_SLACK = 16
+
+# Platforms off the route, per chunk, kept clear of the space others are jumped through
+DECOYS_PER_CHUNK = 6
+DECOY_ATTEMPTS = 30
+DECOY_CLEARANCE = (40, 200, 60)  # Sideways, above and below every existing platform
+
+# Records with this move_distance do not move; it matches the CSV default
+STATIC_MOVE_DISTANCE = 10
+
+class GeneratedChunk:
+    def __init__(self, index, first_record, records, members, obstacles, coins, seconds):
+        """
+        A finished chunk of the generated course.
+
+        Parameters:
+        index (int): The chunk number.
+        first_record (int): Course-wide index of the first record in `records`.
+        records (numpy.ndarray): PLATFORM_RECORD array of the platforms first generated with this chunk.
+        members (numpy.ndarray): Course-wide indices of every platform touching the chunk, ascending.
+        obstacles (numpy.ndarray): (x, y) obstacle centres.
+        coins (numpy.ndarray): (x, y) coin centres.
+        seconds (float): Time taken to generate the chunk.
+        """
+        self.index = index
+        self.first_record = first_record
+        self.records = records
+        self.members = members
+        self.obstacles = obstacles
+        self.coins = coins
+        self.seconds = seconds
+
+class CourseBuilder:
+    def __init__(self, seed, chunk_width=CHUNK_WIDTH):
+        """
+        Generate an endless course chunk by chunk; the same seed always gives the same course.
+
+        Chunks must be built in order, as each one continues the route where the last left off.
+        """
+        self.seed = seed
+        self.chunk_width = chunk_width
+        self.rng = random.Random(f"course:{seed}")
+        self.rows = []             # Every platform so far, as records_from_rows tuples
+        self.route_end = None      # The last route platform's row
+        self.chunk_starts = []     # Index of the first row generated with each chunk
+        self.next_chunk = 0
+
+    def build(self, chunk):
+        """Generate the next chunk, which must be number `chunk`."""
+        if chunk != self.next_chunk:
+            raise ValueError(f"chunk {chunk} requested, but chunk {self.next_chunk} is next")
+        start = time.perf_counter()
+        self.next_chunk += 1
+        first_record = len(self.rows)
+        self.chunk_starts.append(first_record)
+        left = chunk * self.chunk_width
+        right = left + self.chunk_width
+
+        # Run the route past the far margin so every platform that can touch this chunk exists
+        if self.route_end is None:
+            x, y, w = FIRST_PLATFORM
+            self.route_end = (x, y, w, PLATFORM_HEIGHT) + self.color() + (0, 1, STATIC_MOVE_DISTANCE)
+            self.rows.append(self.route_end)
+        while self.route_end[0] <= right + CHUNK_MARGIN:
+            self.route_end = self.next_step(self.route_end)
+            self.rows.append(self.route_end)
+            time.sleep(0)  # Let the main thread in between steps
+        self.add_decoys(left, right)
+
+        nearby = np.arange(self.chunk_starts[max(chunk - 1, 0)], len(self.rows))
+        x, y, w, h, reach = self.extents(nearby)
+        touching = (x - reach - CHUNK_MARGIN < right) & (x + w + reach + CHUNK_MARGIN >= left)
+        # The same test as World.platforms_block, over each platform's whole range
+        rects = (x - reach, y, x + w + reach, y + h)
+        rng = random.Random(f"{self.seed}:{chunk}")
+        obstacles = self.scatter(rng, chunk, OBSTACLES_PER_CHUNK, OBSTACLE_RADIUS, [], rects)
+        coins = self.scatter(rng, chunk, COINS_PER_CHUNK, COIN_RADIUS, obstacles, rects)
+        return GeneratedChunk(chunk, first_record, records_from_rows(self.rows[first_record:]), nearby[touching],
+                              obstacles, coins, time.perf_counter() - start)
+
+    def color(self):
+        """Pick a platform color."""
+        return tuple(round(self.rng.uniform(0.2, 0.8), 2) for _ in range(3))
+
+    def next_step(self, previous):
+        """Add a route platform one jump on from `previous`, checked with the reachability analyzer."""
+        px, py, pw = previous[0], previous[1], previous[2]
+        previous_reach = previous[9] if previous[7] else 0
+        for _ in range(STEP_ATTEMPTS):
+            w = self.rng.randint(*PLATFORM_WIDTHS)
+            moving = self.rng.random() < MOVING_CHANCE
+            distance = self.rng.randint(*MOVE_DISTANCES) if moving else STATIC_MOVE_DISTANCE
+            # Leave the gap between the platforms' whole ranges so moving ones never pass through each other
+            x = px + pw + previous_reach + self.rng.randint(*STEP_GAPS) + (distance if moving else 0)
+            y = min(max(py - self.rng.randint(*STEP_RISES), COURSE_TOP), COURSE_BOTTOM)
+            row = (x, y, w, PLATFORM_HEIGHT) + self.color() + (int(moving), self.rng.choice((-1, 1)), distance)
+            if self.reachable(previous, row):
+                return row
+        gap, w = SAFE_STEP
+        return (px + pw + previous_reach + gap, py, w, PLATFORM_HEIGHT) + self.color() + (0, 1, STATIC_MOVE_DISTANCE)
+
+    def reachable(self, source, target):
+        """Check that `target` can be landed on with one jump from `source`, with STEP_SLACK to spare."""
+        records = records_from_rows([source, (target[0] + STEP_SLACK,) + tuple(target[1:])])
+        graph = ReachabilityGraph(records, spawn=(source[0] + source[2] // 2, source[1] - CHAR_RADIUS - 1))
+        return 1 in graph.neighbours(0).tolist()
+
+    def add_decoys(self, left, right):
+        """Scatter static platforms off the route, inside the chunk and clear of every jump."""
+        side, above, below = DECOY_CLEARANCE
+        nearby = np.arange(self.chunk_starts[max(self.next_chunk - 2, 0)], len(self.rows))
+        x, y, w, h, reach = self.extents(nearby)
+        x0, y0, x1, y1 = list(x - reach - side), list(y - above), list(x + w + reach + side), list(y + h + below)
+        placed = 0
+        for _ in range(DECOY_ATTEMPTS):
+            if placed == DECOYS_PER_CHUNK:
+                break
+            dw = self.rng.randint(*PLATFORM_WIDTHS)
+            dx = self.rng.randint(left + CHUNK_MARGIN + 1, right - CHUNK_MARGIN - 1 - dw)
+            dy = self.rng.randint(COURSE_TOP - above // 2, COURSE_BOTTOM)
+            if any(dx < b_x1 and dx + dw > b_x0 and dy < b_y1 and dy + PLATFORM_HEIGHT > b_y0
+                   for b_x0, b_y0, b_x1, b_y1 in zip(x0, y0, x1, y1)):
+                continue
+            row = (dx, dy, dw, PLATFORM_HEIGHT) + self.color() + (0, 1, STATIC_MOVE_DISTANCE)
+            self.rows.append(row)
+            x0.append(dx - side)
+            y0.append(dy - above)
+            x1.append(dx + dw + side)
+            y1.append(dy + PLATFORM_HEIGHT + below)
+            placed += 1
+
+    def extents(self, indices):
+        """Return x, y, w, h and movement reach arrays for rows."""
+        rows = np.array([self.rows[i] for i in indices.tolist()], dtype=np.int64).reshape(-1, 10) if len(indices) else np.zeros((0, 10), dtype=np.int64)
+        reach = np.where(rows[:, 7] != 0, np.abs(rows[:, 9]) + 1, 0)
+        return rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3], reach
+
+    def scatter(self, rng, chunk, count, size, others, rects):
+        """Place a chunk's obstacles or coins the way World.generate_objects does, off every nearby platform."""
+        left = chunk * self.chunk_width
+        right = left + self.chunk_width
+        x0 = max(left + (OBJECT_SPACING // 2 if chunk > 0 else 0), SPAWN_CLEARANCE)
+        x1 = right - size - OBJECT_SPACING // 2
+        bounds = (x0, 0, x1, HEIGHT - size - 100)
+        px0, py0, px1, py1 = rects
+
+        def rejects(xs, ys):
+            return ((xs[:, None] >= px0 - size) & (xs[:, None] <= px1 + size)
+                    & (ys[:, None] >= py0 - size) & (ys[:, None] <= py1 + size)).any(axis=1)
+
+        return scatter(rng, count, OBJECT_SPACING, bounds, avoid=others, rejects=rejects)
+
+class ChunkGenerator:
+    def __init__(self, seed, ahead=GENERATE_AHEAD):
+        """
+        Build course chunks on a background thread, queued ahead of the player.
+
+        The worker stops when `ahead` finished chunks are waiting and resumes as they are
+        taken, so it stays a bounded distance ahead. It sleeps between route steps, so it
+        mostly runs while the main thread waits on vsync or for events.
+
+        Parameters:
+        seed (int): The course seed.
+        ahead (int): Finished chunks allowed to wait in the queue.
+        """
+        self.queue = queue.Queue(ahead)
+        self.stopping = threading.Event()
+        self.stalls = 0            # Chunks the main thread had to wait for
+        self.wait_seconds = 0.0    # Total time spent waiting for them
+        self.thread = threading.Thread(target=self.run, args=(seed,), name='chunk-generator', daemon=True)
+        self.thread.start()
+
+    def run(self, seed):
+        """Worker loop: build chunks in order until closed."""
+        builder = CourseBuilder(seed)
+        chunk = 0
+        try:
+            while not self.stopping.is_set():
+                self.put(builder.build(chunk))
+                chunk += 1
+        except Exception as error:
+            self.put(error)  # Re-raised by get() on the main thread
+
+    def put(self, item):
+        """Queue an item, blocking while the queue is full unless the generator is closed."""
+        while not self.stopping.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def get(self, wait=True):
+        """Take the next finished chunk, waiting for it only if the worker has fallen behind; without `wait`, return None then."""
+        try:
+            item = self.queue.get_nowait()
+        except queue.Empty:
+            if not wait:
+                return None
+            start = time.perf_counter()
+            item = self.queue.get()
+            self.stalls += 1
+            self.wait_seconds += time.perf_counter() - start
+        if isinstance(item, Exception):
+            raise RuntimeError("chunk generation failed") from item
+        return item
+
+    def close(self):
+        """Stop the worker and wait for it to exit."""
+        self.stopping.set()
+        while self.thread.is_alive():
+            try:
+                self.queue.get_nowait()  # Unblock a pending put
+            except queue.Empty:
+                pass
+            self.thread.join(0.05)
+
+class GeneratedChunks:
+    def __init__(self, generator, chunk_width=CHUNK_WIDTH):
+        """
+        Stand in for chunks.LevelChunks over a course that grows as chunks are taken from a generator.
+
+        Taken chunks are kept, so walking back or restarting reloads them without generating again.
+        """
+        self.generator = generator
+        self.chunk_width = chunk_width
+        # The course is endless to the right; int32 is the limit of a record's x
+        self.bounds = (0, 0, int(np.iinfo(np.int32).max), HEIGHT)
+        self.first = 0
+        self.buffer = np.zeros(64, dtype=PLATFORM_RECORD)
+        self.records = self.buffer[:0]
+        self.taken = []
+
+    def take(self, chunk):
+        """Make sure a chunk and every chunk before it have been handed over by the generator."""
+        while len(self.taken) <= chunk:
+            self.append(self.generator.get())
+        return self.taken[chunk]
+
+    def prefetch(self, chunk):
+        """Take whichever of the chunks up to `chunk` are finished already, never waiting; return whether any were."""
+        taken = len(self.taken)
+        while len(self.taken) <= chunk:
+            generated = self.generator.get(wait=False)
+            if generated is None:
+                break
+            self.append(generated)
+        return len(self.taken) > taken
+
+    def append(self, generated):
+        """Add a chunk handed over by the generator to the course."""
+        count = len(self.records)
+        end = count + len(generated.records)
+        if end > len(self.buffer):
+            buffer = np.zeros(max(end, 2 * len(self.buffer)), dtype=PLATFORM_RECORD)
+            buffer[:count] = self.records
+            self.buffer = buffer
+        self.buffer[count:end] = generated.records
+        self.records = self.buffer[:end]
+        self.taken.append(generated)
+
+    def overlay_lines(self):
+        """Return the lines of text the performance overlay shows for chunk streaming."""
+        generator = self.generator
+        return [f"Chunks: {len(self.taken)} Stalls: {generator.stalls}", f"Chunk Wait: {generator.wait_seconds * 1000:.1f} MS"]
+
+    def summary(self):
+        """Return a one-line report of chunk generation and of any waits for it."""
+        generator = self.generator
+        build = [chunk.seconds * 1000 for chunk in self.taken]
+        if not build:
+            return "Chunk streaming: no chunks generated"
+        return (f"Chunk streaming: {len(build)} chunks, build mean {sum(build) / len(build):.1f} ms, slowest {max(build):.1f} ms, "
+                f"{generator.stalls} stalls waited {generator.wait_seconds * 1000:.1f} ms")
+
+    def chunk_at(self, x):
+        """Return the chunk containing x; there is nothing left of chunk 0."""
+        return max(int(x // self.chunk_width), self.first)
+
+    def window(self, x):
+        """Return the chunks that should be loaded while the player is at x."""
+        chunk = self.chunk_at(x)
+        return range(max(self.first, chunk - CHUNKS_BEHIND), chunk + CHUNKS_AHEAD + 1)
+
+    def records_in(self, chunk):
+        """Return the indices of the records touching a chunk."""
+        return self.take(chunk).members
+
+    def x_range(self, chunk):
+        """Return the left and right edges of a chunk."""
+        return chunk * self.chunk_width, (chunk + 1) * self.chunk_width
+
+class ProceduralWorld(World):
+    def __init__(self, level=ENDLESS_LEVEL, seed=None, level_file=None, ahead=GENERATE_AHEAD):
+        """
+        A world on an endless generated course with no goal; the run ends when the character dies.
+
+        `level_file` is accepted for compatibility with World and ignored.
+        """
+        self.ahead = ahead
+        super().__init__(level, seed, ENDLESS_LEVEL_FILE)
+        self.goal_record = None
+
+    def load_platforms(self, filename):
+        """Start with no platforms; they arrive chunk by chunk."""
+        return np.zeros(0, dtype=PLATFORM_RECORD)
+
+    def index_level(self, records):
+        """Start the background generator for this world's seed."""
+        return GeneratedChunks(ChunkGenerator(self.seed, self.ahead))
+
+    def fetch_chunks(self, chunks):
+        """Take the chunks, and any before them, from the generator, so their records are in level_records."""
+        for chunk in chunks:
+            self.chunks.take(chunk)
+        self.level_records = self.chunks.records
+
+    def stream_chunks(self):
+        """
+        Stream chunks as usual, then take the chunk just past the load window if it is finished.
+
+        So by the time that chunk enters the window it is normally here already, and loading
+        it never waits on the worker; a wait counts as a stall.
+        """
+        super().stream_chunks()
+        if self.chunks.prefetch(self.chunks.window(self.char_x).stop):
+            self.level_records = self.chunks.records
+
+    def load_chunk(self, chunk):
+        """Take a finished chunk from the generator and add it like any other."""
+        self.fetch_chunks([chunk])
+        super().load_chunk(chunk)
+
+    def generate_chunk_objects(self, chunk):
+        """Add the chunk's pre-generated obstacles and coins; every attempt gets the same course."""
+        generated = self.chunks.take(chunk)
+        self.obstacles.add(generated.obstacles, chunk)
+        collected = self.collected.get(chunk, ())
+        ids = [i for i in range(len(generated.coins)) if i not in collected]
+        self.coins.add(generated.coins[ids], chunk, ids)
+
+    def close(self):
+        """Stop the background generator."""
+        self.chunks.generator.close()
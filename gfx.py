@@ -0,0 +1,202 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import numpy as np
+
+# Primitive types understood by Backend.draw_arrays
+DRAW_MODES = ('points', 'quads', 'triangles')
+
+_backend = None
+
+class Backend:
+    """The drawing operations the game uses; every rendering call goes through one of these."""
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+
+    def end_frame(self):
+        """Mark the end of a frame."""
+
+    def viewport(self, x, y, width, height):
+        """Set the window area drawn into."""
+        raise NotImplementedError
+
+    def set_projection(self, x, y, width, height):
+        """Map the given world rectangle onto the viewport, with the origin at the top left."""
+        raise NotImplementedError
+
+    def clear(self, r, g, b):
+        """Clear the frame to a color."""
+        raise NotImplementedError
+
+    def set_color(self, r, g, b):
+        """Set the color used by draws without per-vertex colors."""
+        raise NotImplementedError
+
+    def set_point_size(self, size):
+        """Set the size of drawn points in pixels."""
+        raise NotImplementedError
+
+    def draw_arrays(self, mode, vertices, colors=None, offset=None):
+        """
+        Draw vertex arrays in a single call.
+
+        Parameters:
+        mode (str): One of DRAW_MODES.
+        vertices (numpy.ndarray): An (n, 2) float32 array of positions.
+        colors (numpy.ndarray): Optional (n, 3) per-vertex colors, float32 in 0..1 or uint8.
+        offset (tuple): Optional (x, y) translation applied to every vertex.
+        """
+        raise NotImplementedError
+
+class GLBackend(Backend):
+    def __init__(self):
+        """Draw through immediate-mode OpenGL; needs a current GL context."""
+        from OpenGL import GL  # Imported here so headless code never needs PyOpenGL
+        self.gl = GL
+        self.modes = {'points': GL.GL_POINTS, 'quads': GL.GL_QUADS, 'triangles': GL.GL_TRIANGLES}
+
+    def viewport(self, x, y, width, height):
+        """Set the window area drawn into."""
+        self.gl.glViewport(x, y, width, height)
+
+    def set_projection(self, x, y, width, height):
+        """Load a top-left-origin orthographic projection of the given rectangle."""
+        gl = self.gl
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glLoadIdentity()
+        gl.glOrtho(x, x + width, y + height, y, -1, 1)
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+
+    def clear(self, r, g, b):
+        """Clear the frame to a color."""
+        self.gl.glClearColor(r, g, b, 1)
+        self.gl.glClear(self.gl.GL_COLOR_BUFFER_BIT)
+
+    def set_color(self, r, g, b):
+        """Set the color used by draws without per-vertex colors."""
+        self.gl.glColor3f(r, g, b)
+
+    def set_point_size(self, size):
+        """Set the size of drawn points in pixels."""
+        self.gl.glPointSize(size)
+
+    def draw_arrays(self, mode, vertices, colors=None, offset=None):
+        """Submit client-side vertex and optional color arrays with glDrawArrays."""
+        if not len(vertices):
+            return
+        gl = self.gl
+        if offset is not None:
+            gl.glPushMatrix()
+            gl.glTranslatef(offset[0], offset[1], 0)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glVertexPointer(2, gl.GL_FLOAT, 0, vertices)
+        if colors is not None:
+            gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+            gl.glColorPointer(3, gl.GL_UNSIGNED_BYTE if colors.dtype == np.uint8 else gl.GL_FLOAT, 0, colors)
+        gl.glDrawArrays(self.modes[mode], 0, len(vertices))
+        if colors is not None:
+            gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        if offset is not None:
+            gl.glPopMatrix()
+
+class RecordingBackend(Backend):
+    def __init__(self, keep_calls=False):
+        """
+        Count draw calls, vertices and state changes per frame instead of drawing.
+
+        Parameters:
+        keep_calls (bool): Also keep a list of every call made during the current frame.
+        """
+        self.keep_calls = keep_calls
+        self.state = {}    # Last value set for each piece of state
+        self.frames = []   # Stats of every finished frame
+        self.begin_frame()
+
+    def begin_frame(self):
+        """Reset the counters for a new frame."""
+        self.stats = {
+            'draw_calls': 0,
+            'vertices': 0,
+            'vertices_by_mode': dict.fromkeys(DRAW_MODES, 0),
+            'state_changes': 0,    # State set to a new value
+            'redundant_state': 0,  # State set to the value it already had
+            'clears': 0,
+        }
+        self.calls = []
+
+    def end_frame(self):
+        """Store and return the stats of the frame just drawn, then start a new one."""
+        stats = self.stats
+        self.frames.append(stats)
+        self.begin_frame()
+        return stats
+
+    def record(self, name, *args):
+        """Keep a call in the frame's call list when asked to."""
+        if self.keep_calls:
+            self.calls.append((name,) + args)
+
+    def set_state(self, name, value):
+        """Count a state change, or a redundant one if the value is unchanged."""
+        if self.state.get(name) == value:
+            self.stats['redundant_state'] += 1
+        else:
+            self.stats['state_changes'] += 1
+            self.state[name] = value
+        self.record(name, value)
+
+    def viewport(self, x, y, width, height):
+        """Record a viewport change."""
+        self.set_state('viewport', (x, y, width, height))
+
+    def set_projection(self, x, y, width, height):
+        """Record a projection change."""
+        self.set_state('projection', (x, y, width, height))
+
+    def clear(self, r, g, b):
+        """Record a clear and its color."""
+        self.set_state('clear_color', (r, g, b))
+        self.stats['clears'] += 1
+        self.record('clear')
+
+    def set_color(self, r, g, b):
+        """Record a current color change."""
+        self.set_state('color', (r, g, b))
+
+    def set_point_size(self, size):
+        """Record a point size change."""
+        self.set_state('point_size', size)
+
+    def draw_arrays(self, mode, vertices, colors=None, offset=None):
+        """Count a draw call and its vertices; empty draws are skipped, as the GL backend does."""
+        if mode not in DRAW_MODES:
+            raise ValueError(f"unknown draw mode {mode!r}")
+        if not len(vertices):
+            return
+        self.stats['draw_calls'] += 1
+        self.stats['vertices'] += len(vertices)
+        self.stats['vertices_by_mode'][mode] += len(vertices)
+        self.record('draw_arrays', mode, len(vertices), colors is not None, offset)
+
+def get_backend():
+    """Return the active backend, creating the OpenGL one on first use."""
+    global _backend
+    if _backend is None:
+        _backend = GLBackend()
+    return _backend
+
+def set_backend(backend):
+    """
+    Make a backend the active one.
+
+    Parameters:
+    backend (Backend): The backend every later draw goes through.
+
+    Returns:
+    Backend: The previously active backend, or None.
+    """
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
@@ -0,0 +1,128 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import time
+from collections import deque
+import numpy as np
+from profiler import PROFILE_FRAMES
+
+# Input-to-photon latency above this counts as over budget: three frames at 60 Hz
+LATENCY_BUDGET_MS = 50
+# Kinds of input event
+PRESS, RELEASE, TAP = 'press', 'release', 'tap'
+
+class InputQueue:
+    def __init__(self, clock=time.perf_counter_ns):
+        """
+        Queue timestamped key events and turn them into one KEY_* bitmask per simulation tick.
+
+        Events only take effect when take() is called at the start of a tick, so the
+        simulation sees the same input however events and frames interleave.
+
+        Parameters:
+        clock (callable): Returns the time in integer nanoseconds.
+        """
+        self.clock = clock
+        self.events = deque()  # (timestamp, KEY_* bits, PRESS/RELEASE/TAP), oldest first
+        self.held = 0          # Bits of the keys down as of the last tick
+        self.applied = []      # Timestamps of events applied by ticks whose result is not on screen yet
+
+    def press(self, keys):
+        """Queue a key going down."""
+        self.events.append((self.clock(), keys, PRESS))
+
+    def release(self, keys):
+        """Queue a key coming up."""
+        self.events.append((self.clock(), keys, RELEASE))
+
+    def tap(self, keys):
+        """Queue bits that count for a single tick, such as a restart."""
+        self.events.append((self.clock(), keys, TAP))
+
+    def take(self):
+        """
+        Apply every queued event at a tick boundary.
+
+        Returns:
+        int: The KEY_* bitmask for the tick: keys held now, plus any pressed or tapped since the last tick.
+        """
+        pressed = 0
+        while self.events:
+            timestamp, keys, kind = self.events.popleft()
+            if kind == PRESS:
+                self.held |= keys
+                pressed |= keys
+            elif kind == RELEASE:
+                self.held &= ~keys
+            else:
+                pressed |= keys
+            self.applied.append(timestamp)
+        return self.held | pressed
+
+    def presented(self, timestamp=None):
+        """
+        Note that a frame showing every tick so far has been presented.
+
+        Returns:
+        numpy.ndarray: Input-to-photon latency in ms of each event that frame is the first to show.
+        """
+        if not self.applied:
+            return np.zeros(0)
+        now = self.clock() if timestamp is None else timestamp
+        latencies = (now - np.array(self.applied, dtype=np.int64)) / 1e6
+        self.applied.clear()
+        return latencies
+
+    def clear(self):
+        """Drop queued events, for when the simulation is fed from elsewhere such as a replay."""
+        self.events.clear()
+        self.applied.clear()
+
+class LatencyStats:
+    def __init__(self, budget=LATENCY_BUDGET_MS, size=PROFILE_FRAMES):
+        """Keep recent input-to-photon latencies, in ms, and count those over `budget` ms."""
+        self.budget = budget
+        self.samples = np.zeros(size)  # Ring buffer
+        self.count = 0                 # Samples recorded since start
+        self.over_budget = 0
+        self.worst = 0.0
+
+    def record(self, latencies):
+        """Add latencies returned by InputQueue.presented."""
+        for latency in latencies.tolist():
+            self.samples[self.count % len(self.samples)] = latency
+            self.count += 1
+            self.over_budget += latency > self.budget
+            self.worst = max(self.worst, latency)
+
+    def stats(self):
+        """
+        Summarize the recent samples.
+
+        Returns:
+        dict: p50 and p99 of recent latencies, the worst ever and the number over budget; empty before the first.
+        """
+        samples = self.samples[:min(self.count, len(self.samples))]
+        if not len(samples):
+            return {}
+        return {
+            'p50': float(np.percentile(samples, 50)),
+            'p99': float(np.percentile(samples, 99)),
+            'worst': self.worst,
+            'over_budget': self.over_budget,
+        }
+
+    def overlay_lines(self):
+        """Return the lines of text the performance overlay shows for input latency."""
+        stats = self.stats()
+        if not stats:
+            return ["Input: no events yet"]
+        return [f"Input P50: {stats['p50']:.1f} MS", f"Input P99: {stats['p99']:.1f} MS"]
+
+    def summary(self):
+        """Return a one-line report of latency against the budget."""
+        stats = self.stats()
+        if not stats:
+            return "Input latency: no events recorded"
+        return (f"Input latency: {self.count} events, p50 {stats['p50']:.1f} ms, p99 {stats['p99']:.1f} ms, "
+                f"worst {stats['worst']:.1f} ms, {stats['over_budget']} over the {self.budget:g} ms budget")
@@ -0,0 +1,155 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import hashlib
+import os
+import struct
+import numpy as np
+
+# Compiled level files start with this header, followed by a packed array of PLATFORM_RECORD
+LEVEL_MAGIC = b'PXLV'
+LEVEL_FORMAT_VERSION = 1
+LEVEL_HEADER = struct.Struct('<4sHHIqq20s')  # magic, version, reserved, count, source mtime_ns, source size, source sha1
+COMPILED_SUFFIX = '.lvl'
+
+PLATFORM_RECORD = np.dtype([
+    ('x', '<i4'), ('y', '<i4'), ('w', '<i4'), ('h', '<i4'),
+    ('color', '<f4', 3),
+    ('move', 'u1'), ('direction', 'i1'), ('pad', 'u1', 2),
+    ('move_distance', '<i4'),
+])
+
+def records_from_rows(rows):
+    """
+    Pack platform rows into a record array.
+
+    Parameters:
+    rows (list): Tuples of (x, y, w, h, r, g, b, move, direction, move_distance).
+
+    Returns:
+    numpy.ndarray: A PLATFORM_RECORD array.
+    """
+    records = np.zeros(len(rows), dtype=PLATFORM_RECORD)
+    if rows:
+        data = np.array(rows, dtype=np.float64).reshape(len(rows), 10)
+        for i, field in enumerate(('x', 'y', 'w', 'h')):
+            records[field] = data[:, i]
+        records['color'] = data[:, 4:7]
+        records['move'] = data[:, 7] != 0
+        records['direction'] = data[:, 8]
+        records['move_distance'] = data[:, 9]
+    return records
+
+def parse_level_csv(filename):
+    """
+    Parse a platform CSV file: x, y, w, h, r, g, b and optional move, direction and move distance columns.
+
+    Parameters:
+    filename (str): The path of the CSV file.
+
+    Returns:
+    numpy.ndarray: A PLATFORM_RECORD array.
+    """
+    rows = []
+    with open(filename, 'r') as file:
+        for line_number, line in enumerate(file, 1):
+            parts = [part.strip() for part in line.split(',')]
+            while parts and not parts[-1]:
+                parts.pop()  # Blank lines and trailing commas
+            if not parts:
+                continue
+            if len(parts) < 7:
+                raise ValueError(f"{filename}:{line_number}: expected at least 7 columns, got {len(parts)}")
+            x, y, w, h = map(int, parts[:4])
+            color = tuple(map(float, parts[4:7]))
+            move = int(parts[7]) if len(parts) > 7 else 0
+            direction = int(parts[8]) if len(parts) > 8 else 1
+            move_distance = int(parts[9]) if len(parts) > 9 else 10
+            rows.append((x, y, w, h) + color + (move, direction, move_distance))
+    return records_from_rows(rows)
+
+def file_digest(filename):
+    """Return the SHA-1 digest of a file's contents."""
+    with open(filename, 'rb') as file:
+        return hashlib.sha1(file.read()).digest()
+
+def records_digest(records):
+    """Return the SHA-1 digest of platform records, identifying a level independently of its CSV formatting."""
+    return hashlib.sha1(np.ascontiguousarray(records, dtype=PLATFORM_RECORD).tobytes()).digest()
+
+def compiled_path(filename):
+    """Return the path of the compiled level built from a CSV file."""
+    return os.path.splitext(filename)[0] + COMPILED_SUFFIX
+
+def write_compiled(records, path, source_stat, source_digest):
+    """Write records to a compiled level file atomically."""
+    header = LEVEL_HEADER.pack(LEVEL_MAGIC, LEVEL_FORMAT_VERSION, 0, len(records),
+                               source_stat.st_mtime_ns, source_stat.st_size, source_digest)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(header)
+        file.write(records.astype(PLATFORM_RECORD).tobytes())
+    os.replace(temp_path, path)
+
+def read_header(path):
+    """Read a compiled level header, or return None if it is missing or from another format version."""
+    try:
+        with open(path, 'rb') as file:
+            raw = file.read(LEVEL_HEADER.size)
+    except OSError:
+        return None
+    if len(raw) < LEVEL_HEADER.size:
+        return None
+    magic, version, _, count, mtime_ns, size, digest = LEVEL_HEADER.unpack(raw)
+    if magic != LEVEL_MAGIC or version != LEVEL_FORMAT_VERSION:
+        return None
+    if os.path.getsize(path) != LEVEL_HEADER.size + count * PLATFORM_RECORD.itemsize:
+        return None
+    return count, mtime_ns, size, digest
+
+def map_compiled(path, count):
+    """Memory-map the records of a compiled level read-only."""
+    if count == 0:
+        return np.zeros(0, dtype=PLATFORM_RECORD)
+    return np.memmap(path, dtype=PLATFORM_RECORD, mode='r', offset=LEVEL_HEADER.size, shape=(count,))
+
+def load_level(filename):
+    """
+    Load a level's platform records, compiling the CSV source into a memory-mapped binary file on first use.
+
+    The compiled file is reused while the source's mtime and size match its header. If only
+    the mtime changed (for example after a checkout) the source hash decides. Without a
+    writable directory the CSV is parsed in memory instead.
+
+    Parameters:
+    filename (str): The path of the CSV level file.
+
+    Returns:
+    numpy.ndarray: A read-only PLATFORM_RECORD array.
+    """
+    path = compiled_path(filename)
+    header = read_header(path)
+    try:
+        source_stat = os.stat(filename)
+    except FileNotFoundError:
+        if header is None:
+            raise
+        return map_compiled(path, header[0])  # Shipped without its source
+
+    if header is not None:
+        count, mtime_ns, size, digest = header
+        if mtime_ns == source_stat.st_mtime_ns and size == source_stat.st_size:
+            return map_compiled(path, count)
+        if size == source_stat.st_size and digest == file_digest(filename):
+            try:
+                write_compiled(np.array(map_compiled(path, count)), path, source_stat, digest)
+            except OSError:
+                pass
+            return map_compiled(path, count)
+
+    records = parse_level_csv(filename)
+    try:
+        write_compiled(records, path, source_stat, file_digest(filename))
+    except OSError:
+        return records
+    return map_compiled(path, len(records))
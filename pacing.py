@@ -0,0 +1,119 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import time
+import numpy as np
+from profiler import PROFILE_FRAMES
+
+# How frames are paced: wait for the display's vertical sync, run flat out, or hold a fixed rate
+PACING_MODES = ('vsync', 'uncapped', 'fixed')
+# Frame rate held by 'fixed' pacing unless another is given
+DEFAULT_FIXED_FPS = 30
+# The limiter sleeps until this long before a frame is due, then spins; sleeps can overshoot by about a millisecond
+SPIN_THRESHOLD = 0.002
+
+class FramePacer:
+    def __init__(self, mode='vsync', fps=None, size=PROFILE_FRAMES, clock=time.perf_counter, sleep=time.sleep):
+        """
+        Pace presented frames and measure how evenly they arrive.
+
+        Parameters:
+        mode (str): One of PACING_MODES.
+        fps (float): Target rate for 'fixed' pacing; defaults to DEFAULT_FIXED_FPS.
+        size (int): Number of recent frame intervals kept for the jitter stats.
+        clock (callable): Returns the time in seconds.
+        sleep (callable): Sleeps for a number of seconds.
+        """
+        if mode not in PACING_MODES:
+            raise ValueError(f"unknown pacing mode {mode!r}; choose from {', '.join(PACING_MODES)}")
+        if fps is not None and fps <= 0:
+            raise ValueError("fps must be positive")
+        self.mode = mode
+        self.fps = (fps or DEFAULT_FIXED_FPS) if mode == 'fixed' else None
+        self.period = 1.0 / self.fps if self.fps else None
+        self.clock = clock
+        self.sleep = sleep
+        self.intervals = np.zeros(size)  # Ring buffer of seconds between presented frames
+        self.frames = 0                  # Intervals recorded since start
+        self.last_present = None
+        self.deadline = None             # When the next fixed-rate frame is due
+
+    @property
+    def swap_interval(self):
+        """Return the swap interval to give the windowing library: 1 waits for vsync, 0 does not."""
+        return 1 if self.mode == 'vsync' else 0
+
+    def wait(self):
+        """With fixed pacing, block until the next frame is due: sleep most of the way, then spin."""
+        if self.period is None:
+            return
+        now = self.clock()
+        if self.deadline is None:
+            self.deadline = now
+        remaining = self.deadline - now
+        if remaining > SPIN_THRESHOLD:
+            self.sleep(remaining - SPIN_THRESHOLD)
+        while True:
+            now = self.clock()
+            if now >= self.deadline:
+                break
+        if now - self.deadline > SPIN_THRESHOLD:
+            # Late, from a slow frame or an overslept sleep: restart the schedule rather than rushing the next frame
+            self.deadline = now
+        self.deadline += self.period
+
+    def frame_presented(self):
+        """Record that a frame has just been shown."""
+        now = self.clock()
+        if self.last_present is not None:
+            self.intervals[self.frames % len(self.intervals)] = now - self.last_present
+            self.frames += 1
+        self.last_present = now
+
+    def idle(self):
+        """Note a break in continuous rendering, so the gap is not counted as a slow frame."""
+        self.last_present = None
+        self.deadline = None
+
+    def stats(self):
+        """
+        Summarize the recorded frame intervals.
+
+        Jitter is the standard deviation of the intervals. The deviation percentile is measured
+        from the target interval with fixed pacing, and from the mean interval otherwise.
+
+        Returns:
+        dict: fps, mean, jitter and p99 deviation in ms, and the target interval in ms or None; empty before two frames.
+        """
+        intervals = self.intervals[:min(self.frames, len(self.intervals))]
+        if not len(intervals):
+            return {}
+        mean = intervals.mean()
+        target = self.period if self.period is not None else mean
+        return {
+            'fps': 1.0 / mean if mean > 0 else 0.0,
+            'mean': mean * 1000,
+            'jitter': float(intervals.std()) * 1000,
+            'p99_deviation': float(np.percentile(np.abs(intervals - target), 99)) * 1000,
+            'target': self.period * 1000 if self.period is not None else None,
+        }
+
+    def describe(self):
+        """Return the mode as shown to the user, with its rate for fixed pacing."""
+        return f"{self.mode} {self.fps:g} FPS" if self.period is not None else self.mode
+
+    def overlay_lines(self):
+        """Return the lines of text the performance overlay shows for frame pacing."""
+        stats = self.stats()
+        lines = [f"Pacing: {self.describe()}"]
+        if stats:
+            lines += [f"Jitter: {stats['jitter']:.2f} MS", f"P99 dev: {stats['p99_deviation']:.2f} MS"]
+        return lines
+
+    def summary(self):
+        """Return a one-line report of the achieved rate and jitter."""
+        stats = self.stats()
+        if not stats:
+            return f"Frame pacing ({self.describe()}): no continuous frames recorded"
+        return (f"Frame pacing ({self.describe()}): {stats['fps']:.1f} FPS, mean {stats['mean']:.2f} ms, "
+                f"jitter {stats['jitter']:.2f} ms, p99 deviation {stats['p99_deviation']:.2f} ms")
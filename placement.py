@@ -0,0 +1,104 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+from math import sqrt
+import numpy as np
+
+# Candidate points tried per requested point before placement gives up
+ATTEMPTS_PER_POINT = 30
+
+# With cells of spacing/sqrt(2) every point closer than `spacing` lies in one of these neighbouring cells
+NEIGHBOURS = [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if abs(dx) + abs(dy) < 4]
+
+def scatter(rng, count, spacing, bounds, avoid=(), rejects=None, max_attempts=None):
+    """
+    Place up to `count` random points no closer than `spacing` to each other.
+
+    This is dart-throwing Poisson-disk sampling on a background grid holding at most one
+    point per cell. Candidates are drawn and tested in vectorized batches; inside a batch
+    the earlier candidate wins any conflict, so the result depends only on the seed.
+
+    Parameters:
+    rng (random.Random): The generator the batch seed is drawn from.
+    count (int): The number of points wanted.
+    spacing (float): The minimum distance between any two points.
+    bounds (tuple): Inclusive integer (x0, y0, x1, y1) the points are drawn from.
+    avoid (iterable): Existing (x, y) points, themselves `spacing` apart, to keep clear of.
+    rejects (callable): Optional rejects(xs, ys) -> bool array for extra constraints such as platforms.
+    max_attempts (int): Candidate budget; defaults to ATTEMPTS_PER_POINT per requested point.
+
+    Returns:
+    numpy.ndarray: The placed (x, y) points, fewer than `count` if the budget ran out.
+    """
+    if max_attempts is None:
+        max_attempts = ATTEMPTS_PER_POINT * count
+    generator = np.random.default_rng(rng.getrandbits(64))
+    x0, y0, x1, y1 = bounds
+    if x1 < x0 or y1 < y0:
+        return np.zeros((0, 2), dtype=np.float64)
+    spacing_sq = spacing * spacing
+    cell = spacing / sqrt(2)
+
+    # Occupancy grid padded by two cells on each side so neighbour lookups never go out of range
+    grid = np.full((int((x1 - x0) // cell) + 5, int((y1 - y0) // cell) + 5), -1, dtype=np.int32)
+    avoid = np.array(list(avoid), dtype=np.float64).reshape(-1, 2)
+    points = np.zeros((len(avoid) + count, 2), dtype=np.float64)
+    points[:len(avoid)] = avoid
+    cx, cy = cells_of(avoid, x0, y0, cell)
+    inside = (cx >= 0) & (cx < grid.shape[0]) & (cy >= 0) & (cy < grid.shape[1])
+    grid[cx[inside], cy[inside]] = np.flatnonzero(inside)
+
+    placed = len(avoid)
+    wanted = len(avoid) + count
+    attempts = 0
+    while placed < wanted and attempts < max_attempts:
+        batch = min(max(2 * (wanted - placed), 256), max_attempts - attempts)
+        attempts += batch
+        candidates = np.empty((batch, 2), dtype=np.float64)
+        candidates[:, 0] = generator.integers(x0, x1 + 1, batch)
+        candidates[:, 1] = generator.integers(y0, y1 + 1, batch)
+        cx, cy = cells_of(candidates, x0, y0, cell)
+
+        # Drop candidates too close to points already placed
+        ok = ~crowded(grid, points, candidates, cx, cy, spacing_sq)
+        if rejects is not None and ok.any():
+            ok[ok] = ~rejects(candidates[ok, 0], candidates[ok, 1])
+        keep = np.flatnonzero(ok)
+
+        # Resolve conflicts inside the batch: the lowest-numbered candidate in each cell wins,
+        # and anyone within spacing of a lower-numbered survivor is dropped
+        first = np.full(grid.shape, batch, dtype=np.int32)
+        np.minimum.at(first, (cx[keep], cy[keep]), keep)
+        keep = keep[first[cx[keep], cy[keep]] == keep]
+        survivors = np.full(grid.shape, -1, dtype=np.int32)
+        survivors[cx[keep], cy[keep]] = keep
+        clash = crowded(survivors, candidates, candidates[keep], cx[keep], cy[keep], spacing_sq, before=keep)
+        keep = keep[~clash][:wanted - placed]
+
+        points[placed:placed + len(keep)] = candidates[keep]
+        grid[cx[keep], cy[keep]] = np.arange(placed, placed + len(keep))
+        placed += len(keep)
+    return points[len(avoid):placed]
+
+def cells_of(points, x0, y0, cell):
+    """Return the padded grid cell of each point."""
+    cx = np.floor((points[:, 0] - x0) / cell).astype(np.int64) + 2
+    cy = np.floor((points[:, 1] - y0) / cell).astype(np.int64) + 2
+    return cx, cy
+
+def crowded(grid, points, candidates, cx, cy, spacing_sq, before=None):
+    """Check each candidate against the gridded points in its neighbouring cells, optionally only those numbered below `before`."""
+    flat_grid = grid.ravel()
+    rows = grid.shape[1]
+    flat = cx * rows + cy
+    px, py = points[:, 0], points[:, 1]
+    x, y = candidates[:, 0], candidates[:, 1]
+    hit = np.zeros(len(candidates), dtype=bool)
+    for dx, dy in NEIGHBOURS:
+        index = flat_grid[flat + (dx * rows + dy)]
+        present = index >= 0
+        if before is not None:
+            present &= index < before
+        # Empty cells index the last point; the result is masked out by `present`
+        hit |= present & ((px[index] - x) ** 2 + (py[index] - y) ** 2 < spacing_sq)
+    return hit
@@ -0,0 +1,185 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import numpy as np
+
+def triangle_wave(tick, distance, period, half, sign):
+    """
+    Evaluate platform motion at a tick: rising one pixel per tick from 0 to `distance`,
+    falling to -`distance` and rising back, with a period of 4 * `distance` ticks.
+
+    Parameters:
+    tick (int): Ticks simulated since the world started.
+    distance, period, half, sign (numpy.ndarray): Per-platform arrays from PlatformStore.wave_parameters.
+
+    Returns:
+    tuple: (offset at the tick, offset change over the tick), as arrays.
+    """
+    phase = (tick + distance) % period
+    offset = sign * (distance - np.abs(phase - half))
+    # The wave rises over phases 1 to 2 * distance and falls over the rest, including phase 0
+    step = np.where((phase - 1) % period < half, sign, -sign)
+    return offset, step
+
+class PlatformStore:
+    def __init__(self, records=None, capacity=64):
+        """
+        Hold platforms in contiguous per-field arrays with reusable slots.
+
+        Parameters:
+        records (numpy.ndarray): Optional levels.PLATFORM_RECORD array to add straight away.
+        capacity (int): Initial number of slots.
+        """
+        if records is not None:
+            capacity = max(capacity, len(records))
+        self.position = np.zeros((capacity, 2), dtype=np.int32)
+        self.size = np.zeros((capacity, 2), dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.float32)
+        self.base_x = np.zeros(capacity, dtype=np.int32)     # Position in the level file, the centre of the motion
+        self.direction = np.ones(capacity, dtype=np.int8)    # Direction of the first move: 1 right, anything else left
+        self.move_offset = np.zeros(capacity, dtype=np.int32)
+        self.move_distance = np.zeros(capacity, dtype=np.int32)
+        self.velocity = np.zeros(capacity, dtype=np.int8)
+        self.move_step = np.zeros(capacity, dtype=np.int8)  # 1 for moving platforms, 0 for static or free slots
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.record = np.full(capacity, -1, dtype=np.int64)  # Index of the level record in each slot, -1 if free or not given
+        self.count = 0   # Slots in use or freed; everything past this is untouched
+        self.free = []   # Freed slots below count, reused before growing
+        self.moving = np.zeros(0, dtype=np.int64)
+        self.moving_wave = self.wave_parameters(self.moving)  # Cached for update()
+        if records is not None:
+            self.add(records)
+
+    def __len__(self):
+        """Return the number of live platforms."""
+        return self.count - len(self.free)
+
+    def live(self):
+        """Return the slots of live platforms in ascending order."""
+        return np.flatnonzero(self.alive[:self.count])
+
+    def grow(self, capacity):
+        """Reallocate every field array to hold at least `capacity` slots."""
+        for name in ('position', 'size', 'color', 'base_x', 'direction', 'move_offset', 'move_distance', 'velocity', 'move_step', 'alive', 'record'):
+            old = getattr(self, name)
+            new = np.full((capacity,) + old.shape[1:], -1 if name == 'record' else 0, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, records, tick=0, indices=None):
+        """
+        Add platforms, reusing freed slots first.
+
+        Parameters:
+        records (numpy.ndarray): A levels.PLATFORM_RECORD array.
+        tick (int): Current tick; moving platforms are placed where they are at that tick.
+        indices (list): Optional index of each record in its level, kept in self.record.
+
+        Returns:
+        numpy.ndarray: The slot given to each record.
+        """
+        reused = min(len(self.free), len(records))
+        slots = np.empty(len(records), dtype=np.int64)
+        slots[:reused] = [self.free.pop() for _ in range(reused)]
+        fresh = len(records) - reused
+        if self.count + fresh > len(self.alive):
+            self.grow(max(2 * len(self.alive), self.count + fresh))
+        slots[reused:] = np.arange(self.count, self.count + fresh)
+        self.count += fresh
+        self.fill(slots, records, tick)
+        if indices is not None:
+            self.record[slots] = indices
+        return slots
+
+    def fill(self, slots, records, tick):
+        """Put records into slots, placing moving platforms where they are at a tick."""
+        self.base_x[slots] = records['x']
+        self.position[slots, 1] = records['y']
+        self.size[slots, 0] = records['w']
+        self.size[slots, 1] = records['h']
+        self.color[slots] = records['color']
+        self.direction[slots] = records['direction']
+        self.move_distance[slots] = records['move_distance']
+        # A platform with no distance to move is static, whatever its move flag says
+        self.move_step[slots] = (records['move'] != 0) & (records['move_distance'] > 0)
+        self.alive[slots] = True
+        self.find_moving()
+        self.place(slots, tick)
+
+    def rebuild(self, records, slots, count, free, tick):
+        """
+        Replace every platform, putting each record into a given slot; used to restore a snapshot.
+
+        Parameters:
+        records (numpy.ndarray): A levels.PLATFORM_RECORD array.
+        slots (numpy.ndarray): The slot for each record.
+        count (int): Slots in use or freed.
+        free (list): Freed slots below count, in the order they will be reused.
+        tick (int): Current tick.
+        """
+        if count > len(self.alive):
+            self.grow(max(count, 2 * len(self.alive)))
+        self.alive[:] = False
+        self.move_step[:] = 0
+        self.velocity[:] = 0
+        self.record[:] = -1
+        self.count = count
+        self.free = list(free)
+        self.fill(slots, records, tick)
+
+    def remove(self, slots):
+        """Free platform slots for reuse."""
+        slots = np.asarray(slots, dtype=np.int64)
+        self.alive[slots] = False
+        self.move_step[slots] = 0
+        self.velocity[slots] = 0
+        self.record[slots] = -1
+        self.free.extend(slots.tolist())
+        self.find_moving()
+
+    def find_moving(self):
+        """Refresh the moving slots and the wave parameters update() uses for them."""
+        self.moving = np.flatnonzero(self.move_step[:self.count])
+        self.moving_wave = self.wave_parameters(self.moving)
+
+    def offsets_at(self, tick, slots):
+        """
+        Get how far platforms are from their level position at a tick, in O(1) per platform.
+
+        A moving platform travels one pixel per tick, starting in its direction, and turns
+        round at move_distance either side of its level position: a triangle wave with a
+        period of 4 * move_distance ticks.
+
+        Parameters:
+        tick (int): Ticks simulated since the world started.
+        slots (numpy.ndarray): Platform slots.
+
+        Returns:
+        numpy.ndarray: Horizontal offset of each platform in pixels; 0 for static ones.
+        """
+        return triangle_wave(tick, *self.wave_parameters(slots))[0]
+
+    def wave_parameters(self, slots):
+        """Return the (distance, period, half period, sign) arrays triangle_wave takes for some slots."""
+        distance = self.move_distance[slots].astype(np.int64)
+        sign = np.where(self.direction[slots] == 1, 1, -1) * self.move_step[slots]
+        return distance, np.maximum(4 * distance, 1), 2 * distance, sign
+
+    def place(self, slots, tick, wave=None):
+        """Put platforms where they are at a tick, with the velocity of their last move."""
+        offset, step = triangle_wave(tick, *(wave if wave is not None else self.wave_parameters(slots)))
+        self.move_offset[slots] = offset
+        self.position[slots, 0] = self.base_x[slots] + offset
+        self.velocity[slots] = step if tick > 0 else 0  # Nothing has moved before the first tick
+
+    def update(self, tick):
+        """
+        Move every moving platform to its position at a tick.
+
+        The position depends only on the tick, so ticks can be skipped or repeated.
+
+        Returns:
+        numpy.ndarray: Slots of the moving platforms.
+        """
+        self.place(self.moving, tick, self.moving_wave)
+        return self.moving
@@ -0,0 +1,98 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import numpy as np
+
+class CirclePool:
+    def __init__(self, positions, size, color, chunk=0):
+        """
+        Hold same-sized circles (coins or obstacles) in dense arrays.
+
+        Parameters:
+        positions (list): (x, y) centre of each circle.
+        size (float): The radius shared by every circle in the pool.
+        color (tuple): The RGB color shared by every circle in the pool.
+        chunk (int): The level chunk the initial circles belong to.
+        """
+        self.position = np.zeros((0, 2), dtype=np.float64)
+        self.ids = np.zeros(0, dtype=np.int32)      # Index of each circle within its chunk
+        self.chunks = np.zeros(0, dtype=np.int32)   # Level chunk each circle belongs to
+        self.count = 0
+        self.size = size
+        self.color = color
+        self.add(positions, chunk)
+
+    def __len__(self):
+        """Return the number of live circles."""
+        return self.count
+
+    def live(self):
+        """Return a view of the live circle positions."""
+        return self.position[:self.count]
+
+    def add(self, positions, chunk, ids=None):
+        """Append circles belonging to `chunk`, numbered 0..n-1 unless `ids` is given."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if ids is None:
+            ids = np.arange(len(positions))
+        end = self.count + len(positions)
+        self.reserve(end)
+        self.position[self.count:end] = positions
+        self.ids[self.count:end] = ids
+        self.chunks[self.count:end] = chunk
+        self.count = end
+
+    def reserve(self, capacity):
+        """Grow the arrays, keeping the live circles, until they hold at least `capacity` circles."""
+        if capacity <= len(self.position):
+            return
+        capacity = max(capacity, 2 * len(self.position))
+        for name in ('position', 'ids', 'chunks'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def replace(self, positions, ids, chunks):
+        """Replace every circle with the given ones, in order; used to restore a snapshot."""
+        self.count = 0
+        self.reserve(len(positions))
+        self.position[:len(positions)] = positions
+        self.ids[:len(positions)] = ids
+        self.chunks[:len(positions)] = chunks
+        self.count = len(positions)
+
+    def drop_chunk(self, chunk):
+        """Remove every circle belonging to `chunk`, keeping the rest in order."""
+        keep = np.flatnonzero(self.chunks[:self.count] != chunk)
+        for name in ('position', 'ids', 'chunks'):
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def clear(self):
+        """Remove every circle."""
+        self.count = 0
+
+    def hits(self, x, y, radius):
+        """Return the slots of live circles touching a circle of `radius` at (x, y)."""
+        live = self.live()
+        dx = live[:, 0] - x
+        dy = live[:, 1] - y
+        return np.flatnonzero(dx * dx + dy * dy <= (self.size + radius) ** 2)
+
+    def in_rect(self, x, y, w, h):
+        """Return the slots of live circles overlapping a rectangle's bounding box."""
+        live = self.live()
+        r = self.size
+        return np.flatnonzero((live[:, 0] + r >= x) & (live[:, 0] - r <= x + w) & (live[:, 1] + r >= y) & (live[:, 1] - r <= y + h))
+
+    def retire(self, slots):
+        """Remove circles by swapping the last live circle into each freed slot."""
+        # Highest slot first so a swapped-in circle is never one still waiting to be removed
+        for slot in sorted(slots, reverse=True):
+            last = self.count - 1
+            self.position[slot] = self.position[last]
+            self.ids[slot] = self.ids[last]
+            self.chunks[slot] = self.chunks[last]
+            self.count = last
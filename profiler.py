@@ -0,0 +1,91 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import time
+from contextlib import contextmanager
+import numpy as np
+
+# Phases of a frame timed by the profiler, in the order App.main_loop runs them
+FRAME_PHASES = ('pace', 'events', 'physics', 'render', 'swap')
+# Number of recent frames kept in the ring buffer
+PROFILE_FRAMES = 600
+
+class FrameProfiler:
+    def __init__(self, phases=FRAME_PHASES, size=PROFILE_FRAMES):
+        """Initialize a ring buffer of per-phase frame times, in seconds."""
+        self.phases = phases
+        self.columns = {name: i for i, name in enumerate(phases)}
+        self.times = np.zeros((size, len(phases) + 1))  # Last column is the whole frame
+        self.frame_numbers = np.zeros(size, dtype=np.int64)
+        self.frames = 0  # Frames recorded since start
+        self.current = np.zeros(len(phases) + 1)
+        self.frame_start = None
+
+    def begin_frame(self):
+        """Start timing a frame, discarding any frame begun but never ended."""
+        self.current[:] = 0
+        self.frame_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a with-block as part of the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[self.columns[name]] += time.perf_counter() - start
+
+    def end_frame(self):
+        """Store the frame just timed in the ring buffer."""
+        if self.frame_start is None:
+            return
+        self.current[-1] = time.perf_counter() - self.frame_start
+        row = self.frames % len(self.times)
+        self.times[row] = self.current
+        self.frame_numbers[row] = self.frames
+        self.frames += 1
+        self.frame_start = None
+
+    def recent(self):
+        """Return the buffered rows and frame numbers, oldest first."""
+        size = len(self.times)
+        if self.frames <= size:
+            return self.times[:self.frames], self.frame_numbers[:self.frames]
+        order = np.roll(np.arange(size), -(self.frames % size))
+        return self.times[order], self.frame_numbers[order]
+
+    def stats(self):
+        """
+        Summarize the buffered frames.
+
+        Returns:
+        dict: fps, p50 and p99 frame time in ms, and mean ms per phase; empty before the first frame.
+        """
+        times, _ = self.recent()
+        if not len(times):
+            return {}
+        frame = times[:, -1]
+        mean = frame.mean()
+        return {
+            'fps': 1.0 / mean if mean > 0 else 0.0,
+            'p50': float(np.percentile(frame, 50)) * 1000,
+            'p99': float(np.percentile(frame, 99)) * 1000,
+            'phases': {name: float(times[:, i].mean()) * 1000 for name, i in self.columns.items()},
+        }
+
+    def overlay_lines(self):
+        """Return the lines of text shown by the on-screen performance overlay."""
+        stats = self.stats()
+        if not stats:
+            return ["No frames yet"]
+        lines = [f"FPS: {stats['fps']:.0f}", f"P50: {stats['p50']:.2f} MS", f"P99: {stats['p99']:.2f} MS"]
+        lines += [f"{name}: {ms:.2f} MS" for name, ms in stats['phases'].items()]
+        return lines
+
+    def export_csv(self, filename):
+        """Write the buffered frames, oldest first, as CSV with one column per phase in milliseconds."""
+        times, numbers = self.recent()
+        with open(filename, 'w') as file:
+            file.write(','.join(('frame',) + tuple(f"{name}_ms" for name in self.phases) + ('total_ms',)) + '\n')
+            for number, row in zip(numbers.tolist(), (times * 1000).tolist()):
+                file.write(f"{number}," + ','.join(f"{value:.4f}" for value in row) + '\n')
@@ -0,0 +1,267 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import sys
+import time
+from collections import deque
+import numpy as np
+from levels import load_level
+from spatial import SpatialHash
+from world import CHAR_RADIUS, MOVE_SPEED, JUMP_VELOCITY, GRAVITY, MAX_FALL_SPEED, SPAWN_X, SPAWN_Y
+
+# Grid cell size for the platform index; queries here span whole jump arcs, so cells are coarser than the world's
+REACH_CELL_SIZE = 256
+# Arcs are simulated until they have dropped this far below their start
+MAX_DROP = 4096
+
+_arcs = {}
+
+class JumpArc:
+    def __init__(self, rise, move_speed):
+        """
+        The height reached on each tick of a jump or fall, and how far sideways the character can get meanwhile.
+
+        Parameters:
+        rise (numpy.ndarray): Height above the starting point after each tick, starting with 0 at tick 0.
+        move_speed (float): Horizontal pixels per tick.
+        """
+        self.rise = rise
+        self.move_speed = move_speed
+        self.peak = int(np.argmax(rise))
+        self.ascent = rise[:self.peak + 1]      # Non-decreasing
+        self.descent = -rise[self.peak:]        # Non-decreasing once negated
+
+    def max_rise(self):
+        """Return the highest point of the arc above its start."""
+        return float(self.rise[self.peak])
+
+    def window(self, heights):
+        """
+        Find when the arc is at or above each height.
+
+        Parameters:
+        heights (numpy.ndarray): Heights above the start.
+
+        Returns:
+        tuple: (first, last) tick arrays; first > last where the arc never gets that high.
+        """
+        first = np.searchsorted(self.ascent, heights, 'left')
+        last = self.peak + np.searchsorted(self.descent, -np.asarray(heights), 'right') - 1
+        return first, last
+
+def jump_arc(jump_velocity=JUMP_VELOCITY, gravity=GRAVITY, max_fall_speed=MAX_FALL_SPEED, move_speed=MOVE_SPEED):
+    """
+    Get the arc of a jump (or, with jump_velocity 0, of walking off a ledge), simulated once per configuration.
+
+    The update rules and their floating point order match World.apply_physics.
+    """
+    key = (jump_velocity, gravity, max_fall_speed, move_speed)
+    arc = _arcs.get(key)
+    if arc is None:
+        y = 0.0
+        velocity = jump_velocity
+        jumping = jump_velocity > 0
+        fall_speed = 0
+        heights = [0.0]
+        while y < MAX_DROP:
+            if jumping:
+                y -= velocity
+                velocity -= gravity
+                if velocity <= 0:
+                    jumping = False
+                    fall_speed = 0
+            else:
+                fall_speed += gravity
+                if fall_speed > max_fall_speed:
+                    fall_speed = max_fall_speed
+                y += fall_speed
+            heights.append(-y)
+        arc = _arcs[key] = JumpArc(np.array(heights), move_speed)
+    return arc
+
+class ReachabilityGraph:
+    def __init__(self, records, radius=CHAR_RADIUS, spawn=(SPAWN_X, SPAWN_Y), **physics):
+        """
+        Work out which platforms can be reached from which, and whether the goal can be reached at all.
+
+        The test is optimistic: arcs are not blocked by platforms in the way, and moving platforms
+        count as covering their whole range. So a level found unsolvable really is, while a solvable
+        verdict can still miss a blocked arc.
+
+        Parameters:
+        records (numpy.ndarray): A levels.PLATFORM_RECORD array; the last record is the goal.
+        radius (int): The character's radius.
+        spawn (tuple): The character's starting centre.
+        physics: Optional jump_velocity, gravity, max_fall_speed and move_speed overrides for jump_arc.
+        """
+        self.records = records
+        self.radius = radius
+        self.spawn = spawn
+        self.goal = len(records) - 1
+        self.jump = jump_arc(**physics)
+        self.fall = jump_arc(**dict(physics, jump_velocity=0))
+
+        # Platform extents, widened by the reach of moving platforms
+        x = np.asarray(records['x'], dtype=np.float64)
+        reach = np.where(records['move'] != 0, np.abs(np.asarray(records['move_distance'], dtype=np.float64)) + 1, 0)
+        self.left = x - reach
+        self.right = x + records['w'] + reach
+        self.top = np.asarray(records['y'], dtype=np.float64)
+        self.bottom = self.top + records['h']
+        self.level_bottom = float(self.bottom.max()) if len(records) else 0.0
+
+        self.grid = SpatialHash(REACH_CELL_SIZE)
+        for index, (left, top, right, bottom) in enumerate(zip(self.left.tolist(), self.top.tolist(), self.right.tolist(), self.bottom.tolist())):
+            self.grid.insert(index, left, top, right - left, bottom - top)
+
+        _, self.start = self.landings(self.fall, np.array([float(spawn[0])]), np.array([float(spawn[0])]),
+                                      np.array([float(spawn[1] + radius)]), exclude=np.array([-1]))
+        sources, self.targets = self.landings(self.jump, self.left, self.right, self.top, exclude=np.arange(len(records)))
+        # Sources come out grouped in ascending order, so their counts give CSR offsets into targets
+        self.offsets = np.zeros(len(records) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(np.bincount(sources, minlength=len(records)))
+        self.touches_goal = self.goal_touches()
+
+    def landings(self, arc, left, right, feet, exclude):
+        """
+        Find the platforms an arc can land on, for many take-off ranges at once.
+
+        Parameters:
+        arc (JumpArc): The jump or fall taken.
+        left (numpy.ndarray): Leftmost centre the character can take off from, per take-off.
+        right (numpy.ndarray): Rightmost centre the character can take off from, per take-off.
+        feet (numpy.ndarray): The y of the character's feet at take-off.
+        exclude (numpy.ndarray): A platform to leave out per take-off, normally the one taken off from.
+
+        Returns:
+        tuple: (take-off index, platform index) arrays, one entry per possible landing, grouped by take-off.
+        """
+        # Sideways reach is largest for the deepest drop in the level, which bounds each spatial query
+        _, last = arc.window(feet - self.level_bottom)
+        span = arc.move_speed * np.maximum(last, 0) + self.radius
+        top = feet - arc.max_rise() - self.radius
+        counts = []
+        found = []
+        for x0, x1, y0 in zip((left - span).tolist(), (right + span).tolist(), top.tolist()):
+            candidates = self.grid.query(x0, y0, x1 - x0, self.level_bottom - y0 + 1)
+            counts.append(len(candidates))
+            found.extend(candidates)
+        sources = np.repeat(np.arange(len(left)), counts)
+        candidates = np.array(found, dtype=np.int64)
+        keep = candidates != exclude[sources]
+        sources, candidates = sources[keep], candidates[keep]
+        left, right, feet = left[sources], right[sources], feet[sources]
+
+        # The centre must get level with the platform's top before it can move over it
+        first, last = arc.window(feet - self.radius - self.top[candidates])
+        gap = np.maximum(np.maximum(self.left[candidates] - right, left - self.right[candidates]), 0)
+        travel = arc.move_speed * last
+        ok = (first <= last) & (travel >= gap + 1) & (arc.move_speed * (last - first) >= np.minimum(gap, self.radius) + 1)
+        # A higher platform that covers the take-off range completely can only be hit from underneath
+        covered = (self.left[candidates] <= left) & (self.right[candidates] >= right) & (self.top[candidates] < feet - self.radius)
+        ok &= ~covered
+        return sources[ok], candidates[ok]
+
+    def goal_touches(self):
+        """Return a boolean array: True where a jump from that platform can touch the goal."""
+        touches = np.zeros(len(self.records), dtype=bool)
+        if not len(self.records):
+            return touches  # No goal at all, so nothing can touch it
+        goal = self.records[self.goal]
+        gx, gy, gw, gh = (float(goal[field]) for field in ('x', 'y', 'w', 'h'))
+        r = self.radius
+        # The centre must be within r of the goal's top or bottom edge band and its right edge over the goal
+        near = np.array(self.grid.query(gx - r - MAX_DROP, gy - self.jump.max_rise() - 2 * r, gw + 2 * MAX_DROP, self.level_bottom), dtype=np.int64)
+        near = near[near != self.goal]
+        if not len(near):
+            return touches
+        center = self.top[near] - r
+        low = center - (gy + gh + r)      # Rise needed to get the centre up to the goal's lower band
+        high = center - (gy - r)          # Rise beyond which the centre has passed above it
+        gap = np.maximum(np.maximum((gx - r) - self.right[near], self.left[near] - (gx + gw - r)), 0)
+        ticks = np.arange(len(self.jump.rise))
+        rise = self.jump.rise[None, :]
+        reach = (rise >= low[:, None]) & (rise <= high[:, None]) & (self.jump.move_speed * ticks[None, :] >= gap[:, None])
+        touches[near] = reach.any(axis=1)
+        return touches
+
+    def neighbours(self, index):
+        """Return the platforms reachable in one jump from a platform."""
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def route(self, start=None, blocked=()):
+        """
+        Find a route from the spawn point to the goal using the fewest jumps.
+
+        The goal is reached by landing on it or by touching it during a jump.
+
+        Parameters:
+        start (iterable): Platforms to start from, instead of the ones the spawn point falls onto.
+        blocked (set): (from, to) pairs of platform indices whose jumps are left out; `to` may be the goal.
+
+        Returns:
+        list: Record indices of the platforms stood on before the goal, in order (empty if the spawn
+        point falls onto the goal), or None if the goal cannot be reached.
+        """
+        previous = np.full(len(self.records), -2, dtype=np.int64)   # -2 unvisited, -1 reached straight from spawn
+        queue = deque()
+        for index in (self.start.tolist() if start is None else start):
+            previous[index] = -1
+            queue.append(index)
+        while queue:
+            index = queue.popleft()
+            if index == self.goal or (self.touches_goal[index] and (index, self.goal) not in blocked):
+                path = [index]
+                while previous[path[-1]] >= 0:
+                    path.append(int(previous[path[-1]]))
+                path.reverse()
+                return path[:-1] if index == self.goal else path
+            for target in self.neighbours(index).tolist():
+                if previous[target] == -2 and (index, target) not in blocked:
+                    previous[target] = index
+                    queue.append(target)
+        return None
+
+    def reachable(self):
+        """Return the indices of every platform that can be reached from the spawn point."""
+        seen = np.zeros(len(self.records), dtype=bool)
+        seen[self.start] = True
+        queue = deque(self.start.tolist())
+        while queue:
+            for target in self.neighbours(queue.popleft()).tolist():
+                if not seen[target]:
+                    seen[target] = True
+                    queue.append(target)
+        return np.flatnonzero(seen)
+
+    def solvable(self):
+        """Check whether the goal can be reached."""
+        return self.route() is not None
+
+def main(argv=None):
+    """Report whether level files can be completed and the shortest route through each."""
+    parser = argparse.ArgumentParser(description="Check that levels can be completed with the game's jump physics.")
+    parser.add_argument('levels', nargs='+', help="platform CSV files")
+    args = parser.parse_args(argv)
+
+    unsolvable = 0
+    for filename in args.levels:
+        records = load_level(filename)
+        start = time.perf_counter()
+        graph = ReachabilityGraph(records)
+        route = graph.route()
+        elapsed = time.perf_counter() - start
+        print(f"{filename}: {len(records)} platforms, {len(graph.targets)} jumps, analysed in {elapsed:.2f} s")
+        if route is None:
+            unsolvable += 1
+            reached = graph.reachable()
+            highest = min(reached.tolist(), key=lambda index: graph.top[index]) if len(reached) else None
+            print(f"  UNSOLVABLE: {len(reached)} platforms reachable"
+                  + (f", highest is #{highest} at y={int(graph.top[highest])}" if highest is not None else ""))
+        else:
+            print(f"  Solvable in {len(route)} jumps: " + " -> ".join([f"#{index}" for index in route] + ["goal"]))
+    return 1 if unsolvable else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
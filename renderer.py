@@ -0,0 +1,117 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+from math import pi
+import numpy as np
+from gfx import get_backend
+
+# Circle segment counts are picked from these buckets by on-screen radius
+CIRCLE_SEGMENTS = (8, 16, 32, 64)
+# Target length in pixels of one circle segment
+SEGMENT_LENGTH = 4
+
+_unit_circles = {}
+
+def get_unit_circle(segments):
+    """
+    Get the precomputed unit circle for a segment count, closed so point `segments` equals point 0.
+
+    Parameters:
+    segments (int): The number of segments.
+
+    Returns:
+    numpy.ndarray: A (segments + 1, 2) float32 array of (cos, sin) pairs.
+    """
+    table = _unit_circles.get(segments)
+    if table is None:
+        angles = np.arange(segments + 1) * (2 * pi / segments)
+        table = np.stack([np.cos(angles), np.sin(angles)], axis=1).astype(np.float32)
+        _unit_circles[segments] = table
+    return table
+
+def segments_for_radius(radii):
+    """Pick the smallest segment bucket that keeps segments near SEGMENT_LENGTH pixels for each radius."""
+    wanted = 2 * pi * np.asarray(radii, dtype=np.float32) / SEGMENT_LENGTH
+    buckets = np.array(CIRCLE_SEGMENTS)
+    return buckets[np.minimum(np.searchsorted(buckets, wanted), len(buckets) - 1)]
+
+def build_rects(positions, sizes, colors):
+    """
+    Build quad geometry for axis-aligned rectangles.
+
+    Parameters:
+    positions (numpy.ndarray): (n, 2) top-left corners.
+    sizes (numpy.ndarray): (n, 2) widths and heights.
+    colors (numpy.ndarray): (n, 3) RGB colors.
+
+    Returns:
+    tuple: (vertices, colors) as (4n, 2) and (4n, 3) float32 arrays.
+    """
+    x0 = np.asarray(positions, dtype=np.float32)
+    x1 = x0 + np.asarray(sizes, dtype=np.float32)
+    vertices = np.empty((len(x0), 4, 2), dtype=np.float32)
+    vertices[:, 0] = x0
+    vertices[:, 1, 0], vertices[:, 1, 1] = x1[:, 0], x0[:, 1]
+    vertices[:, 2] = x1
+    vertices[:, 3, 0], vertices[:, 3, 1] = x0[:, 0], x1[:, 1]
+    colors = np.repeat(np.asarray(colors, dtype=np.float32)[:, None, :], 4, axis=1)
+    return vertices.reshape(-1, 2), colors.reshape(-1, 3)
+
+def build_circles(centers, radii, colors):
+    """
+    Build triangle geometry for filled circles, one fan of triangles per circle.
+
+    Parameters:
+    centers (numpy.ndarray): (n, 2) circle centres.
+    radii (numpy.ndarray): (n,) radii.
+    colors (numpy.ndarray): (n, 3) RGB colors.
+
+    Returns:
+    tuple: (vertices, colors) as float32 arrays with three vertices per triangle.
+    """
+    centers = np.asarray(centers, dtype=np.float32).reshape(-1, 2)
+    radii = np.asarray(radii, dtype=np.float32)
+    colors = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+    segments = segments_for_radius(radii)
+    vertex_parts, color_parts = [], []
+    for count in np.unique(segments).tolist():
+        index = np.flatnonzero(segments == count)
+        rim = centers[index, None, :] + radii[index, None, None] * get_unit_circle(count)[None, :, :]
+        triangles = np.empty((len(index), count, 3, 2), dtype=np.float32)
+        triangles[:, :, 0] = centers[index, None, :]
+        triangles[:, :, 1] = rim[:, :-1]
+        triangles[:, :, 2] = rim[:, 1:]
+        vertex_parts.append(triangles.reshape(-1, 2))
+        color_parts.append(np.repeat(colors[index], count * 3, axis=0))
+    if not vertex_parts:
+        return np.zeros((0, 2), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+    return np.concatenate(vertex_parts), np.concatenate(color_parts)
+
+class BatchRenderer:
+    def __init__(self):
+        """Initialize the per-frame batches of rectangles and circles."""
+        self.rects = []
+        self.circles = []
+        self.draw_calls = 0
+
+    def add_rects(self, positions, sizes, colors):
+        """Queue rectangles for the next flush."""
+        self.rects.append((positions, sizes, colors))
+
+    def add_circles(self, centers, radii, colors):
+        """Queue circles for the next flush."""
+        self.circles.append((centers, radii, colors))
+
+    def flush(self):
+        """Draw every queued rectangle in one call, then every queued circle in one more."""
+        self.draw_calls = 0
+        for batch, build, mode in ((self.rects, build_rects, 'quads'), (self.circles, build_circles, 'triangles')):
+            if not batch:
+                continue
+            built = [build(*entry) for entry in batch]
+            vertices = np.concatenate([vertices for vertices, _ in built])
+            colors = np.concatenate([colors for _, colors in built])
+            if len(vertices):
+                get_backend().draw_arrays(mode, vertices, colors)
+                self.draw_calls += 1
+            batch.clear()
@@ -0,0 +1,232 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import contextlib
+import hashlib
+import io
+import struct
+import sys
+import time
+import numpy as np
+from generator import ENDLESS_LEVEL, ProceduralWorld
+from levels import records_digest
+from world import World
+
+REPLAY_MAGIC = b'PXRP'
+REPLAY_FORMAT_VERSION = 3  # 2: moving platforms follow the world tick; 3: objects keep clear of platforms' whole motion
+REPLAY_HEADER = struct.Struct('<4sHHQI20s20s')  # magic, version, reserved, seed, ticks, level digest, final state digest
+# Character and flag state hashed by state_digest, in this order
+STATE_FORMAT = struct.Struct('<dddddddq????qqq')
+
+def state_digest(world):
+    """
+    Hash everything that decides how a world plays out from here on.
+
+    Parameters:
+    world (World): The world to hash.
+
+    Returns:
+    bytes: A 20-byte SHA-1 digest; equal digests mean bit-identical state.
+    """
+    digest = hashlib.sha1()
+    digest.update(STATE_FORMAT.pack(
+        world.char_x, world.char_y, world.prev_char_x, world.prev_char_y, world.fall_speed, world.jump_velocity,
+        world.platform_velocity, world.score, world.is_jumping, world.is_on_platform, world.game_won, world.game_lost,
+        world.generation, -1 if world.current_platform is None else world.current_platform, world.tick))
+    digest.update(np.array(world.loaded_chunks, dtype=np.int64).tobytes())
+    digest.update(np.array(sorted((index, slot, uses) for index, (slot, uses) in world.platform_slots.items()), dtype=np.int64).tobytes())
+    platforms = world.platforms
+    live = platforms.live()
+    for array in (platforms.position, platforms.move_offset, platforms.velocity):
+        digest.update(array[live].tobytes())
+    for pool in (world.obstacles, world.coins):
+        digest.update(pool.position[:pool.count].tobytes())
+        digest.update(pool.ids[:pool.count].tobytes())
+        digest.update(pool.chunks[:pool.count].tobytes())
+    digest.update(repr(sorted((chunk, sorted(ids)) for chunk, ids in world.collected.items())).encode())
+    return digest.digest()
+
+def encode_runs(inputs):
+    """Run-length encode per-tick input bitmasks as (mask byte, LEB128 run length) pairs."""
+    encoded = bytearray()
+    start = 0
+    while start < len(inputs):
+        mask = inputs[start]
+        end = start + 1
+        while end < len(inputs) and inputs[end] == mask:
+            end += 1
+        encoded.append(mask)
+        run = end - start
+        while run >= 0x80:
+            encoded.append(run & 0x7F | 0x80)
+            run >>= 7
+        encoded.append(run)
+        start = end
+    return bytes(encoded)
+
+def decode_runs(data, offset=0):
+    """Expand encode_runs output, starting at `offset`, back into a bytearray of per-tick masks."""
+    inputs = bytearray()
+    while offset < len(data):
+        mask = data[offset]
+        offset += 1
+        run = shift = 0
+        while True:
+            if offset >= len(data):
+                raise ValueError("truncated input run")
+            byte = data[offset]
+            offset += 1
+            run |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        inputs += bytes((mask,)) * run
+    return inputs
+
+def pack_string(text):
+    """Encode a string with a 2-byte length prefix."""
+    raw = text.encode('utf-8')
+    return struct.pack('<H', len(raw)) + raw
+
+def unpack_string(data, offset):
+    """Decode a pack_string string, returning it and the offset just past it."""
+    (length,) = struct.unpack_from('<H', data, offset)
+    offset += 2
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+class Recording:
+    def __init__(self, level, level_file, level_digest, seed, inputs=b'', final_digest=bytes(20)):
+        """
+        A recorded session: what world it ran in and the input bitmask of every tick.
+
+        Parameters:
+        level (str): The difficulty level name the world was created with.
+        level_file (str): The platform file the world loaded.
+        level_digest (bytes): levels.records_digest of the loaded platforms.
+        seed (int): The world's object placement seed.
+        inputs (bytes): One KEY_* bitmask per tick.
+        final_digest (bytes): state_digest of the world after the last tick.
+        """
+        self.level = level
+        self.level_file = level_file
+        self.level_digest = level_digest
+        self.seed = seed
+        self.inputs = bytearray(inputs)
+        self.final_digest = final_digest
+
+    def __len__(self):
+        """Return the number of recorded ticks."""
+        return len(self.inputs)
+
+    def save(self, filename):
+        """Write the recording to a file."""
+        header = REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_FORMAT_VERSION, 0, self.seed, len(self.inputs),
+                                    self.level_digest, self.final_digest)
+        with open(filename, 'wb') as file:
+            file.write(header + pack_string(self.level) + pack_string(self.level_file) + encode_runs(self.inputs))
+
+    @classmethod
+    def load(cls, filename):
+        """Read a recording written by save, raising ValueError if the file is not one."""
+        with open(filename, 'rb') as file:
+            data = file.read()
+        if len(data) < REPLAY_HEADER.size:
+            raise ValueError(f"{filename}: not a replay file")
+        magic, version, _, seed, ticks, level_digest, final_digest = REPLAY_HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"{filename}: not a replay file")
+        if version != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"{filename}: unsupported replay format version {version}")
+        level, offset = unpack_string(data, REPLAY_HEADER.size)
+        level_file, offset = unpack_string(data, offset)
+        inputs = decode_runs(data, offset)
+        if len(inputs) != ticks:
+            raise ValueError(f"{filename}: expected {ticks} ticks of input, found {len(inputs)}")
+        return cls(level, level_file, level_digest, seed, inputs, final_digest)
+
+class InputRecorder:
+    def __init__(self, world):
+        """Start recording a freshly created world; every tick must then go through record()."""
+        self.world = world
+        self.recording = Recording(world.level, world.level_file, records_digest(world.level_records), world.seed)
+
+    def record(self, keys):
+        """Store the input bitmask of the tick about to run."""
+        self.recording.inputs.append(keys)
+
+    def truncate(self, ticks):
+        """Forget the inputs after the first `ticks`, when the world has been rewound to that tick."""
+        del self.recording.inputs[ticks:]
+
+    def finish(self):
+        """Stamp the world's current state onto the recording and return it."""
+        self.recording.final_digest = state_digest(self.world)
+        return self.recording
+
+class Playback:
+    def __init__(self, recording):
+        """Feed a recording's inputs back one tick at a time."""
+        self.recording = recording
+        self.position = 0
+
+    def done(self):
+        """Check whether every recorded tick has been played."""
+        return self.position >= len(self.recording.inputs)
+
+    def next_keys(self):
+        """Return the next tick's input bitmask."""
+        keys = self.recording.inputs[self.position]
+        self.position += 1
+        return keys
+
+def open_world(recording, level_file=None, world_class=World):
+    """
+    Create the world a recording was made in.
+
+    Parameters:
+    recording (Recording): The recording to match.
+    level_file (str): Optional path to load instead of the recorded one, e.g. after moving the file.
+    world_class (type): World or a subclass such as game.Game.
+
+    Returns:
+    World: A new world with the recorded level and seed.
+    """
+    world = world_class(recording.level, recording.seed, level_file or recording.level_file)
+    if records_digest(world.level_records) != recording.level_digest:
+        raise ValueError(f"{world.level_file} is not the level this recording was made on")
+    return world
+
+def replay(recording, level_file=None):
+    """
+    Run a recording headless as fast as possible.
+
+    Returns:
+    World: The world after the last recorded tick.
+    """
+    world = open_world(recording, level_file, ProceduralWorld if recording.level == ENDLESS_LEVEL else World)
+    with contextlib.redirect_stdout(io.StringIO()):  # Score and game over messages
+        world.run(recording.inputs, stop_when_done=False)
+    world.close()
+    return world
+
+def main(argv=None):
+    """Fast-forward a recording and check that it ends in the recorded state."""
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless and verify its final state.")
+    parser.add_argument('recording', help="replay file written by game.py --record")
+    parser.add_argument('--level-file', help="platform file to use instead of the recorded path")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.recording)
+    start = time.perf_counter()
+    world = replay(recording, args.level_file)
+    elapsed = time.perf_counter() - start
+    matches = state_digest(world) == recording.final_digest
+    print(f"{len(recording)} ticks of '{recording.level}' (seed {recording.seed}) replayed in {elapsed:.2f} s "
+          f"({len(recording) / max(elapsed, 1e-9):.0f} ticks/s)")
+    print(f"Score {world.score}, won: {world.game_won}, lost: {world.game_lost}")
+    print("Final state matches the recording" if matches else "Final state DIFFERS from the recording")
+    return 0 if matches else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
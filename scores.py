@@ -0,0 +1,335 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import bisect
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+# The snapshot holds every score up to a sequence number; the journal holds the ones after it
+SNAPSHOT_MAGIC = b'PXHS'
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sHHQQI')  # magic, version, reserved, entry count, last sequence number, crc32 of the body
+JOURNAL_SUFFIX = '.journal'
+# A snapshot that fails its checks is renamed to this, so it can still be looked at
+DAMAGED_SUFFIX = '.damaged'
+# Each entry is framed by its length and crc32, so a write torn by a crash is detected and dropped
+ENTRY_FRAME = struct.Struct('<II')
+ENTRY_FIELDS = struct.Struct('<Qqd')         # sequence number, score, unix time; then level and player strings
+# Journal entries written before the writer folds them into a new snapshot
+COMPACT_AFTER = 256
+# Scores kept in each level's ranking
+TOP_N = 10
+
+# Plain-text top-score files from earlier versions, imported into an empty store
+LEGACY_FILES = {'easy': 'high_scores_easy.txt', 'hard': 'high_scores_hard.txt'}
+# Player name given to imported scores, which were not recorded with one
+LEGACY_PLAYER = ''
+
+ScoreEntry = namedtuple('ScoreEntry', 'seq level player score time')
+
+def encode_entry(entry):
+    """Encode an entry as a length- and crc-framed record."""
+    level = entry.level.encode('utf-8')
+    player = entry.player.encode('utf-8')
+    body = (ENTRY_FIELDS.pack(entry.seq, entry.score, entry.time)
+            + struct.pack('<H', len(level)) + level + struct.pack('<H', len(player)) + player)
+    return ENTRY_FRAME.pack(len(body), zlib.crc32(body)) + body
+
+def decode_entries(data, offset=0):
+    """
+    Decode framed entries until the data ends or a frame is incomplete or corrupt.
+
+    Returns:
+    tuple: (list of ScoreEntry, offset just past the last good frame).
+    """
+    entries = []
+    while offset + ENTRY_FRAME.size <= len(data):
+        length, crc = ENTRY_FRAME.unpack_from(data, offset)
+        start = offset + ENTRY_FRAME.size
+        body = data[start:start + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+        seq, score, when = ENTRY_FIELDS.unpack_from(body)
+        at = ENTRY_FIELDS.size
+        (size,) = struct.unpack_from('<H', body, at)
+        level = body[at + 2:at + 2 + size].decode('utf-8')
+        at += 2 + size
+        (size,) = struct.unpack_from('<H', body, at)
+        player = body[at + 2:at + 2 + size].decode('utf-8')
+        entries.append(ScoreEntry(seq, level, player, score, when))
+        offset = start + length
+    return entries, offset
+
+def decode_snapshot(path, data):
+    """
+    Decode a snapshot file's contents.
+
+    Returns:
+    tuple: (list of ScoreEntry, last sequence number), or None if the data is cut short or corrupt.
+    """
+    if len(data) < SNAPSHOT_HEADER.size:
+        return None
+    magic, version, _, count, last_seq, crc = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        return None
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported score file version {version}")
+    if zlib.crc32(data[SNAPSHOT_HEADER.size:]) != crc:
+        return None
+    entries, _ = decode_entries(data, SNAPSHOT_HEADER.size)
+    if len(entries) != count:
+        return None
+    return entries, last_seq
+
+def write_atomically(path, data):
+    """Replace a file's contents so that a crash leaves either the old or the new version."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+def ranking_key(entry):
+    """Sort key for rankings: higher scores first, earlier scores first among equals."""
+    return (-entry.score, entry.seq)
+
+class ScoreStore:
+    def __init__(self, path, top_n=TOP_N, legacy_files=LEGACY_FILES, read_only=False):
+        """
+        Keep every score ever recorded, with per-level rankings, persisted by a background writer.
+
+        add() only updates memory and queues the entry. The writer thread appends it to the
+        journal and fsyncs, and after COMPACT_AFTER entries writes a new snapshot atomically
+        and empties the journal. Loading skips journal entries already in the snapshot and
+        drops a torn final entry, so a crash at any point loses at most the entries still queued.
+        A damaged snapshot is renamed with DAMAGED_SUFFIX and the store rebuilt from the journal.
+
+        Parameters:
+        path (str): The snapshot file; the journal is kept next to it.
+        top_n (int): Scores kept in each level's ranking.
+        legacy_files (dict): Level -> old plain-text score file, imported if the store is new.
+        read_only (bool): Only read the files, for queries: nothing is created, repaired or imported,
+                          no writer is started and add() is refused.
+        """
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.top_n = top_n
+        self.entries = []       # Every score in sequence order; entries[i].seq == i + 1
+        self.by_level = {}      # Level -> entries
+        self.by_player = {}     # (level, player) -> entries
+        self.rankings = {}      # Level -> best top_n entries, sorted by ranking_key
+        self.ranking_keys = {}  # Level -> ranking_key of each ranked entry, for bisection
+        self.journal_entries = 0
+        self.read_only = read_only
+
+        existed, damaged = self.load()
+        self.written_seq = len(self.entries)
+        if read_only:
+            return
+        self.journal = open(self.journal_path, 'ab')
+        if damaged:
+            self.compact()  # Keep the rebuilt scores under their new sequence numbers
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.run, name='score-writer', daemon=True)
+        self.writer.start()
+        if not existed:
+            for level, filename in legacy_files.items():
+                self.import_legacy(level, filename)
+
+    def load(self):
+        """
+        Read the snapshot and journal into memory.
+
+        Returns:
+        tuple: (whether either file existed, whether the snapshot was damaged).
+        """
+        existed = False
+        damaged = False
+        last_seq = 0
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+            existed = True
+        except FileNotFoundError:
+            data = b''
+        if data:
+            snapshot = decode_snapshot(self.path, data)
+            if snapshot is None:
+                damaged = True
+                if self.read_only:
+                    print(f"{self.path}: score file is damaged; showing only the scores in the journal", file=sys.stderr)
+                else:
+                    os.replace(self.path, self.path + DAMAGED_SUFFIX)
+                    print(f"{self.path}: score file is damaged; moved it to {self.path + DAMAGED_SUFFIX} "
+                          f"and rebuilt the scores from the journal", file=sys.stderr)
+            else:
+                entries, last_seq = snapshot
+                for entry in entries:
+                    self.index(entry)
+
+        try:
+            with open(self.journal_path, 'rb') as file:
+                data = file.read()
+            existed = True
+        except FileNotFoundError:
+            data = b''
+        entries, end = decode_entries(data)
+        self.journal_entries = len(entries)
+        for entry in entries:
+            if damaged:
+                # The snapshot's scores are lost; number the journal's after each other from the start
+                self.index(entry._replace(seq=len(self.entries) + 1))
+            # Entries already compacted into the snapshot, if a crash came before the journal was emptied
+            elif entry.seq > last_seq and entry.seq == len(self.entries) + 1:
+                self.index(entry)
+        if end < len(data) and not self.read_only:
+            with open(self.journal_path, 'r+b') as file:
+                file.truncate(end)  # Drop a torn final entry so new ones are not appended after it
+        return existed, damaged
+
+    def index(self, entry):
+        """Add an entry to the history and update its level's ranking."""
+        self.entries.append(entry)
+        self.by_level.setdefault(entry.level, []).append(entry)
+        self.by_player.setdefault((entry.level, entry.player), []).append(entry)
+        ranking = self.rankings.setdefault(entry.level, [])
+        keys = self.ranking_keys.setdefault(entry.level, [])
+        key = ranking_key(entry)
+        if len(ranking) < self.top_n or key < keys[-1]:
+            position = bisect.bisect(keys, key)
+            keys.insert(position, key)
+            ranking.insert(position, entry)
+            if len(ranking) > self.top_n:
+                keys.pop()
+                ranking.pop()
+
+    def add(self, level, score, player, when=None):
+        """
+        Record a score; returns at once and leaves writing it to the background thread.
+
+        Returns:
+        ScoreEntry: The entry as stored.
+        """
+        if self.read_only:
+            raise ValueError(f"{self.path}: score store is open read-only")
+        entry = ScoreEntry(len(self.entries) + 1, level, player, int(score), time.time() if when is None else when)
+        self.index(entry)
+        self.queue.put(entry)
+        return entry
+
+    def import_legacy(self, level, filename):
+        """Add the scores from an old plain-text score file, if it exists."""
+        try:
+            with open(filename, 'r') as file:
+                scores = [int(line) for line in file if line.strip()]
+            when = os.path.getmtime(filename)
+        except FileNotFoundError:
+            return
+        for score in sorted(scores, reverse=True):
+            self.add(level, score, LEGACY_PLAYER, when)
+
+    def top(self, level, count=None):
+        """Return the best scores on a level, best first."""
+        return self.rankings.get(level, [])[:count]
+
+    def history(self, level, player=None):
+        """Return every score on a level, or one player's scores on it, oldest first."""
+        if player is None:
+            return list(self.by_level.get(level, ()))
+        return list(self.by_player.get((level, player), ()))
+
+    def best(self, level, player):
+        """Return a player's best entry on a level, or None."""
+        entries = self.by_player.get((level, player))
+        return min(entries, key=ranking_key) if entries else None
+
+    def run(self):
+        """Writer loop: append queued entries to the journal in batches and compact when it grows."""
+        while True:
+            entry = self.queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            stopping = False
+            while True:
+                try:
+                    entry = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            self.journal.write(b''.join(encode_entry(entry) for entry in batch))
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+            self.written_seq = batch[-1].seq
+            self.journal_entries += len(batch)
+            if self.journal_entries >= COMPACT_AFTER:
+                self.compact()
+            if stopping:
+                break
+
+    def compact(self):
+        """Write every journaled entry into a new snapshot, then empty the journal."""
+        entries = self.entries[:self.written_seq]
+        body = b''.join(encode_entry(entry) for entry in entries)
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, len(entries), self.written_seq, zlib.crc32(body))
+        write_atomically(self.path, header + body)
+        self.journal.truncate(0)
+        self.journal.seek(0)
+        self.journal_entries = 0
+
+    def flush(self):
+        """Wait until every score added so far is on disk."""
+        if self.read_only:
+            return
+        while self.written_seq < len(self.entries) and self.writer.is_alive():
+            time.sleep(0.01)
+
+    def close(self, compact=False):
+        """Write out every queued score and stop the writer, optionally compacting the journal first."""
+        if self.read_only:
+            return
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+        if compact and self.journal_entries:
+            self.compact()
+        self.journal.close()
+
+def main(argv=None):
+    """Print rankings or score history from a store."""
+    parser = argparse.ArgumentParser(description="Show high scores and score history.")
+    parser.add_argument('--file', default='high_scores.db', help="score store (default: high_scores.db)")
+    parser.add_argument('--level', help="only this level")
+    parser.add_argument('--player', help="list this player's scores instead of the rankings")
+    parser.add_argument('--compact', action='store_true', help="fold the journal into the snapshot")
+    args = parser.parse_args(argv)
+
+    # Only compacting writes; a query just reads whatever is there
+    store = ScoreStore(args.file, read_only=not args.compact)
+    levels = [args.level] if args.level else sorted(store.by_level)
+    for level in levels:
+        if args.player is not None:
+            entries = store.history(level, args.player)
+            print(f"{level}: {len(entries)} scores by {args.player or '(unnamed)'}")
+        else:
+            entries = store.top(level)
+            print(f"{level}: best of {len(store.history(level))} scores")
+        for i, entry in enumerate(entries, 1):
+            when = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.time))
+            print(f"  {i:>3}. {entry.score:>6}  {entry.player or '-':<16} {when}")
+    store.close(compact=args.compact)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
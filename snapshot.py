@@ -0,0 +1,220 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import argparse
+import contextlib
+import io
+import struct
+import sys
+import zlib
+from collections import Counter, deque
+import numpy as np
+from generator import ENDLESS_LEVEL, ProceduralWorld
+from replay import Recording, open_world, state_digest
+from world import World, PHYSICS_HZ
+
+SNAPSHOT_MAGIC = b'PXSN'
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, crc32 of the body
+# Character state stored as doubles; a bit mask records which were ints, so they come back as ints
+NUMBER_FIELDS = ('char_x', 'char_y', 'prev_char_x', 'prev_char_y', 'fall_speed', 'jump_velocity', 'platform_velocity')
+# Numbers, int mask, score, is_jumping, is_on_platform, game_won, game_lost, generation, current platform slot, tick,
+# then the lengths of the array sections that follow
+STATE_FORMAT = struct.Struct('<7dHq????qqq6I')
+# Seconds of play the rewind ring holds, at one snapshot per tick
+REWIND_SECONDS = 5
+# Ticks between the snapshots checked by the command line
+CHECK_EVERY = 500
+
+def capture(world):
+    """
+    Pack everything that decides how a world plays out from here on into one bytes object.
+
+    Platforms are stored as the level record in each slot: their positions follow from the
+    records and the tick, so they are recomputed on restore. The spatial grid is rebuilt the
+    same way. Two worlds in the same state give identical snapshots.
+
+    Parameters:
+    world (World): The world to capture.
+
+    Returns:
+    bytes: A header with a crc32 checksum, then the fixed-layout state and its arrays.
+    """
+    numbers = [getattr(world, name) for name in NUMBER_FIELDS]
+    int_mask = sum(1 << i for i, value in enumerate(numbers) if isinstance(value, int))
+    platforms = world.platforms
+    collected = np.array(sorted((chunk, coin) for chunk, ids in world.collected.items() for coin in ids), dtype=np.int64)
+    sections = [
+        np.array(world.loaded_chunks, dtype=np.int64),
+        platforms.record[:platforms.count],
+        np.array(platforms.free, dtype=np.int64),
+    ]
+    for pool in (world.obstacles, world.coins):
+        sections += [pool.position[:pool.count], pool.ids[:pool.count], pool.chunks[:pool.count]]
+    body = b''.join([STATE_FORMAT.pack(
+        *numbers, int_mask, world.score, world.is_jumping, world.is_on_platform, world.game_won, world.game_lost,
+        world.generation, -1 if world.current_platform is None else world.current_platform, world.tick,
+        len(world.loaded_chunks), platforms.count, len(platforms.free), world.obstacles.count, world.coins.count,
+        len(collected))] + [section.tobytes() for section in sections] + [collected.tobytes()])
+    return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, zlib.crc32(body)) + body
+
+def checksum(snapshot):
+    """Return a snapshot's crc32, for comparing the state of two worlds cheaply."""
+    return SNAPSHOT_HEADER.unpack_from(snapshot)[3]
+
+def restore(world, snapshot):
+    """
+    Put a world back into the state a snapshot was captured in, without regenerating anything.
+
+    The world must be on the same level as when the snapshot was taken.
+
+    Parameters:
+    world (World): The world to restore.
+    snapshot (bytes): A snapshot from capture().
+    """
+    if len(snapshot) < SNAPSHOT_HEADER.size + STATE_FORMAT.size:
+        raise ValueError("not a snapshot")
+    magic, version, _, crc = SNAPSHOT_HEADER.unpack_from(snapshot)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not a snapshot")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"unsupported snapshot format version {version}")
+    body = memoryview(snapshot)[SNAPSHOT_HEADER.size:]
+    if zlib.crc32(body) != crc:
+        raise ValueError("snapshot is corrupt")
+
+    state = STATE_FORMAT.unpack_from(body)
+    count = len(NUMBER_FIELDS)
+    numbers, int_mask = state[:count], state[count]
+    for i, (name, value) in enumerate(zip(NUMBER_FIELDS, numbers)):
+        setattr(world, name, int(value) if int_mask >> i & 1 else value)
+    (world.score, world.is_jumping, world.is_on_platform, world.game_won, world.game_lost,
+     world.generation, current_platform, tick) = state[count + 1:count + 9]
+    world.current_platform = None if current_platform == -1 else current_platform
+    world.tick = tick
+    chunk_count, slot_count, free_count, obstacle_count, coin_count, collected_count = state[count + 9:]
+
+    offset = STATE_FORMAT.size
+    def read(dtype, length, columns=None):
+        """Read the next array section."""
+        nonlocal offset
+        dtype = np.dtype(dtype)
+        size = length * (columns or 1)
+        array = np.frombuffer(body, dtype=dtype, count=size, offset=offset)
+        offset += size * dtype.itemsize
+        return array.reshape(-1, columns) if columns else array
+
+    loaded_chunks = read(np.int64, chunk_count).tolist()
+    slot_records = read(np.int64, slot_count)
+    free = read(np.int64, free_count).tolist()
+    for pool, length in ((world.obstacles, obstacle_count), (world.coins, coin_count)):
+        pool.replace(read(np.float64, length, 2), read(np.int32, length), read(np.int32, length))
+    collected = {}
+    for chunk, coin in read(np.int64, collected_count, 2).tolist():
+        collected.setdefault(chunk, set()).add(coin)
+    world.collected = collected
+
+    platforms = world.platforms
+    if (loaded_chunks == world.loaded_chunks and free == platforms.free
+            and np.array_equal(slot_records, platforms.record[:platforms.count])):
+        # The same platforms in the same slots: only moving ones need placing at the restored tick
+        world.update_platform_positions()
+        return
+    restore_platforms(world, loaded_chunks, slot_records, free)
+
+def restore_platforms(world, loaded_chunks, slot_records, free):
+    """Reload the platforms of a snapshot into their slots and rebuild the grid and chunk bookkeeping."""
+    world.fetch_chunks(loaded_chunks)  # A world restored from scratch may not have generated them yet
+    slots = np.flatnonzero(slot_records >= 0)
+    indices = slot_records[slots]
+    world.platforms.rebuild(world.level_records[indices], slots, len(slot_records), free, world.tick)
+    world.platforms.record[slots] = indices
+    uses = Counter()
+    for chunk in loaded_chunks:
+        uses.update(world.chunks.records_in(chunk).tolist())
+    world.platform_slots = {index: [slot, uses[index]] for index, slot in zip(indices.tolist(), slots.tolist())}
+    world.loaded_chunks = loaded_chunks
+    grid = world.platform_grid
+    grid.clear()
+    position, size = world.platforms.position, world.platforms.size
+    for slot in slots.tolist():
+        (x, y), (w, h) = position[slot].tolist(), size[slot].tolist()
+        grid.insert(slot, x, y, w, h)
+
+class SnapshotRing:
+    def __init__(self, capacity=REWIND_SECONDS * PHYSICS_HZ):
+        """Keep the most recent `capacity` snapshots of a world, for rewinding it a tick at a time."""
+        self.snapshots = deque(maxlen=capacity)
+
+    def __len__(self):
+        """Return the number of snapshots held."""
+        return len(self.snapshots)
+
+    def push(self, world):
+        """Capture the world, dropping the oldest snapshot if the ring is full."""
+        self.snapshots.append(capture(world))
+
+    def rewind(self, world):
+        """Restore the newest snapshot and drop it; return False, leaving the world alone, if none is left."""
+        if not self.snapshots:
+            return False
+        restore(world, self.snapshots.pop())
+        return True
+
+    def clear(self):
+        """Drop every snapshot."""
+        self.snapshots.clear()
+
+def check_recording(recording, every=CHECK_EVERY, level_file=None):
+    """
+    Check that snapshots restore exactly, by replaying a recording and restoring into fresh worlds.
+
+    A snapshot is captured every `every` ticks. Each is restored into a newly created world,
+    which plays the rest of the recorded inputs and must end in the recorded final state.
+
+    Parameters:
+    recording (replay.Recording): The session to check.
+    every (int): Ticks between snapshots.
+    level_file (str): Optional path to load instead of the recorded one.
+
+    Returns:
+    tuple: (number of snapshots checked, list of the ticks whose snapshot did not reach the recorded state).
+    """
+    world_class = ProceduralWorld if recording.level == ENDLESS_LEVEL else World
+    with contextlib.redirect_stdout(io.StringIO()):  # Score and game over messages
+        world = open_world(recording, level_file, world_class)
+        snapshots = []
+        for tick, keys in enumerate(recording.inputs):
+            if tick % every == 0:
+                snapshots.append((tick, capture(world)))
+            world.step(keys)
+        world.close()
+        failed = []
+        for tick, snapshot in snapshots:
+            fresh = open_world(recording, level_file, world_class)
+            restore(fresh, snapshot)
+            fresh.run(recording.inputs[tick:], stop_when_done=False)
+            fresh.close()
+            if state_digest(fresh) != recording.final_digest:
+                failed.append(tick)
+    return len(snapshots), failed
+
+def main(argv=None):
+    """Check snapshot round trips over a recorded session."""
+    parser = argparse.ArgumentParser(description="Check that snapshots of a recorded session restore into fresh worlds exactly.")
+    parser.add_argument('recording', help="replay file written by game.py --record")
+    parser.add_argument('--every', type=int, default=CHECK_EVERY, help=f"ticks between snapshots (default: {CHECK_EVERY})")
+    parser.add_argument('--level-file', help="platform file to use instead of the recorded path")
+    args = parser.parse_args(argv)
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+
+    recording = Recording.load(args.recording)
+    checked, failed = check_recording(recording, args.every, args.level_file)
+    print(f"{checked} snapshots of '{recording.level}' restored into fresh worlds; {len(failed)} diverged")
+    for tick in failed:
+        print(f"  snapshot at tick {tick} did not reach the recorded final state")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+
+# Default cell size for the platform grid, a little larger than a typical platform
+PLATFORM_CELL_SIZE = 128
+
+def cell_key(cx, cy):
+    """Pack a cell coordinate (scalars or NumPy arrays) into a single integer."""
+    return (cx * (1 << 32) + cy + (1 << 31))
+
+class SpatialHash:
+    def __init__(self, cell_size=PLATFORM_CELL_SIZE):
+        """Initialize an empty uniform grid with square cells of `cell_size` pixels."""
+        self.cell_size = cell_size
+        self.cells = {}    # (cell_x, cell_y) -> set of keys
+        self.bounds = {}   # key -> (cell_x0, cell_y0, cell_x1, cell_y1)
+
+    def cell_range(self, x, y, w, h):
+        """Return the inclusive range of cells covered by a rectangle."""
+        size = self.cell_size
+        return (int(x // size), int(y // size), int((x + w) // size), int((y + h) // size))
+
+    def insert(self, key, x, y, w, h):
+        """Add a rectangle to every cell it touches."""
+        bounds = self.cell_range(x, y, w, h)
+        self.bounds[key] = bounds
+        cx0, cy0, cx1, cy1 = bounds
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(key)
+
+    def remove(self, key):
+        """Remove a rectangle from the grid."""
+        cx0, cy0, cx1, cy1 = self.bounds.pop(key)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells[(cx, cy)]
+                cell.discard(key)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def move(self, key, x, y, w, h):
+        """Update a rectangle's position, touching the grid only if it changed cells."""
+        if self.bounds.get(key) == self.cell_range(x, y, w, h):
+            return
+        self.remove(key)
+        self.insert(key, x, y, w, h)
+
+    def query(self, x, y, w, h):
+        """Return the sorted keys of rectangles sharing a cell with the query rectangle."""
+        cx0, cy0, cx1, cy1 = self.cell_range(x, y, w, h)
+        found = set()
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return sorted(found)
+
+    def clear(self):
+        """Remove every rectangle from the grid."""
+        self.cells.clear()
+        self.bounds.clear()
@@ -0,0 +1,13 @@
+import numpy as np
+from levels import PLATFORM_RECORD
+from reachability import ReachabilityGraph, main
+
+def test_empty_level_is_unsolvable(tmp_path):
+    graph = ReachabilityGraph(np.zeros(0, dtype=PLATFORM_RECORD))
+    assert graph.route() is None
+    assert not graph.solvable()
+    assert len(graph.reachable()) == 0
+
+    level_file = tmp_path / "empty.txt"
+    level_file.write_text("")
+    assert main([str(level_file)]) == 1
@@ -0,0 +1,46 @@
+import os
+from scores import ScoreStore, DAMAGED_SUFFIX, JOURNAL_SUFFIX
+
+def test_damaged_snapshot_is_set_aside_and_rebuilt_from_journal(tmp_path):
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path, legacy_files={})
+    for score in (30, 10, 20):
+        store.add('easy', score, 'ann', when=0)
+    store.close(compact=True)
+    store = ScoreStore(path, legacy_files={})
+    store.add('easy', 50, 'bob', when=0)
+    store.add('hard', 40, 'bob', when=0)
+    store.close()
+
+    with open(path, 'r+b') as file:
+        file.truncate(os.path.getsize(path) - 3)
+    store = ScoreStore(path, legacy_files={})
+    assert os.path.exists(path + DAMAGED_SUFFIX)
+    assert [(entry.seq, entry.score) for entry in store.entries] == [(1, 50), (2, 40)]
+    store.add('easy', 60, 'ann', when=0)
+    store.close()
+
+    store = ScoreStore(path, legacy_files={})
+    assert [entry.score for entry in store.top('easy')] == [60, 50]
+    assert [entry.seq for entry in store.entries] == [1, 2, 3]
+    store.close()
+
+def test_read_only_store_writes_nothing(tmp_path):
+    path = str(tmp_path / "scores.db")
+    legacy = tmp_path / "legacy.txt"
+    legacy.write_text("10\n")
+    store = ScoreStore(path, legacy_files={'easy': str(legacy)}, read_only=True)
+    assert store.entries == []
+    store.close()
+    assert sorted(os.listdir(tmp_path)) == ["legacy.txt"]
+
+    store = ScoreStore(path, legacy_files={})
+    store.add('easy', 10, 'ann', when=0)
+    store.close()
+    with open(path + JOURNAL_SUFFIX, 'ab') as file:
+        file.write(b'torn')
+    store = ScoreStore(path, read_only=True)
+    assert [entry.score for entry in store.top('easy')] == [10]
+    store.close()
+    with open(path + JOURNAL_SUFFIX, 'rb') as file:
+        assert file.read().endswith(b'torn')
@@ -0,0 +1,38 @@
+import random
+import numpy as np
+from world import World, WIDTH, HEIGHT
+
+def write_moving_level(path, count=300, seed=7):
+    """Write a level of `count` platforms over several screens, every other one moving."""
+    rng = random.Random(seed)
+    lines = ["0,530,200,20,0.5,0.5,0.5,0,1,10"]
+    for i in range(1, count):
+        x = rng.randrange(0, 4 * WIDTH)
+        y = rng.randrange(150, HEIGHT - 150)
+        lines.append(f"{x},{y},{rng.randrange(100, 200)},20,0.5,0.5,0.5,{i % 2},{rng.choice((1, -1))},{rng.randrange(10, 100)}")
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+def chunk_layout(world, chunk):
+    """Return the obstacle positions and the coin ids and positions of one loaded chunk."""
+    layout = []
+    for pool in (world.obstacles, world.coins):
+        mine = np.flatnonzero(pool.chunks[:pool.count] == chunk)
+        order = mine[np.argsort(pool.ids[mine], kind='stable')]
+        layout.append((pool.ids[order].tolist(), pool.position[order].tolist()))
+    return layout
+
+def test_chunk_layout_does_not_depend_on_load_tick(tmp_path):
+    level_file = write_moving_level(tmp_path / "moving.txt")
+    for seed in range(5):
+        layouts = []
+        for tick in (0, 37, 1234):
+            world = World('easy', seed=seed, level_file=level_file)
+            chunk = world.loaded_chunks[-1]
+            world.unload_chunk(chunk)
+            world.tick = tick
+            world.update_platform_positions()
+            world.load_chunk(chunk)
+            layouts.append(chunk_layout(world, chunk))
+        assert layouts[1] == layouts[0]
+        assert layouts[2] == layouts[0]
@@ -0,0 +1,411 @@
+# 1. Anika Tabassum (Roll: 61)
+# 2. Bholanath Das Niloy (Roll: 22)
+# Please Read the README.md/README.pdf file for more details
+import random
+import numpy as np
+from chunks import LevelChunks
+from levels import load_level
+from placement import scatter
+from platforms import PlatformStore
+from pools import CirclePool
+from spatial import SpatialHash
+
+# Constants for window dimensions
+WIDTH, HEIGHT = 1920, 1080
+TITLE_BAR_HEIGHT = 50
+
+# Input bits used by the simulation, independent of any windowing library
+KEY_LEFT = 1
+KEY_RIGHT = 2
+KEY_UP = 4
+KEY_RESTART = 8  # Restart the level before the tick
+
+# Platform file loaded for each difficulty level; any other name gets the hard level
+LEVEL_FILES = {'easy': 'platforms_level1.txt', 'hard': 'platforms_level2.txt'}
+
+# Minimum distance between the centres of generated coins and obstacles
+OBJECT_SPACING = 30
+# Obstacles and coins generated per level chunk
+OBSTACLES_PER_CHUNK = 5
+COINS_PER_CHUNK = 10
+# Objects are never generated left of this x, so the spawn point stays clear
+SPAWN_CLEARANCE = 100
+# Radii of obstacles and coins
+OBSTACLE_RADIUS = 20
+COIN_RADIUS = 10
+
+# Simulation tick rate; movement constants below are tuned per tick at this rate
+PHYSICS_HZ = 60
+PHYSICS_DT = 1.0 / PHYSICS_HZ
+
+# Character size and movement, in pixels and pixels per tick
+CHAR_RADIUS = 15
+MOVE_SPEED = 2
+JUMP_VELOCITY = 5
+GRAVITY = 0.1
+MAX_FALL_SPEED = 10
+# Where the character starts each attempt
+SPAWN_X = 30
+SPAWN_Y = (HEIGHT - TITLE_BAR_HEIGHT) // 2 - CHAR_RADIUS
+
+class World:
+    def __init__(self, level, seed=None, level_file=None):
+        """Initialize the simulation for the specified difficulty level, seeding object placement with `seed`.
+
+        `level_file` loads a different platform file under the same level name.
+        """
+        self.level = level
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.generation = 0  # Bumped on every reset so each attempt gets a fresh layout
+        self.tick = 0        # Ticks simulated; moving platforms are a function of it and keep going across resets
+        self.char_radius = CHAR_RADIUS
+        self.char_x = SPAWN_X
+        self.char_y = SPAWN_Y
+        self.prev_char_x, self.prev_char_y = self.char_x, self.char_y
+        self.move_speed = MOVE_SPEED
+        self.is_jumping = False
+        self.jump_velocity = JUMP_VELOCITY
+        self.gravity = GRAVITY
+        self.fall_speed = 0
+        self.max_fall_speed = MAX_FALL_SPEED
+        self.is_on_platform = False
+        self.current_platform = None  # Slot in self.platforms
+        self.platform_velocity = 0
+        self.key_state = {KEY_LEFT: False, KEY_RIGHT: False, KEY_UP: False}
+        self.score = 0
+        self.game_won = False
+        self.game_lost = False
+        self.on_win = None  # Called with (score, level) when the goal is reached
+
+        # Load platforms based on difficulty level; only the chunks around the character are kept live
+        self.level_file = level_file if level_file is not None else LEVEL_FILES.get(level, LEVEL_FILES['hard'])
+        self.level_records = self.load_platforms(self.level_file)
+        self.chunks = self.index_level(self.level_records)
+        self.level_bounds = self.chunks.bounds
+        self.goal_record = len(self.level_records) - 1  # The last platform in the file is the goal
+        self.platforms = PlatformStore()
+        self.platform_grid = SpatialHash()
+        self.platform_slots = {}  # Level record index -> [slot, number of loaded chunks using it]
+        self.loaded_chunks = []
+        self.collected = {}       # Chunk -> ids of coins already collected there
+
+        self.obstacles = CirclePool([], OBSTACLE_RADIUS, (1.0, 0.0, 0.0))
+        self.coins = CirclePool([], COIN_RADIUS, (1.0, 1.0, 0.0))
+        self.stream_chunks()
+
+    def load_platforms(self, filename):
+        """Load platform records from a file."""
+        return load_level(filename)
+
+    def index_level(self, records):
+        """Split the level's platform records into the chunks streamed around the character."""
+        return LevelChunks(records, WIDTH, HEIGHT)
+
+    def close(self):
+        """Release anything the world holds outside the simulation; plain worlds hold nothing."""
+
+    def fetch_chunks(self, chunks):
+        """Make sure level_records holds the records of every given chunk; a level file already holds them all."""
+
+    def stream_chunks(self):
+        """Load the chunks around the character and evict the ones it has left behind."""
+        wanted = self.chunks.window(self.char_x)
+        if list(wanted) == self.loaded_chunks:
+            return
+        for chunk in [chunk for chunk in self.loaded_chunks if chunk not in wanted]:
+            self.unload_chunk(chunk)
+        for chunk in wanted:
+            if chunk not in self.loaded_chunks:
+                self.load_chunk(chunk)
+        self.loaded_chunks = list(wanted)
+
+    def load_chunk(self, chunk):
+        """Add a chunk's platforms to the store and grid, then generate its obstacles and coins."""
+        indices = self.chunks.records_in(chunk)
+        new = [index for index in indices.tolist() if index not in self.platform_slots]
+        for index in indices.tolist():
+            if index in self.platform_slots:
+                self.platform_slots[index][1] += 1
+        if new:
+            records = self.level_records[new]
+            slots = self.platforms.add(records, self.tick, new)
+            for index, slot, x, y, w, h in zip(new, slots.tolist(), records['x'].tolist(), records['y'].tolist(), records['w'].tolist(), records['h'].tolist()):
+                self.platform_slots[index] = [slot, 1]
+                self.platform_grid.insert(slot, x, y, w, h)
+        self.generate_chunk_objects(chunk)
+
+    def unload_chunk(self, chunk):
+        """Drop a chunk's obstacles and coins, and any platforms no other loaded chunk uses."""
+        freed = []
+        for index in self.chunks.records_in(chunk).tolist():
+            entry = self.platform_slots[index]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self.platform_slots[index]
+                self.platform_grid.remove(entry[0])
+                freed.append(entry[0])
+        if freed:
+            self.platforms.remove(freed)
+        self.obstacles.drop_chunk(chunk)
+        self.coins.drop_chunk(chunk)
+
+    def update_platform_positions(self):
+        """Move the moving platforms to where they are at the current tick."""
+        moving = self.platforms.moving
+        if not len(moving):
+            return
+        old_x = self.platforms.position[moving, 0]  # Fancy indexing copies
+        moved = self.platforms.update(self.tick)
+
+        # Re-bucket only the platforms whose move carried an edge across a grid cell
+        cell = self.platform_grid.cell_size
+        x = self.platforms.position[moved, 0]
+        w = self.platforms.size[moved, 0]
+        crossed = (x // cell != old_x // cell) | ((x + w) // cell != (old_x + w) // cell)
+        for index in moved[crossed].tolist():
+            (px, py), (pw, ph) = self.platforms.position[index].tolist(), self.platforms.size[index].tolist()
+            self.platform_grid.move(index, px, py, pw, ph)
+
+    def platform_ranges(self, chunk):
+        """
+        Bound each of a chunk's platforms over its whole motion, from the level records.
+
+        Placement tests against these instead of live positions, so a chunk's layout does not
+        depend on the tick it loads at.
+
+        Returns:
+        tuple: (x0, y0, x1, y1) arrays, one entry per platform touching the chunk.
+        """
+        records = self.level_records[self.chunks.records_in(chunk)]
+        x = np.asarray(records['x'], dtype=np.int64)
+        y = np.asarray(records['y'], dtype=np.int64)
+        reach = np.where(records['move'] != 0, np.abs(np.asarray(records['move_distance'], dtype=np.int64)) + 1, 0)
+        return x - reach, y, x + records['w'] + reach, y + records['h']
+
+    def platforms_block(self, xs, ys, size, ranges):
+        """Flag points within `size` of any platform range from platform_ranges."""
+        x0, y0, x1, y1 = ranges
+        return ((xs[:, None] >= x0 - size) & (xs[:, None] <= x1 + size)
+                & (ys[:, None] >= y0 - size) & (ys[:, None] <= y1 + size)).any(axis=1)
+
+    def visible_entities(self, x, y, w, h):
+        """
+        Find what intersects a view rectangle, for culling.
+
+        Returns:
+        tuple: Slots of the visible platforms, obstacles and coins.
+        """
+        candidates = np.array(self.platform_grid.query(x, y, w, h), dtype=np.int64)
+        px, py = self.platforms.position[candidates, 0], self.platforms.position[candidates, 1]
+        pw, ph = self.platforms.size[candidates, 0], self.platforms.size[candidates, 1]
+        platforms = candidates[(px + pw >= x) & (px <= x + w) & (py + ph >= y) & (py <= y + h)]
+        return platforms, self.obstacles.in_rect(x, y, w, h), self.coins.in_rect(x, y, w, h)
+
+    def generate_obstacles_and_coins(self):
+        """Generate obstacles and coins for every loaded chunk."""
+        self.obstacles.clear()
+        self.coins.clear()
+        for chunk in self.loaded_chunks:
+            self.generate_chunk_objects(chunk)
+
+    def generate_chunk_objects(self, chunk):
+        """Generate a chunk's obstacles and coins; the same seed, reset count and chunk always give the same layout."""
+        rng = random.Random(f"{self.seed}:{self.generation}:{chunk}")
+        ranges = self.platform_ranges(chunk)
+        obstacles = self.generate_objects(rng, chunk, OBSTACLES_PER_CHUNK, self.obstacles.size, [], ranges)
+        coins = self.generate_objects(rng, chunk, COINS_PER_CHUNK, self.coins.size, obstacles, ranges)
+        self.obstacles.add(obstacles, chunk)
+        collected = self.collected.get(chunk, ())
+        ids = [i for i in range(len(coins)) if i not in collected]
+        self.coins.add(coins[ids], chunk, ids)
+
+    def generate_objects(self, rng, chunk, count, size, others, ranges):
+        """Generate objects (obstacles or coins) in a chunk, avoiding overlap and the platform ranges from platform_ranges."""
+        left, right = self.chunks.x_range(chunk)
+        # Keep half the spacing clear of edges shared with another chunk so neighbours never crowd each other
+        x0 = max(left + (OBJECT_SPACING // 2 if chunk > self.chunks.first else 0), SPAWN_CLEARANCE)
+        x1 = right - size - (OBJECT_SPACING // 2 if chunk < self.chunks.last else 0)
+        bounds = (x0, self.level_bounds[1], x1, self.level_bounds[3] - size - 100)
+        return scatter(rng, count, OBJECT_SPACING, bounds, avoid=others,
+                       rejects=lambda xs, ys: self.platforms_block(xs, ys, size, ranges))
+
+    def reset_game(self):
+        """Reset the game to its initial state."""
+        self.char_x = SPAWN_X
+        self.char_y = SPAWN_Y
+        self.prev_char_x, self.prev_char_y = self.char_x, self.char_y
+        self.is_jumping = False
+        self.jump_velocity = JUMP_VELOCITY
+        self.fall_speed = 0
+        self.is_on_platform = False
+        self.current_platform = None
+        self.platform_velocity = 0
+        self.score = 0
+        self.game_won = False
+        self.game_lost = False
+        self.generation += 1
+        self.collected.clear()
+        self.stream_chunks()
+        self.generate_obstacles_and_coins()
+
+    def game_over(self):
+        """Handle game over condition."""
+        if self.game_won or self.game_lost:
+            return
+        print("Game Over")
+        self.game_lost = True
+
+    def you_win(self):
+        """Handle winning the game."""
+        if self.game_won or self.game_lost:
+            return
+        print("You Win!!")
+        self.game_won = True
+        if self.on_win:
+            self.on_win(self.score, self.level)
+
+    def jump(self):
+        """Start a jump if the character is standing on a platform."""
+        if self.is_on_platform and not self.is_jumping:
+            self.is_jumping = True
+            self.jump_velocity = JUMP_VELOCITY
+            self.is_on_platform = False
+            self.platform_velocity = int(self.platforms.velocity[self.current_platform]) if self.current_platform is not None else 0
+            self.current_platform = None
+
+    def check_collision_and_update_position(self):
+        """Check for collisions and update character's position."""
+        if self.game_lost or self.game_won:
+            return
+
+        self.is_on_platform = False
+
+        circle_bottom = self.char_y + self.char_radius
+        circle_top = self.char_y - self.char_radius
+        circle_left = self.char_x - self.char_radius
+        circle_right = self.char_x + self.char_radius
+
+        goal = self.platform_slots.get(self.goal_record)
+        if goal is not None:
+            goal_x, goal_y = self.platforms.position[goal[0]].tolist()
+            goal_w, goal_h = self.platforms.size[goal[0]].tolist()
+            if goal_x <= circle_right <= goal_x + goal_w and (goal_y <= circle_bottom <= goal_y + goal_h or goal_y <= circle_top <= goal_y + goal_h):
+                self.you_win()
+
+        # Only platforms sharing a grid cell with the character's bounding box can touch it.
+        # Slots are reused as chunks stream, so candidates are taken in level file order,
+        # which makes the first hit match a full scan of the level
+        nearby = self.platform_grid.query(circle_left, circle_top, 2 * self.char_radius, 2 * self.char_radius)
+        record = self.platforms.record
+        nearby.sort(key=lambda slot: record[slot])
+        for index in nearby:
+            px, py = self.platforms.position[index].tolist()
+            pw, ph = self.platforms.size[index].tolist()
+
+            platform_top = py
+            platform_bottom = py + ph
+            platform_left = px
+            platform_right = px + pw
+
+            if platform_left < self.char_x < platform_right:
+                if platform_top < circle_top < platform_bottom:
+                    self.char_y = platform_bottom + self.char_radius
+                    self.fall_speed = 0
+                    self.jump_velocity = 0
+                    break
+
+                if platform_top < circle_bottom < platform_bottom:
+                    self.char_y = platform_top - self.char_radius
+                    self.is_on_platform = True
+                    self.current_platform = index
+                    self.fall_speed = 0
+                    self.jump_velocity = 0
+                    break
+
+            if platform_top < self.char_y < platform_bottom:
+                if platform_left < circle_left < platform_right:
+                    self.char_x = platform_right + self.char_radius
+                    break
+                if platform_left < circle_right < platform_right:
+                    self.char_x = platform_left - self.char_radius
+                    break
+
+        if len(self.obstacles.hits(self.char_x, self.char_y, self.char_radius)):
+            self.game_over()
+            return
+
+        collected = self.coins.hits(self.char_x, self.char_y, self.char_radius)
+        if len(collected):
+            for chunk, coin_id in zip(self.coins.chunks[collected].tolist(), self.coins.ids[collected].tolist()):
+                self.collected.setdefault(chunk, set()).add(coin_id)
+            self.coins.retire(collected)
+            for _ in collected:
+                self.score += 1
+                print(f"Score: {self.score}")
+
+    def apply_physics(self):
+        """Apply game physics including movement, jumping, and gravity."""
+        self.tick += 1
+        self.prev_char_x, self.prev_char_y = self.char_x, self.char_y
+
+        if self.key_state[KEY_LEFT]:
+            self.char_x -= self.move_speed
+        if self.key_state[KEY_RIGHT]:
+            self.char_x += self.move_speed
+
+        if self.key_state[KEY_UP]:
+            self.jump()
+
+        if self.is_jumping:
+            self.char_y -= self.jump_velocity
+            self.jump_velocity -= self.gravity
+            if self.jump_velocity <= 0:
+                self.is_jumping = False
+                self.fall_speed = 0
+        else:
+            if not self.is_on_platform:
+                self.fall_speed += self.gravity
+                if self.fall_speed > self.max_fall_speed:
+                    self.fall_speed = self.max_fall_speed
+                self.char_y += self.fall_speed
+
+        if self.is_on_platform and self.current_platform is not None:
+            self.char_x += 2 * int(self.platforms.velocity[self.current_platform])
+
+        self.check_collision_and_update_position()
+        self.update_platform_positions()
+        self.stream_chunks()
+
+        if self.char_y - self.char_radius > self.level_bounds[3]:
+            self.game_over()
+
+    def step(self, keys=0):
+        """Advance the simulation by one tick with the given KEY_* bitmask held."""
+        if keys & KEY_RESTART:
+            self.reset_game()
+        for key in self.key_state:
+            self.key_state[key] = bool(keys & key)
+        self.apply_physics()
+
+    def run(self, inputs, stop_when_done=True):
+        """Step once per bitmask in `inputs` and return the resulting state."""
+        for keys in inputs:
+            if stop_when_done and (self.game_won or self.game_lost):
+                break
+            self.step(keys)
+        return self.get_state()
+
+    def get_state(self):
+        """Return a plain snapshot of the character and score state."""
+        return {
+            'char_x': self.char_x,
+            'char_y': self.char_y,
+            'is_jumping': self.is_jumping,
+            'is_on_platform': self.is_on_platform,
+            'fall_speed': self.fall_speed,
+            'jump_velocity': self.jump_velocity,
+            'score': self.score,
+            'coins_left': len(self.coins),
+            'game_won': self.game_won,
+            'game_lost': self.game_lost,
+        }